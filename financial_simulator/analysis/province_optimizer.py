@@ -1,27 +1,81 @@
 # financial_simulator/analysis/province_optimizer.py
 
-from financial_simulator.core.engine import ProjectionEngine
+from financial_simulator.core.batch_engine import BatchProjectionEngine
+from financial_simulator.core.tax.province_tensor import ProvinceTaxTensor, default_province_tensor
 from financial_simulator.analysis.scoring import FinancialScorer
 from financial_simulator.core.inputs import SimulationInputs
+from financial_simulator.data.tax_store import load_tax_year
+from financial_simulator.data.province_model import compile_provinces
+from financial_simulator.risk.monte_carlo import compare_scenarios
 
 
 class ProvinceOptimizer:
 
-    def __init__(self, base_inputs: SimulationInputs, provinces_data: dict):
+    def __init__(
+        self,
+        base_inputs: SimulationInputs,
+        provinces_data: dict,
+        after_tax: bool = False,
+        monte_carlo_runs: int = 0,
+        seed: int | None = None,
+    ):
         self.base_inputs = base_inputs
         self.provinces_data = provinces_data
 
+        # rank on net income and sales tax of each province instead of gross cashflow
+        self.after_tax = after_tax
+
+        # success rate per province, every province on the same draws
+        self.monte_carlo_runs = monte_carlo_runs
+        self.seed = seed
+
     # =============================
     # MAIN ENTRY
     # =============================
     def find_best_provinces(self):
 
+        provinces = list(self.provinces_data.items())
+
+        inputs_list = [
+            self._build_province_inputs(province_name, province_data)
+            for province_name, province_data in provinces
+        ]
+
         results = []
 
-        for province_name, province_data in self.provinces_data.items():
+        if inputs_list:
+
+            taxes = self._evaluate_taxes(provinces) if self.after_tax else None
+
+            cashflows = {}
+            if taxes:
+                cashflows = {
+                    "monthly_income": taxes["net_income"],
+                    "monthly_adjustment": -taxes["sales_tax"],
+                }
+
+            # all provinces projected in one batch
+            batch = BatchProjectionEngine(inputs_list).simulate(force=True, **cashflows)
 
-            scenario = self._simulate_province(province_name, province_data)
-            results.append(scenario)
+            risks = []
+            if self.monte_carlo_runs:
+                risks = compare_scenarios(inputs_list, runs=self.monte_carlo_runs, seed=self.seed)
+
+            for index, (province_name, _) in enumerate(provinces):
+                summary = self._summarize_province(
+                    province_name,
+                    inputs_list[index],
+                    batch.to_projection(index)
+                )
+
+                if taxes:
+                    summary["tax_rate"] = float(taxes["effective_rate"][index])
+                    summary["sales_tax"] = float(taxes["sales_tax"][index])
+
+                if risks:
+                    summary["success_rate"] = risks[index].success_rate
+
+                results.append(summary)
 
         # Sort by best score
         results.sort(key=lambda x: x["score"], reverse=True)
@@ -32,9 +86,36 @@ class ProvinceOptimizer:
         }
 
     # =============================
-    # SINGLE PROVINCE SIMULATION
+    # TAXES (ALL PROVINCES AT ONCE)
     # =============================
-    def _simulate_province(self, province_name, province_data):
+    def _evaluate_taxes(self, provinces):
+
+        tax_year = self.base_inputs.context.tax_year
+        provinces_data, payroll_data = load_tax_year(tax_year)
+
+        if self.provinces_data is provinces_data:
+            tensor = default_province_tensor(tax_year)
+        else:
+            tensor = ProvinceTaxTensor(compile_provinces(self.provinces_data, payroll_data).values())
+
+        evaluation = tensor.evaluate(
+            self.base_inputs.profile.monthly_income,
+            period="monthly",
+            expenses=self.base_inputs.profile.expenses
+        )
+
+        columns = [tensor.index(province_name) for province_name, _ in provinces]
+
+        return {
+            "net_income": evaluation["net_income"][columns],
+            "effective_rate": evaluation["effective_rate"][columns],
+            "sales_tax": evaluation["sales_tax"][columns],
+        }
+
+    # =============================
+    # SINGLE PROVINCE INPUTS
+    # =============================
+    def _build_province_inputs(self, province_name, province_data):
 
         # Clone inputs with new province context
         inputs = SimulationInputs(
@@ -51,9 +132,12 @@ class ProvinceOptimizer:
         inputs.normalize()
         inputs.validate()
 
-        # Run simulation
-        engine = ProjectionEngine(inputs)
-        result = engine.simulate(force=True)
+        return inputs
+
+    # =============================
+    # SINGLE PROVINCE SUMMARY
+    # =============================
+    def _summarize_province(self, province_name, inputs, result):
 
         # Score
         scorer = FinancialScorer(inputs)
@@ -88,5 +172,6 @@ class ProvinceOptimizer:
 
         return self.base_inputs.context.__class__(
             province=province_name,
-            province_data=province_data
+            province_data=province_data,
+            tax_year=self.base_inputs.context.tax_year
         )
\ No newline at end of file
@@ -1,15 +1,16 @@
 # financial_simulator/analysis/scenario_explorer.py
 
-from financial_simulator.core.engine import ProjectionEngine
+from financial_simulator.core.batch_engine import BatchProjectionEngine
 from financial_simulator.core.inputs import SimulationInputs
 from financial_simulator.analysis.scoring import FinancialScorer
+from financial_simulator.risk.monte_carlo import compare_scenarios
 
 
 class MigrationScenarioExplorer:
 
-    def explore_income_range(self, base_inputs, income_values):
+    def explore_income_range(self, base_inputs, income_values, monte_carlo_runs=0, seed=None):
 
-        scenarios = []
+        inputs_list = []
 
         for income in income_values:
 
@@ -33,12 +34,28 @@ class MigrationScenarioExplorer:
             inputs.normalize()
             inputs.validate()
 
-            # =========================
-            # 2️⃣ Exécuter la simulation
-            # =========================
-            engine = ProjectionEngine(inputs)
-            result = engine.simulate(force=True)
-        
+            inputs_list.append(inputs)
+
+        if not inputs_list:
+            return []
+
+        # =========================
+        # 2️⃣ Exécuter toutes les simulations en un seul batch
+        # =========================
+        batch = BatchProjectionEngine(inputs_list).simulate(force=True)
+
+        # =========================
+        # 3️⃣ Monte Carlo sur les mêmes tirages pour chaque revenu
+        # =========================
+        risks = []
+        if monte_carlo_runs:
+            risks = compare_scenarios(inputs_list, runs=monte_carlo_runs, seed=seed)
+
+        scenarios = []
+
+        for index, (income, inputs) in enumerate(zip(income_values, inputs_list)):
+
+            result = batch.to_projection(index)
 
             # =========================
             # 4️⃣ Scorer la simulation
@@ -49,7 +66,7 @@ class MigrationScenarioExplorer:
             # =========================
             # 5️⃣ Enregistrer le scénario
             # =========================
-            scenarios.append({
+            scenario = {
                 "income": income,
                 "final_balance": result.final_balance,
                 "score": score["total_score"],
@@ -59,6 +76,11 @@ class MigrationScenarioExplorer:
                 "expenses": result.avg_monthly_expenses,
                 "tax_rate": result.tax_rate_effective,
                 "goal_reached": bool(result.goal_reached_month),
-            })
+            }
+
+            if risks:
+                scenario["success_rate"] = risks[index].success_rate
+
+            scenarios.append(scenario)
 
-        return scenarios
\ No newline at end of file
+        return scenarios
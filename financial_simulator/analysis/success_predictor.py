@@ -68,6 +68,19 @@ class ImmigrationSuccessPredictor:
         if not monte_carlo:
             return "Medium"
 
+        # width of the 95% interval on the success rate when available,
+        # thresholds match 500 / 200 runs at a 50% success rate
+        interval = getattr(monte_carlo, "confidence_interval", None)
+
+        if interval:
+            width = interval[1] - interval[0]
+
+            if width <= 0.09:
+                return "High"
+            elif width <= 0.14:
+                return "Medium"
+            return "Low"
+
         if monte_carlo.simulations_run >= 500:
             return "High"
         elif monte_carlo.simulations_run >= 200:
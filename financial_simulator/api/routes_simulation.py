@@ -8,6 +8,7 @@ from financial_simulator.analysis.scenario_explorer import MigrationScenarioExpl
 from financial_simulator.analysis.province_optimizer import ProvinceOptimizer
 from financial_simulator.analysis.insights_engine import InsightsEngine
 from financial_simulator.core.models.response import SimulationResponse
+from financial_simulator.risk.path_model import PathModel
 
 from .schemas import SimulationRequest
 
@@ -20,7 +21,9 @@ def simulate(request: SimulationRequest):
     try:
         inputs = build_inputs(request)
 
-        pipeline = SimulationPipeline(inputs)
+        path_model = PathModel(**request.path_model.model_dump()) if request.path_model else None
+
+        pipeline = SimulationPipeline(inputs, seed=request.seed, path_model=path_model)
         result = pipeline.run()
 
         projection = result["projection"]
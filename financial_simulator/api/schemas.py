@@ -1,9 +1,25 @@
 # financial_simulator/api/schemas.py
 
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, Field, model_validator
 from typing import Optional, Dict
 
 
+class PathModelSettings(BaseModel):
+    """
+    Opt-in month-level Monte Carlo paths. Defaults match PathModel.
+    """
+
+    income_shock: float = Field(0.05, ge=0, description="Monthly income shock (std of a mean-one factor)")
+    expense_shock: float = Field(0.05, ge=0, description="Monthly expense shock (std of a mean-one factor)")
+
+    # employed <-> unemployed Markov chain, monthly probabilities
+    job_loss_rate: float = Field(0.01, ge=0, le=1, description="Monthly probability of losing income")
+    job_finding_rate: float = Field(0.20, ge=0, le=1, description="Monthly probability of finding work again")
+
+    one_off_rate: float = Field(0.03, ge=0, le=1, description="Monthly probability of a one-off expense")
+    one_off_scale: float = Field(1.0, ge=0, description="Mean one-off expense, in months of regular expenses")
+
+
 class SimulationRequest(BaseModel):
     initial_savings: float
     monthly_income: float
@@ -17,6 +33,13 @@ class SimulationRequest(BaseModel):
     months_without_income: int = 0
 
     province: str
+    tax_year: Optional[int] = None
+
+    # Monte Carlo seed, for reproducible responses
+    seed: Optional[int] = None
+
+    # month-level Monte Carlo paths; omitted = constant monthly cashflows
+    path_model: Optional[PathModelSettings] = None
 
     # ✅ VALIDATION API LEVEL
     @model_validator(mode="after")
@@ -0,0 +1,20 @@
+# financial_simulator/cli/build_snapshots.py
+
+import sys
+
+from financial_simulator.data.province_model import build_snapshots
+
+
+def main(argv=None):
+    """
+    Build step: write the compiled .npz snapshot of every tax year,
+    or of the years given on the command line.
+    """
+    tax_years = [int(year) for year in (sys.argv[1:] if argv is None else argv)]
+
+    for path in build_snapshots(tax_years or None):
+        print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+# financial_simulator/core/batch_engine.py
+
+import numpy as np
+
+from financial_simulator.core.engine import first_month_at_or_above, first_month_below
+from financial_simulator.core.models import BatchProjectionResult
+
+
+class BatchProjectionEngine:
+    """
+    Runs many projections at once, one scenario per row of a
+    (scenarios, months) array.
+
+    Monthly hooks cannot be vectorized across scenarios, so cashflow
+    adjustments (e.g. sales tax) are passed as `monthly_adjustment`,
+    added to income - expenses every month.
+
+    `dtype` sets the precision of the (scenarios, months) arrays;
+    float32 halves their memory and keeps balances to the dollar.
+    """
+
+    def __init__(self, inputs_list):
+        self.inputs_list = list(inputs_list)
+
+    # =============================
+    # MAIN ENTRY
+    # =============================
+    def simulate(
+        self,
+        monthly_income=None,
+        monthly_expenses=None,
+        monthly_adjustment=None,
+        force=False,
+        include_balances=False,
+        dtype=np.float64
+    ) -> BatchProjectionResult:
+
+        if not self.inputs_list:
+            raise ValueError("Batch requires at least one scenario")
+
+        size = len(self.inputs_list)
+
+        initial = np.array([
+            i.profile.initial_savings - i.config.one_time_cost
+            for i in self.inputs_list
+        ], dtype=float)
+
+        months = np.array([i.config.months for i in self.inputs_list])
+        goals = np.array([i.config.savings_goal for i in self.inputs_list], dtype=float)
+
+        if monthly_income is None:
+            monthly_income = [i.profile.monthly_income for i in self.inputs_list]
+
+        if monthly_expenses is None:
+            monthly_expenses = [i.get_total_expenses() for i in self.inputs_list]
+
+        if monthly_adjustment is None:
+            monthly_adjustment = 0.0
+
+        dtype = np.dtype(dtype)
+
+        if dtype not in (np.float32, np.float64):
+            raise ValueError(f"Unsupported dtype: {dtype}")
+
+        # (scenarios,) for constant cashflows, (scenarios, months) otherwise
+        income = self._as_rows(monthly_income, size, dtype)
+        expenses = self._as_rows(monthly_expenses, size, dtype)
+        adjustment = self._as_rows(monthly_adjustment, size, dtype)
+
+        result = BatchProjectionResult(size)
+        result.insolvent_before_income = initial < 0
+
+        constant = income.ndim == expenses.ndim == adjustment.ndim == 1
+
+        if constant and not include_balances:
+            self._simulate_closed_form(result, initial, months, goals, income, expenses, adjustment, force)
+        else:
+            self._simulate_matrix(
+                result, initial, months, goals, income, expenses, adjustment, force, include_balances, dtype
+            )
+
+        return result
+
+    # =============================
+    # INPUT SHAPING
+    # =============================
+    def _as_rows(self, values, size, dtype=np.float64):
+        """
+        Per-scenario rows stay float64; per-month matrices take `dtype`.
+        """
+        values = np.asarray(values)
+
+        if values.ndim == 0:
+            return np.full(size, float(values))
+
+        if values.shape[0] != size:
+            raise ValueError(f"Expected {size} scenarios, got {values.shape[0]}")
+
+        if values.ndim > 2:
+            raise ValueError("Monthly values must be per-scenario or per-scenario-per-month")
+
+        return values.astype(dtype if values.ndim == 2 else float, copy=False)
+
+    # =============================
+    # CLOSED FORM (CONSTANT CASHFLOWS)
+    # =============================
+    def _simulate_closed_form(self, result, initial, months, goals, income, expenses, adjustment, force):
+
+        cashflow = income - expenses + adjustment
+
+        if not force:
+            first_negative = first_month_below(initial, cashflow, 0.0, months)
+            months = np.where(first_negative > 0, first_negative, months)
+
+        final = initial + months * cashflow
+        lowest = np.minimum(initial + cashflow, final)
+
+        result.months = months
+        result.final_balance = final
+        result.went_negative_during_simulation = lowest < 0
+        result.max_negative_balance = np.minimum(lowest, 0.0)
+        result.goal_reached_month = first_month_at_or_above(initial, cashflow, goals, months)
+
+        # constant per month, so the average is the value itself
+        result.avg_net_income = income
+        result.avg_monthly_expenses = expenses
+
+    # =============================
+    # MATRIX (PER-MONTH CASHFLOWS)
+    # =============================
+    def _simulate_matrix(self, result, initial, months, goals, income, expenses, adjustment, force,
+                         include_balances, dtype=np.float64):
+
+        size = len(initial)
+        horizon = int(months.max())
+        shape = (size, horizon)
+
+        income = self._as_matrix(income, shape, dtype)
+        expenses = self._as_matrix(expenses, shape, dtype)
+        adjustment = self._as_matrix(adjustment, shape, dtype)
+
+        if dtype == np.float64:
+            # opening balance as first column keeps the loop's summation order
+            balances = np.cumsum(
+                np.column_stack((initial, income - expenses + adjustment)),
+                axis=1
+            )[:, 1:]
+        else:
+            # reduced precision: cumulate the cashflows alone, so rounding
+            # grows with their sum rather than with the whole balance
+            balances = initial.astype(dtype)[:, None] + np.cumsum(income - expenses + adjustment, axis=1)
+
+        month_index = np.arange(horizon)
+        active = month_index < months[:, None]
+
+        if not force:
+            negative = (balances < 0) & active
+            stop = np.where(negative.any(axis=1), negative.argmax(axis=1) + 1, horizon)
+            active &= month_index < stop[:, None]
+
+        simulated = active.sum(axis=1)
+        rows = np.arange(size)
+
+        lowest = np.where(active, balances, np.inf).min(axis=1)
+
+        reached = (balances >= goals[:, None]) & active
+
+        result.months = simulated
+        result.final_balance = balances[rows, simulated - 1].astype(float)
+        result.went_negative_during_simulation = lowest < 0
+        result.max_negative_balance = np.minimum(lowest, 0.0).astype(float)
+        result.goal_reached_month = np.where(reached.any(axis=1), reached.argmax(axis=1) + 1, 0)
+
+        result.avg_net_income = np.where(active, income, 0.0).sum(axis=1, dtype=float) / simulated
+        result.avg_monthly_expenses = np.where(active, expenses, 0.0).sum(axis=1, dtype=float) / simulated
+
+        if include_balances:
+            result.balances = balances
+
+    def _as_matrix(self, values, shape, dtype=np.float64):
+
+        if values.ndim == 1:
+            return np.broadcast_to(values.astype(dtype)[:, None], shape)
+
+        if values.shape[1] < shape[1]:
+            raise ValueError(f"Expected {shape[1]} months, got {values.shape[1]}")
+
+        return values[:, :shape[1]]
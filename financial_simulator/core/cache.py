@@ -0,0 +1,111 @@
+# financial_simulator/core/cache.py
+
+import threading
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Thread-safe LRU cache with optional TTL, the memory tier of the
+    tax and Monte Carlo result caches.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float | None = None, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # =========================
+    # LOOKUP
+    # =========================
+    def get(self, key, default=None):
+
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+
+            if entry is not _MISSING:
+                value, expires_at = entry
+
+                if expires_at is None or expires_at > self.clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+
+                del self._entries[key]
+
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+
+        expires_at = self.clock() + self.ttl if self.ttl is not None else None
+
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def get_or_compute(self, key, compute):
+
+        value = self.get(key, _MISSING)
+
+        if value is _MISSING:
+            # computed outside the lock, a concurrent duplicate is harmless
+            value = compute()
+            self.put(key, value)
+
+        return value
+
+    # =========================
+    # MAINTENANCE
+    # =========================
+    def configure(self, maxsize: int | None = None, ttl: float | None = _MISSING):
+
+        with self._lock:
+            if maxsize is not None:
+                self.maxsize = maxsize
+            if ttl is not _MISSING:
+                self.ttl = ttl
+            self._evict()
+
+    def clear(self):
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict:
+
+        with self._lock:
+            lookups = self.hits + self.misses
+
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _evict(self):
+        # caller holds the lock
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
@@ -1,6 +1,25 @@
 # financial_simulator/core/engine.py
 
-from financial_simulator.core.models import ProjectionResult
+import numpy as np
+
+from financial_simulator.core.models import ProjectionResult, ProjectionColumns
+
+BACKENDS = ("loop", "vectorized", "analytic", "auto")
+
+BALANCE = ProjectionColumns.INDEX["balance"]
+NET_INCOME = ProjectionColumns.INDEX["net_income"]
+EXPENSES = ProjectionColumns.INDEX["expenses"]
+
+
+def constant_hook(hook):
+    """
+    Mark a monthly hook whose result does not depend on the month, only
+    on the cashflow (additive or not), so the engine can evaluate it once
+    per distinct cashflow instead of every month.
+    """
+    hook.constant = True
+    return hook
+
 
 class ProjectionEngine:
 
@@ -18,10 +37,57 @@ class ProjectionEngine:
         monthly_income=None,
         monthly_expenses=None,
         monthly_hook=None,
-        force=False
+        force=False,
+        backend="loop",
+        include_balances=True
     ) -> ProjectionResult:
 
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown engine backend: {backend}")
+
+        if backend == "auto":
+            backend = (
+                "analytic"
+                if self._is_constant_cashflow(monthly_income, monthly_expenses, monthly_hook)
+                else "vectorized"
+            )
+
+        if backend == "analytic":
+            return self._simulate_analytic(
+                monthly_income,
+                monthly_expenses,
+                monthly_hook,
+                force,
+                include_balances
+            )
+
+        if backend == "vectorized":
+            result = self._simulate_vectorized(
+                monthly_income,
+                monthly_expenses,
+                monthly_hook,
+                force
+            )
+        else:
+            result = self._simulate_loop(
+                monthly_income,
+                monthly_expenses,
+                monthly_hook,
+                force
+            )
+
+        if not include_balances:
+            result.columns = ProjectionColumns()
+
+        return result
+
+    # =============================
+    # LOOP BACKEND (REFERENCE)
+    # =============================
+    def _simulate_loop(self, monthly_income, monthly_expenses, monthly_hook, force):
+
         state = self._initialize_state()
+        state["columns"] = ProjectionColumns(self.inputs.config.months)
 
         for month in range(1, self.inputs.config.months + 1):
 
@@ -52,7 +118,8 @@ class ProjectionEngine:
             "balance": initial_balance,
             "initial_balance": initial_balance,
 
-            "monthly_records": [],
+            "columns": ProjectionColumns(),
+            "months_simulated": 0,
 
             "total_tax_paid": 0,
             "total_gross_income": 0,
@@ -104,21 +171,167 @@ class ProjectionEngine:
         ):
             state["goal_reached_month"] = month
 
-        state["monthly_records"].append({
-            "month": month,
-            "balance": state["balance"],
-            "net_income": income,
-            "expenses": expenses,
-        })
+        # write straight into the preallocated columns
+        data = state["columns"].data
+        data[BALANCE, month - 1] = state["balance"]
+        data[NET_INCOME, month - 1] = income
+        data[EXPENSES, month - 1] = expenses
+
+        state["months_simulated"] = month
+
+    # =============================
+    # VECTORIZED BACKEND
+    # =============================
+    def _simulate_vectorized(self, monthly_income, monthly_expenses, monthly_hook, force):
+
+        months = self.inputs.config.months
+
+        income = monthly_income if monthly_income is not None else self.inputs.profile.monthly_income
+
+        if monthly_expenses is not None:
+            expenses = monthly_expenses
+        else:
+            expenses = self.inputs.get_total_expenses()
+
+        # scalars or per-month series are both accepted
+        income = np.broadcast_to(np.asarray(income, dtype=float), (months,))
+        expenses = np.broadcast_to(np.asarray(expenses, dtype=float), (months,))
+
+        cashflow = income - expenses
+
+        if monthly_hook:
+            cashflow = self._apply_hook(monthly_hook, cashflow)
+
+        state = self._initialize_state()
+
+        # prepend the opening balance so the running sum adds months in
+        # the same order as the loop backend
+        balances = np.cumsum(np.concatenate(([state["initial_balance"]], cashflow)))[1:]
+
+        if not force:
+            negative = np.flatnonzero(balances < 0)
+            if negative.size:
+                stop = negative[0] + 1
+                balances = balances[:stop]
+                income = income[:stop]
+                expenses = expenses[:stop]
+
+        self._summarize_balances(state, balances, income, expenses)
+
+        return self._build_result(state)
+
+    def _apply_hook(self, monthly_hook, cashflow):
 
+        if getattr(monthly_hook, "constant", False):
+            # one call per distinct cashflow: a single call when it is constant
+            values, inverse = np.unique(cashflow, return_inverse=True)
+            return np.array([monthly_hook(1, value) for value in values.tolist()], dtype=float)[inverse]
 
+        months = np.arange(1, cashflow.size + 1)
+
+        return np.fromiter(
+            (monthly_hook(int(m), c) for m, c in zip(months, cashflow.tolist())),
+            dtype=float,
+            count=cashflow.size
+        )
+
+    def _summarize_balances(self, state, balances, income, expenses):
+
+        state["balance"] = float(balances[-1])
+        state["total_net_income"] = float(income.sum())
+        state["total_expenses"] = float(expenses.sum())
+
+        negative = balances[balances < 0]
+        if negative.size:
+            state["went_negative"] = True
+            state["max_negative_balance"] = min(0, float(negative.min()))
+
+        reached = np.flatnonzero(balances >= self.inputs.savings_goal)
+        if reached.size:
+            state["goal_reached_month"] = int(reached[0]) + 1
+
+        state["months_simulated"] = balances.size
+        state["columns"] = ProjectionColumns.from_arrays(
+            balances.size,
+            balance=balances,
+            net_income=income,
+            expenses=expenses
+        )
+
+    # =============================
+    # ANALYTIC BACKEND
+    # =============================
+    def _is_constant_cashflow(self, monthly_income, monthly_expenses, monthly_hook):
+
+        if np.ndim(monthly_income) or np.ndim(monthly_expenses):
+            return False
+
+        return not monthly_hook or getattr(monthly_hook, "constant", False)
+
+    def _simulate_analytic(self, monthly_income, monthly_expenses, monthly_hook, force, include_balances):
+
+        # constant cashflow => balance(k) = initial + k * cashflow
+        if not self._is_constant_cashflow(monthly_income, monthly_expenses, monthly_hook):
+            raise ValueError("Analytic backend requires a constant monthly cashflow")
+
+        months = self.inputs.config.months
+
+        income = monthly_income if monthly_income is not None else self.inputs.profile.monthly_income
+
+        if monthly_expenses is not None:
+            expenses = monthly_expenses
+        else:
+            expenses = self.inputs.get_total_expenses()
+
+        cashflow = income - expenses
+
+        if monthly_hook:
+            cashflow = monthly_hook(1, cashflow)
+
+        state = self._initialize_state()
+        initial = state["initial_balance"]
+
+        if not force:
+            first_negative = int(first_month_below(initial, cashflow, 0, months))
+            if first_negative:
+                months = first_negative
+
+        # linear path: the lowest balance is at one of the two ends
+        lowest = min(initial + cashflow, initial + months * cashflow)
+
+        state["balance"] = initial + months * cashflow
+        state["total_net_income"] = income * months
+        state["total_expenses"] = expenses * months
+
+        if lowest < 0:
+            state["went_negative"] = True
+            state["max_negative_balance"] = lowest
+
+        state["goal_reached_month"] = int(first_month_at_or_above(
+            initial,
+            cashflow,
+            self.inputs.savings_goal,
+            months
+        )) or None
+
+        state["months_simulated"] = months
+
+        if include_balances:
+            state["columns"] = ProjectionColumns.from_arrays(
+                months,
+                balance=initial + cashflow * np.arange(1, months + 1),
+                net_income=income,
+                expenses=expenses
+            )
+
+        return self._build_result(state)
 
     # =============================
     # RESULT BUILDER
     # =============================
     def _build_result(self, state) -> ProjectionResult:
 
-        months = len(state["monthly_records"])
+        months = state["months_simulated"]
 
         avg_net_income = (
             state["total_net_income"] / months if months else 0
@@ -145,6 +358,59 @@ class ProjectionEngine:
         result.goal_reached_month = state["goal_reached_month"]
         result.insolvent_before_income = state["insolvent_before_income"]
 
-        result.monthly_balances = [r["balance"] for r in state["monthly_records"]]
+        columns = state["columns"]
+        result.columns = columns.truncate(months) if len(columns) > months else columns
+
+        return result
+
+
+# =============================
+# CLOSED-FORM HELPERS
+# =============================
+def first_month_at_or_above(initial, cashflow, target, months):
+    """
+    First month k in [1, months] where initial + k * cashflow >= target,
+    element-wise over arrays or scalars. Returns 0 where it never happens.
+    """
+    # arrays, so a zero cashflow divides under errstate instead of raising
+    initial = np.asarray(initial, dtype=float)
+    cashflow = np.asarray(cashflow, dtype=float)
+    beyond = months + 1
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k = np.ceil((target - initial) / cashflow)
+
+    k = np.where(cashflow > 0, k, beyond)
+    k = np.clip(np.where(np.isnan(k), beyond, k), 1, beyond)
+
+    # guard against rounding in the division
+    k = np.where((k > 1) & (initial + (k - 1) * cashflow >= target), k - 1, k)
+    k = np.where((k < beyond) & (initial + k * cashflow < target), k + 1, k)
+
+    k = np.where(initial + cashflow >= target, 1, k)
+
+    return np.where(k <= months, k, 0).astype(int)
+
+
+def first_month_below(initial, cashflow, target, months):
+    """
+    First month k in [1, months] where initial + k * cashflow < target,
+    element-wise over arrays or scalars. Returns 0 where it never happens.
+    """
+    # arrays, so a zero cashflow divides under errstate instead of raising
+    initial = np.asarray(initial, dtype=float)
+    cashflow = np.asarray(cashflow, dtype=float)
+    beyond = months + 1
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k = np.floor((target - initial) / cashflow) + 1
+
+    k = np.where(cashflow < 0, k, beyond)
+    k = np.clip(np.where(np.isnan(k), beyond, k), 1, beyond)
+
+    k = np.where((k > 1) & (initial + (k - 1) * cashflow < target), k - 1, k)
+    k = np.where((k < beyond) & (initial + k * cashflow >= target), k + 1, k)
+
+    k = np.where(initial + cashflow < target, 1, k)
 
-        return result
\ No newline at end of file
+    return np.where(k <= months, k, 0).astype(int)
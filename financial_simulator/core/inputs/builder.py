@@ -5,7 +5,8 @@ from .simulation_config import SimulationConfig
 from .economic_context import EconomicContext
 from .simulation_inputs import SimulationInputs
 
-from financial_simulator.data.provinces import PROVINCES_DATA
+from financial_simulator.data.tax_store import load_tax_year
+from financial_simulator.data.province_model import get_province
 
 
 def build_inputs(data):
@@ -38,15 +39,14 @@ def build_inputs(data):
     # =========================
     # CONTEXT
     # =========================
-    province_key = data.province.lower()
-
-    if province_key not in PROVINCES_DATA:
-        raise ValueError(f"Invalid province: {data.province}")
+    province = get_province(data.province, get_attr("tax_year"))
+    provinces_data, _ = load_tax_year(province.tax_year)
 
     context = EconomicContext(
-        province=province_key,
-        province_data=PROVINCES_DATA[province_key],
-        all_provinces_data=PROVINCES_DATA
+        province=province.key,
+        province_data=province.data,
+        all_provinces_data=provinces_data,
+        tax_year=province.tax_year
     )
 
     # =========================
@@ -6,7 +6,9 @@ class EconomicContext:
         province: str | None = None,
         province_data: dict | None = None,
         all_provinces_data: dict | None = None,
+        tax_year: int | None = None,
     ):
         self.province = province
         self.province_data = province_data
-        self.all_provinces_data = all_provinces_data
\ No newline at end of file
+        self.all_provinces_data = all_provinces_data
+        self.tax_year = tax_year
\ No newline at end of file
@@ -3,6 +3,7 @@
 from financial_simulator.core.inputs.economic_context import EconomicContext
 from financial_simulator.core.inputs.financial_profile import FinancialProfile
 from financial_simulator.core.inputs.simulation_config import SimulationConfig
+from financial_simulator.data.province_model import fingerprint, get_province
 
 
 
@@ -63,6 +64,37 @@ class SimulationInputs:
             },
         }
 
+    def fingerprint(self) -> str:
+        """
+        Canonical hash of everything a simulation depends on: profile,
+        config, province and the content of its tax year. Independent of
+        expense order and of int vs float amounts.
+        """
+        province = get_province(self.context.province, self.context.tax_year)
+
+        def number(value):
+            return None if value is None else float(value)
+
+        return fingerprint({
+            "profile": {
+                "initial_savings": number(self.profile.initial_savings),
+                "monthly_income": number(self.profile.monthly_income),
+                "expenses": (
+                    {k: number(v) for k, v in self.profile.expenses.items()}
+                    if self.profile.expenses is not None else None
+                ),
+                "monthly_expenses": number(self.profile.monthly_expenses),
+            },
+            "config": {
+                "months": int(self.config.months),
+                "savings_goal": number(self.config.savings_goal),
+                "one_time_cost": number(self.config.one_time_cost),
+                "months_without_income": int(self.config.months_without_income),
+            },
+            "province": province.key,
+            "tax": province.fingerprint,
+        })
+
     # =========================
     # VALIDATION (STRICT)
     # =========================
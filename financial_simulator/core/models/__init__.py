@@ -3,6 +3,8 @@
 from financial_simulator.core.models.domain_models import (
     ProjectionResult,
     MonthlyProjection,
+    ProjectionColumns,
+    BatchProjectionResult,
 )
 
 from .response import SimulationResponse
@@ -10,5 +12,7 @@ from .response import SimulationResponse
 __all__ = [
     "ProjectionResult",
     "MonthlyProjection",
+    "ProjectionColumns",
+    "BatchProjectionResult",
     "SimulationResponse",
 ]
\ No newline at end of file
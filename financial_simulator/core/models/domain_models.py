@@ -1,6 +1,67 @@
 # financial_simulator/core/models.py
 from typing import List
 
+import numpy as np
+
+
+# =========================================
+# 🗂️ PROJECTION COLUMNS
+# =========================================
+class ProjectionColumns:
+    """
+    Struct-of-arrays storage for the monthly series.
+    One contiguous float64 row per field, one column per month.
+    """
+
+    __slots__ = ("data",)
+
+    FIELDS = (
+        "balance",
+        "net_income",  # income after taxes, used in the simulation
+        "expenses",
+        "gross_income",
+        "income_tax",
+        "payroll_tax",
+        "expense_tax",
+    )
+
+    INDEX = {name: i for i, name in enumerate(FIELDS)}
+
+    def __init__(self, months: int = 0):
+        self.data = np.zeros((len(self.FIELDS), months))
+
+    @classmethod
+    def from_arrays(cls, months: int, **columns) -> "ProjectionColumns":
+
+        result = cls(months)
+
+        for name, values in columns.items():
+            result.data[cls.INDEX[name]] = values
+
+        return result
+
+    def __len__(self) -> int:
+        return self.data.shape[1]
+
+    def column(self, name: str) -> np.ndarray:
+        return self.data[self.INDEX[name]]
+
+    def truncate(self, months: int) -> "ProjectionColumns":
+
+        result = ProjectionColumns.__new__(ProjectionColumns)
+        result.data = np.ascontiguousarray(self.data[:, :months])
+
+        return result
+
+    def to_dict(self) -> dict:
+
+        columns = {"month": list(range(1, len(self) + 1))}
+
+        for name, row in zip(self.FIELDS, self.data):
+            columns[name] = row.tolist()
+
+        return columns
+
 
 # =========================================
 # 📅 MONTHLY PROJECTION
@@ -8,35 +69,54 @@ from typing import List
 class MonthlyProjection:
     """
     Represents the financial state for a single month.
-    Includes full tax breakdown and real cashflow.
+    Lightweight view onto one month of ProjectionColumns.
     """
 
-    def __init__(
-        self,
-        month: int,
-        balance: float,
-        income: float,
-        expenses: float,
-        net_income: float,
-        gross_income: float,
-        expense_tax: float,
-        income_tax: float,
-        payroll_tax: float,
-    ):
-        self.month = month
-        self.balance = balance
-
-        # Real values used in simulation
-        self.income = income  # net income after taxes
-        self.expenses = expenses  # total expenses (incl. tax)
-
-        # Detailed breakdown (important for UI & analysis)
-        self.net_income = net_income
-        self.gross_income = gross_income
-
-        self.expense_tax = expense_tax
-        self.income_tax = income_tax
-        self.payroll_tax = payroll_tax
+    __slots__ = ("columns", "index")
+
+    def __init__(self, columns: ProjectionColumns, index: int):
+        self.columns = columns
+        self.index = index
+
+    def _value(self, name: str) -> float:
+        return float(self.columns.data[ProjectionColumns.INDEX[name], self.index])
+
+    @property
+    def month(self) -> int:
+        return self.index + 1
+
+    @property
+    def balance(self) -> float:
+        return self._value("balance")
+
+    @property
+    def income(self) -> float:
+        # Real income used in simulation (net after taxes)
+        return self._value("net_income")
+
+    @property
+    def net_income(self) -> float:
+        return self._value("net_income")
+
+    @property
+    def expenses(self) -> float:
+        return self._value("expenses")
+
+    @property
+    def gross_income(self) -> float:
+        return self._value("gross_income")
+
+    @property
+    def income_tax(self) -> float:
+        return self._value("income_tax")
+
+    @property
+    def payroll_tax(self) -> float:
+        return self._value("payroll_tax")
+
+    @property
+    def expense_tax(self) -> float:
+        return self._value("expense_tax")
 
     @property
     def total_tax(self) -> float:
@@ -76,8 +156,7 @@ class ProjectionResult:
         # CORE RESULTS
         # =========================
         self.final_balance: float = 0
-        self.monthly_balances: List[float] = []
-        self.monthly_projections: List[MonthlyProjection] = []
+        self.columns: ProjectionColumns = ProjectionColumns()
 
         # =========================
         # GOAL & EVENTS
@@ -106,12 +185,37 @@ class ProjectionResult:
         self.avg_net_income: float = 0
         self.avg_monthly_expenses: float = 0
 
+    # =========================================
+    # 🗂️ MONTHLY SERIES (COLUMN VIEWS)
+    # =========================================
+    @property
+    def monthly_balances(self) -> np.ndarray:
+        return self.columns.column("balance")
+
+    @monthly_balances.setter
+    def monthly_balances(self, values):
+
+        values = np.asarray(values, dtype=float)
+
+        if len(values) != len(self.columns):
+            self.columns = ProjectionColumns(len(values))
+
+        self.columns.data[ProjectionColumns.INDEX["balance"]] = values
+
+    @property
+    def monthly_projections(self) -> List[MonthlyProjection]:
+        return [
+            MonthlyProjection(self.columns, i)
+            for i in range(len(self.columns))
+        ]
+
     # =========================================
     # 📊 DERIVED METRICS
     # =========================================
     @property
     def min_balance(self) -> float:
-        return min(self.monthly_balances) if self.monthly_balances else 0
+        balances = self.monthly_balances
+        return float(balances.min()) if balances.size else 0
 
     @property
     def min_cushion(self) -> float:
@@ -127,7 +231,7 @@ class ProjectionResult:
         """
         Effective tax pressure over the simulation.
         """
-        total_gross_income = sum(m.gross_income for m in self.monthly_projections)
+        total_gross_income = float(self.columns.column("gross_income").sum())
 
         if total_gross_income == 0:
             return 0
@@ -155,10 +259,74 @@ class ProjectionResult:
             "avg_monthly_expenses": self.avg_monthly_expenses,
             "min_cushion": self.min_cushion,
 
-            "monthly_balances": self.monthly_balances,
+            "monthly_balances": self.monthly_balances.tolist(),
             "monthly_tax_series": self.monthly_tax_series,
 
-            "monthly_projections": [
-                m.to_dict() for m in self.monthly_projections
-            ],
-        }
\ No newline at end of file
+            # per-month series as columns; the record list was always empty
+            # and stays in the payload only for existing clients
+            "monthly_projections": [],
+            "monthly_columns": self.columns.to_dict(),
+        }
+
+
+# =========================================
+# 🧮 BATCH PROJECTION RESULT
+# =========================================
+class BatchProjectionResult:
+    """
+    Compact result of N projections run together.
+    Every summary field is an array with one entry per scenario;
+    goal_reached_month uses 0 for "never reached".
+    """
+
+    def __init__(self, size: int):
+
+        self.size = size
+
+        self.final_balance = np.zeros(size)
+        self.max_negative_balance = np.zeros(size)
+        self.goal_reached_month = np.zeros(size, dtype=int)
+
+        self.went_negative_during_simulation = np.zeros(size, dtype=bool)
+        self.insolvent_before_income = np.zeros(size, dtype=bool)
+
+        self.avg_net_income = np.zeros(size)
+        self.avg_monthly_expenses = np.zeros(size)
+
+        # months actually simulated per scenario
+        self.months = np.zeros(size, dtype=int)
+
+        # (scenarios, months) matrix, only kept on request
+        self.balances: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return self.size
+
+    def monthly_balances(self, index: int) -> np.ndarray:
+        """
+        View into the balance matrix for one scenario.
+        """
+        if self.balances is None:
+            raise ValueError("Balance matrix was not kept for this batch")
+
+        return self.balances[index, :self.months[index]]
+
+    def to_projection(self, index: int) -> ProjectionResult:
+        """
+        Expand one scenario into a regular ProjectionResult.
+        """
+        result = ProjectionResult()
+
+        result.final_balance = float(self.final_balance[index])
+        result.avg_net_income = float(self.avg_net_income[index])
+        result.avg_monthly_expenses = float(self.avg_monthly_expenses[index])
+
+        result.went_negative_during_simulation = bool(self.went_negative_during_simulation[index])
+        result.insolvent_before_income = bool(self.insolvent_before_income[index])
+        result.max_negative_balance = float(self.max_negative_balance[index])
+        result.goal_reached_month = int(self.goal_reached_month[index]) or None
+
+        if self.balances is not None:
+            result.monthly_balances = self.monthly_balances(index)
+
+        return result
@@ -62,6 +62,21 @@ class SimulationResponse:
                     "failure_rate": self.monte_carlo.failure_rate,
                     "worst_balance": self.monte_carlo.worst_balance,
                     "average_final_balance": self.monte_carlo.average_final_balance,
+                    "success_std_error": self.monte_carlo.success_std_error,
+                    "final_balance_std": self.monte_carlo.final_balance_std,
+                    "confidence_interval": self.monte_carlo.confidence_interval,
+                    "simulations_run": self.monte_carlo.simulations_run,
+                    "balance_bands": (
+                        {
+                            label: band.tolist()
+                            for label, band in self.monte_carlo.balance_bands.items()
+                        }
+                        if self.monte_carlo.balance_bands is not None else None
+                    ),
+                    "survival_curve": (
+                        self.monte_carlo.survival_curve.tolist()
+                        if self.monte_carlo.survival_curve is not None else None
+                    ),
                 }
                 if self.monte_carlo else None
             ),
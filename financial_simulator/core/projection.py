@@ -1,29 +1,29 @@
 # financial_simulator/core/projection.py
 
-from financial_simulator.core.engine import ProjectionEngine
+from financial_simulator.core.engine import ProjectionEngine, constant_hook
 
 from financial_simulator.core.tax.income_tax_engine import IncomeTaxEngine
 from financial_simulator.core.tax.expense_tax_engine import ExpenseTaxEngine
 
-from financial_simulator.data.provinces import PROVINCES_DATA, PAYROLL_DATA
+from financial_simulator.data.province_model import get_province
 
 
-def run_projection(inputs):
+def build_cashflows(inputs):
+    """
+    After-tax monthly cashflow components for one set of inputs:
+    net income, base expenses and the sales tax paid on them.
+    """
 
     # =========================
     # CONTEXT
     # =========================
-    province_key = inputs.context.province.lower()
-    province_data = PROVINCES_DATA[province_key]
-
-    payroll_key = "quebec" if province_key == "quebec" else "canada"
-    payroll_data = PAYROLL_DATA[payroll_key]
+    province = get_province(inputs.context.province, inputs.context.tax_year)
 
     # =========================
     # TAX ENGINES
     # =========================
-    income_engine = IncomeTaxEngine(province_data, payroll_data)
-    expense_engine = ExpenseTaxEngine(province_data)
+    income_engine = IncomeTaxEngine.from_province(province)
+    expense_engine = ExpenseTaxEngine.from_province(province)
 
     # =========================
     # INCOME (AFTER TAX)
@@ -33,8 +33,6 @@ def run_projection(inputs):
         period="monthly"
     )
 
-    net_income = net_income_data["net_income"]
-
     # =========================
     # EXPENSES
     # =========================
@@ -45,11 +43,25 @@ def run_projection(inputs):
         base_expenses = inputs.profile.monthly_expenses
         expenses_detail = None
 
+    return {
+        "income": net_income_data,
+        "net_income": net_income_data["net_income"],
+        "expenses": base_expenses,
+        "sales_tax": expense_engine.calculate_sales_tax(expenses_detail),
+    }
+
+
+def run_projection(inputs):
+
+    cashflows = build_cashflows(inputs)
+
+    sales_tax = cashflows["sales_tax"]
+
     # =========================
     # MONTHLY TAX HOOK
     # =========================
+    @constant_hook
     def monthly_tax_hook(month, cashflow):
-        sales_tax = expense_engine.calculate_sales_tax(expenses_detail)
         return cashflow - sales_tax
 
     # =========================
@@ -58,18 +70,29 @@ def run_projection(inputs):
     engine = ProjectionEngine(inputs)
 
     result = engine.simulate(
-        monthly_income=net_income,
-        monthly_expenses=base_expenses,
+        monthly_income=cashflows["net_income"],
+        monthly_expenses=cashflows["expenses"],
         monthly_hook=monthly_tax_hook,
-        force=True
+        force=True,
+        backend="auto"
     )
 
+    # =========================
+    # TAX COLUMNS
+    # =========================
+    income_data = cashflows["income"]
+
+    result.columns.column("gross_income")[:] = inputs.profile.monthly_income
+    result.columns.column("income_tax")[:] = income_data.get("income_tax", {}).get("total_tax", 0.0)
+    result.columns.column("payroll_tax")[:] = income_data.get("payroll", {}).get("total", 0.0)
+    result.columns.column("expense_tax")[:] = sales_tax
+
     # =========================
     # TAX SUMMARY
     # =========================
     tax_summary = {
-        "income": net_income_data,
-        "monthly_sales_tax": expense_engine.calculate_sales_tax(expenses_detail)
+        "income": cashflows["income"],
+        "monthly_sales_tax": sales_tax
     }
 
-    return result, tax_summary
\ No newline at end of file
+    return result, tax_summary
@@ -10,15 +10,24 @@ from financial_simulator.analysis.success_predictor import ImmigrationSuccessPre
 
 from financial_simulator.risk.immigration_risk import ImmigrationRiskAnalyzer
 from financial_simulator.risk.monte_carlo import MonteCarloSimulator
+from financial_simulator.risk.result_cache import MONTE_CARLO_CACHE, inputs_seed
 
 from financial_simulator.strategy.migration_strategy import MigrationStrategyPlanner
 
 
 class SimulationPipeline:
 
-    def __init__(self, inputs):
+    def __init__(self, inputs, seed=None, path_model=None):
         self.inputs = inputs
 
+        # fixed seed -> reproducible Monte Carlo, same request same response;
+        # without one the seed is derived from the inputs fingerprint
+        self.seed = seed
+
+        # opt-in PathModel: job loss and one-off costs month by month;
+        # None keeps constant monthly cashflows per run
+        self.path_model = path_model
+
     def run(self):
 
         # =========================
@@ -43,7 +52,19 @@ class SimulationPipeline:
         # =========================
         # 4️⃣ MONTE CARLO
         # =========================
-        monte_carlo = MonteCarloSimulator(self.inputs, runs=300).run()
+        # stops on the interval width alone, capped at `runs`: a wall-clock
+        # budget would make responses depend on machine load. Every run is
+        # seeded, so repeat requests for the same inputs reuse the cached result
+        seed = self.seed if self.seed is not None else inputs_seed(self.inputs)
+
+        monte_carlo = MONTE_CARLO_CACHE.run(MonteCarloSimulator(
+            self.inputs,
+            runs=4096,
+            seed=seed,
+            sampler="sobol",
+            target_width=0.08,
+            path_model=self.path_model
+        ))
 
         # =========================
         # 5️⃣ SUCCESS PREDICTION
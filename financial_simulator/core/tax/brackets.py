@@ -0,0 +1,226 @@
+# financial_simulator/core/tax/brackets.py
+
+from bisect import bisect_right
+from functools import lru_cache
+
+import numpy as np
+
+INFINITY = float("inf")
+
+
+def float_array(values) -> np.ndarray:
+    """
+    Float array that keeps float32 input in float32, float64 otherwise.
+    """
+    values = np.asarray(values)
+    return values if values.dtype == np.float32 else values.astype(float, copy=False)
+
+
+class BracketSchedule:
+    """
+    Progressive schedule compiled into sorted thresholds.
+    tax(x) = bases[i] + (x - lowers[i]) * rates[i],
+    where i is found with a single bisect.
+    """
+
+    __slots__ = ("lowers", "rates", "bases", "lower_array", "rate_array", "base_array")
+
+    def __init__(self, lowers, rates):
+
+        self.lowers = tuple(float(x) for x in lowers)
+        self.rates = tuple(float(r) for r in rates)
+
+        # cumulative tax at each boundary
+        bases = [0.0]
+        for i in range(1, len(self.lowers)):
+            width = self.lowers[i] - self.lowers[i - 1]
+            bases.append(bases[-1] + width * self.rates[i - 1])
+
+        self.bases = tuple(bases)
+
+        # same tables as arrays for the vectorized path
+        self.lower_array = np.array(self.lowers)
+        self.rate_array = np.array(self.rates)
+        self.base_array = np.array(self.bases)
+
+    def __call__(self, amount: float) -> float:
+
+        if amount <= 0:
+            return 0.0
+
+        i = bisect_right(self.lowers, amount) - 1
+
+        return self.bases[i] + (amount - self.lowers[i]) * self.rates[i]
+
+    def evaluate(self, amounts) -> np.ndarray:
+        """
+        Vectorized __call__: one searchsorted over all amounts.
+        float32 amounts are taxed in float32.
+        """
+        amounts = float_array(amounts)
+
+        # the tables are tiny, casting them keeps the result in the input dtype
+        lowers = self.lower_array.astype(amounts.dtype, copy=False)
+        bases = self.base_array.astype(amounts.dtype, copy=False)
+        rates = self.rate_array.astype(amounts.dtype, copy=False)
+
+        i = np.searchsorted(lowers, amounts, side="right") - 1
+        i = np.maximum(i, 0)
+
+        tax = bases[i] + (amounts - lowers[i]) * rates[i]
+
+        return np.where(amounts > 0, tax, amounts.dtype.type(0))
+
+    def __repr__(self):
+        return f"BracketSchedule(lowers={self.lowers}, rates={self.rates})"
+
+    # =========================
+    # CONSTRUCTION
+    # =========================
+    @classmethod
+    def from_segments(cls, segments) -> "BracketSchedule":
+        """
+        Build from (start, end, rate) segments. Overlapping segments
+        add up, so the marginal rate at x is the sum of every segment
+        with start <= x < end.
+        """
+        points = sorted({0.0} | {float(p) for seg in segments for p in seg[:2] if p != INFINITY})
+
+        rates = [
+            sum(rate for start, end, rate in segments if start <= point < end)
+            for point in points
+        ]
+
+        # merge neighbours with the same marginal rate
+        lowers, merged = [], []
+        for point, rate in zip(points, rates):
+            if merged and merged[-1] == rate:
+                continue
+            lowers.append(point)
+            merged.append(rate)
+
+        return cls(lowers, merged)
+
+    @classmethod
+    def combine(cls, *schedules) -> "BracketSchedule":
+        """
+        Sum of several schedules (e.g. every payroll system) as one schedule.
+        """
+        segments = []
+
+        for schedule in schedules:
+            uppers = schedule.lowers[1:] + (INFINITY,)
+            segments.extend(zip(schedule.lowers, uppers, schedule.rates))
+
+        return cls.from_segments(segments)
+
+    def inverse(self) -> "BracketSchedule":
+        """
+        Schedule mapping net amount (x - tax(x)) back to x.
+        Net is piecewise linear with slope 1 - rate, so its inverse is
+        another schedule with thresholds at the net value of each bracket.
+        """
+        if any(rate >= 1 for rate in self.rates):
+            raise ValueError("Schedule is not invertible: marginal rate >= 100%")
+
+        net_lowers = [lower - base for lower, base in zip(self.lowers, self.bases)]
+
+        return BracketSchedule(net_lowers, [1 / (1 - rate) for rate in self.rates])
+
+
+# =========================
+# COMPILERS
+# =========================
+def compile_brackets(brackets: list) -> BracketSchedule:
+    """
+    Compile a provinces.py bracket list ("up_to" / "above" entries).
+    Identical lists share one compiled schedule.
+    """
+    return _compile_brackets(_freeze(brackets))
+
+
+@lru_cache(maxsize=None)
+def _compile_brackets(frozen: tuple) -> BracketSchedule:
+
+    segments = []
+    previous_limit = 0.0
+
+    for bracket in _thaw(frozen):
+
+        if "up_to" in bracket:
+            upper = bracket["up_to"]
+            if upper > previous_limit:
+                segments.append((previous_limit, upper, bracket["rate"]))
+            previous_limit = upper
+
+        elif "above" in bracket:
+            segments.append((bracket["above"], INFINITY, bracket["rate"]))
+
+    return BracketSchedule.from_segments(segments)
+
+
+def compile_payroll(payroll_data: dict) -> dict:
+    """
+    Compile the enabled CPP/QPP and EI/QPIP systems into schedules over
+    annual gross income. The basic exemption is folded into the thresholds.
+    """
+    return dict(_compile_payroll(_freeze(payroll_data)))
+
+
+@lru_cache(maxsize=None)
+def _compile_payroll(frozen: tuple) -> tuple:
+
+    payroll_data = _thaw(frozen)
+    schedules = {}
+
+    # CPP / QPP
+    for system in ["cpp", "qpp"]:
+        config = payroll_data.get(system, {})
+        if not config.get("enabled"):
+            continue
+
+        exemption = config.get("basic_exemption", 0)
+
+        schedules[system] = BracketSchedule.from_segments([
+            (exemption, exemption + rate["up_to"], rate["rate"])
+            for rate in config.get("rates", [])
+        ])
+
+    # EI / QPIP
+    for system in ["ei", "qpip"]:
+        config = payroll_data.get(system, {})
+        if not config.get("enabled"):
+            continue
+
+        cap = config.get("max_insurable_earnings", INFINITY)
+
+        schedules[system] = BracketSchedule.from_segments([
+            (0.0, cap, config["rate"])
+        ])
+
+    return tuple(schedules.items())
+
+
+# =========================
+# HASHABLE KEYS
+# =========================
+def _freeze(value):
+
+    if isinstance(value, dict):
+        return ("dict", tuple((k, _freeze(v)) for k, v in value.items()))
+
+    if isinstance(value, (list, tuple)):
+        return ("list", tuple(_freeze(v) for v in value))
+
+    return value
+
+
+def _thaw(value):
+
+    if isinstance(value, tuple) and len(value) == 2 and value[0] == "dict":
+        return {k: _thaw(v) for k, v in value[1]}
+
+    if isinstance(value, tuple) and len(value) == 2 and value[0] == "list":
+        return [_thaw(v) for v in value[1]]
+
+    return value
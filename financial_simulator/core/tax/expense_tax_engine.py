@@ -1,25 +1,154 @@
 # financial_simulator/core/tax/expense_tax_engine.py
 
+import numpy as np
+
+OTHER_CATEGORY = "other"
+
+
+# =========================
+# CATEGORY SLOTS
+# =========================
+class ExpenseCategoryIndex:
+    """
+    Maps expense category names to integer slots.
+    Categories without a slot share the last one, taxed at the default rate.
+    """
+
+    __slots__ = ("categories", "slots")
+
+    def __init__(self, categories):
+        self.categories = tuple(sorted(set(categories) - {OTHER_CATEGORY})) + (OTHER_CATEGORY,)
+        self.slots = {name: i for i, name in enumerate(self.categories)}
+
+    def __len__(self):
+        return len(self.categories)
+
+    @classmethod
+    def for_provinces(cls, provinces_data: dict) -> "ExpenseCategoryIndex":
+        return cls(
+            category
+            for data in provinces_data.values()
+            for category in data["expense_tax"]["category_rules"]
+        )
+
+    def encode(self, expenses: dict | None) -> np.ndarray:
+        """
+        Budget dict -> amount vector. Non-positive amounts are not taxed.
+        """
+        vector = np.zeros(len(self))
+
+        if expenses:
+            other = self.slots[OTHER_CATEGORY]
+            for category, amount in expenses.items():
+                if amount > 0:
+                    vector[self.slots.get(category, other)] += amount
+
+        return vector
+
+    def encode_batch(self, budgets) -> np.ndarray:
+        return np.array([self.encode(budget) for budget in budgets]).reshape(-1, len(self))
+
+    def rates_for(self, expense_config: dict) -> np.ndarray:
+        """
+        Per-slot sales tax rates for one province.
+        """
+        rules = expense_config["category_rules"]
+        default_rate = expense_config["combined_rate"]
+
+        return np.array([
+            rules.get(category, default_rate) if category != OTHER_CATEGORY else default_rate
+            for category in self.categories
+        ])
+
+
+# =========================
+# SINGLE PROVINCE
+# =========================
 class ExpenseTaxEngine:
 
-    def __init__(self, province_data: dict):
+    def __init__(self, province_data: dict, index: ExpenseCategoryIndex | None = None):
         self.config = province_data["expense_tax"]
 
+        self.index = index or ExpenseCategoryIndex(self.config["category_rules"])
+        self.rates = self.index.rates_for(self.config)
+
+    @classmethod
+    def from_province(cls, province) -> "ExpenseTaxEngine":
+        """
+        Engine over a compiled Province, reusing its rate vector.
+        """
+        engine = cls.__new__(cls)
+
+        engine.config = province.data["expense_tax"]
+        engine.index = province.category_index
+        engine.rates = province.expense_rates
+
+        return engine
+
     def calculate_sales_tax(self, expenses: dict | None) -> float:
 
         if not expenses:
             return 0.0
 
-        rules = self.config["category_rules"]
-        default_rate = self.config["combined_rate"]
+        return float(self.index.encode(expenses) @ self.rates)
+
+    def calculate_sales_tax_batch(self, budgets: np.ndarray) -> np.ndarray:
+        """
+        Sales tax for a (budgets, slots) matrix of encoded budgets.
+        """
+        return np.asarray(budgets) @ self.rates
+
+    def category_rates(self, categories) -> np.ndarray:
+        """
+        Sales tax rate of each named category, read from the compiled slots.
+        """
+        other = self.index.slots[OTHER_CATEGORY]
+        return np.array([self.rates[self.index.slots.get(category, other)] for category in categories])
+
+
+# =========================
+# ALL PROVINCES
+# =========================
+class ExpenseTaxMatrix:
+    """
+    Sales tax rates for several provinces as one (slots, provinces) matrix,
+    so a batch of budgets is taxed everywhere with one matrix product.
+    """
+
+    def __init__(self, provinces_data: dict):
+        self.provinces = tuple(provinces_data)
+        self.index = ExpenseCategoryIndex.for_provinces(provinces_data)
+
+        self.rates = np.column_stack([
+            self.index.rates_for(provinces_data[key]["expense_tax"])
+            for key in self.provinces
+        ])
+
+    @classmethod
+    def from_provinces(cls, provinces) -> "ExpenseTaxMatrix":
+        """
+        Matrix over compiled Provinces sharing one category index.
+        """
+        provinces = list(provinces)
+
+        matrix = cls.__new__(cls)
+        matrix.provinces = tuple(province.key for province in provinces)
+        matrix.index = provinces[0].category_index
+        matrix.rates = np.column_stack([province.expense_rates for province in provinces])
 
-        total_tax = 0.0
+        return matrix
 
-        for category, amount in expenses.items():
-            if amount <= 0:
-                continue
+    def calculate_sales_tax(self, expenses: dict | None) -> np.ndarray:
+        """
+        One budget -> sales tax per province.
+        """
+        return self.index.encode(expenses) @ self.rates
 
-            rate = rules.get(category, default_rate)
-            total_tax += amount * rate
+    def calculate_sales_tax_batch(self, budgets) -> np.ndarray:
+        """
+        (budgets, slots) matrix or list of dicts -> (budgets, provinces).
+        """
+        if not isinstance(budgets, np.ndarray):
+            budgets = self.index.encode_batch(budgets)
 
-        return total_tax
\ No newline at end of file
+        return budgets @ self.rates
@@ -1,6 +1,9 @@
 # financial_simulator/core/tax/income_tax_engine.py
 
-from functools import lru_cache
+import numpy as np
+
+from financial_simulator.core.tax.brackets import BracketSchedule, compile_brackets, compile_payroll, float_array
+from financial_simulator.core.tax.tax_cache import TAX_CACHE, tax_fingerprint
 
 
 class IncomeTaxEngine:
@@ -9,57 +12,66 @@ class IncomeTaxEngine:
         self.data = province_data
         self.payroll_data = payroll_data
 
-    # =========================
-    # CORE LOGIC
-    # =========================
-    def _calculate_progressive_tax(self, income: float, tax_config: dict) -> float:
-        if income <= 0:
-            return 0.0
+        # compiled once, shared by every engine using the same tables
+        self.federal_schedule = compile_brackets(province_data["income_tax"]["federal"]["brackets"])
+        self.provincial_schedule = compile_brackets(province_data["income_tax"]["provincial"]["brackets"])
+        self.payroll_schedules = compile_payroll(payroll_data)
 
-        tax = 0.0
-        previous_limit = 0.0
+        # cache key shared by every engine with the same income tax tables
+        self.fingerprint = tax_fingerprint(self.federal_schedule, self.provincial_schedule)
 
-        for bracket in tax_config["brackets"]:
+        self._gross_schedule = None
+        self._deduction_schedule = None
 
-            if "up_to" in bracket:
-                upper = bracket["up_to"]
-                rate = bracket["rate"]
+    @classmethod
+    def from_province(cls, province) -> "IncomeTaxEngine":
+        """
+        Engine over a compiled Province, skipping bracket compilation.
+        """
+        engine = cls.__new__(cls)
 
-                taxable = min(income, upper) - previous_limit
-                if taxable > 0:
-                    tax += taxable * rate
+        engine.data = province.data
+        engine.payroll_data = province.payroll.data
 
-                previous_limit = upper
+        engine.federal_schedule = province.federal
+        engine.provincial_schedule = province.provincial
+        engine.payroll_schedules = province.payroll.schedules
 
-            elif "above" in bracket:
-                threshold = bracket["above"]
-                rate = bracket["rate"]
+        engine.fingerprint = tax_fingerprint(province.federal, province.provincial)
+        engine._gross_schedule = None
+        engine._deduction_schedule = None
 
-                if income > threshold:
-                    tax += (income - threshold) * rate
+        return engine
 
-        return tax
+    # =========================
+    # CORE LOGIC
+    # =========================
+    def _calculate_progressive_tax(self, income: float, tax_config: dict) -> float:
+        return compile_brackets(tax_config["brackets"])(income)
 
     # =========================
     # INCOME TAX
     # =========================
-    @lru_cache(maxsize=256)
     def calculate_income_tax(self, income: float, period: str = "annual"):
 
+        # the key is rounded to the cent so near-identical incomes share an
+        # entry; the tax itself is computed on the exact income
+        result = TAX_CACHE.get_or_compute(
+            (self.fingerprint, round(income, 2), period),
+            lambda: self._compute_income_tax(income, period)
+        )
+
+        return dict(result)
+
+    def _compute_income_tax(self, income: float, period: str):
+
         original_income = income
 
         if period == "monthly":
             income *= 12
 
-        federal = self._calculate_progressive_tax(
-            income,
-            self.data["income_tax"]["federal"]
-        )
-
-        provincial = self._calculate_progressive_tax(
-            income,
-            self.data["income_tax"]["provincial"]
-        )
+        federal = self.federal_schedule(income)
+        provincial = self.provincial_schedule(income)
 
         if period == "monthly":
             federal /= 12
@@ -88,33 +100,9 @@ class IncomeTaxEngine:
         total = 0.0
         details = {}
 
-        # CPP / QPP
-        for system in ["cpp", "qpp"]:
-            config = self.payroll_data.get(system, {})
-            if not config.get("enabled"):
-                continue
-
-            base_income = max(0, income - config.get("basic_exemption", 0))
-            contribution = 0.0
-
-            for rate in config.get("rates", []):
-                limit = rate["up_to"]
-                r = rate["rate"]
-
-                taxable = min(base_income, limit)
-                contribution += taxable * r
-
-            total += contribution
-            details[system] = contribution
-
-        # EI / QPIP
-        for system in ["ei", "qpip"]:
-            config = self.payroll_data.get(system, {})
-            if not config.get("enabled"):
-                continue
-
-            insurable = min(income, config.get("max_insurable_earnings", income))
-            contribution = insurable * config["rate"]
+        # CPP / QPP, then EI / QPIP
+        for system, schedule in self.payroll_schedules.items():
+            contribution = schedule(income)
 
             total += contribution
             details[system] = contribution
@@ -153,4 +141,101 @@ class IncomeTaxEngine:
             "payroll": payroll,
             "total_deductions": total_deductions,
             "effective_rate": total_deductions / income
-        }
\ No newline at end of file
+        }
+
+    # =========================
+    # NET INCOME (BATCH)
+    # =========================
+    def calculate_net_income_batch(self, incomes, period: str = "monthly"):
+        """
+        Vectorized calculate_net_income: every value is an array
+        aligned with `incomes`, payroll is broken down per system.
+        """
+        incomes = np.asarray(incomes, dtype=float)
+
+        periods_per_year = 12 if period == "monthly" else 1
+        annual = incomes * periods_per_year
+
+        federal = self.federal_schedule.evaluate(annual) / periods_per_year
+        provincial = self.provincial_schedule.evaluate(annual) / periods_per_year
+
+        payroll = {}
+        payroll_total = np.zeros_like(incomes)
+
+        for system, schedule in self.payroll_schedules.items():
+            payroll[system] = schedule.evaluate(annual) / periods_per_year
+            payroll_total = payroll_total + payroll[system]
+
+        payroll["total"] = payroll_total
+
+        total_tax = federal + provincial
+        total_deductions = total_tax + payroll_total
+
+        positive = incomes > 0
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            effective_rate = np.where(positive, total_deductions / incomes, 0.0)
+
+        return {
+            "gross_income": incomes,
+            "net_income": incomes - total_deductions,
+            "federal_tax": federal,
+            "provincial_tax": provincial,
+            "total_tax": total_tax,
+            "payroll": payroll,
+            "total_deductions": total_deductions,
+            "effective_rate": effective_rate
+        }
+
+    def calculate_net_income_array(self, incomes, period: str = "monthly") -> np.ndarray:
+        """
+        Net income only, for arrays of any shape. Every deduction is
+        combined into one schedule, so this is a single searchsorted.
+        float32 incomes stay in float32.
+        """
+        if self._deduction_schedule is None:
+            self._deduction_schedule = BracketSchedule.combine(
+                self.federal_schedule,
+                self.provincial_schedule,
+                *self.payroll_schedules.values()
+            )
+
+        incomes = float_array(incomes)
+
+        periods_per_year = 12 if period == "monthly" else 1
+
+        return incomes - self._deduction_schedule.evaluate(incomes * periods_per_year) / periods_per_year
+
+    # =========================
+    # INVERSE (NET -> GROSS)
+    # =========================
+    def required_gross_income(self, target_net, period: str = "monthly"):
+        """
+        Gross income whose net income equals `target_net`.
+        Exact inverse of calculate_net_income; accepts a scalar or an array.
+        """
+        if self._gross_schedule is None:
+            self._gross_schedule = gross_income_schedule(
+                self.federal_schedule,
+                self.provincial_schedule,
+                *self.payroll_schedules.values()
+            )
+
+        scalar = np.ndim(target_net) == 0
+        target = np.asarray(target_net, dtype=float)
+
+        periods_per_year = 12 if period == "monthly" else 1
+
+        gross = self._gross_schedule.evaluate(target * periods_per_year) / periods_per_year
+
+        # no deductions at or below zero
+        gross = np.where(target > 0, gross, target)
+
+        return float(gross) if scalar else gross
+
+
+def gross_income_schedule(*deduction_schedules) -> BracketSchedule:
+    """
+    Annual net -> annual gross, for the sum of every deduction schedule.
+    """
+    return BracketSchedule.combine(*deduction_schedules).inverse()
@@ -0,0 +1,150 @@
+# financial_simulator/core/tax/province_tensor.py
+
+from functools import lru_cache
+
+import numpy as np
+
+from financial_simulator.core.tax.expense_tax_engine import ExpenseTaxMatrix
+from financial_simulator.core.tax.income_tax_engine import gross_income_schedule
+from financial_simulator.data.province_model import load_provinces
+from financial_simulator.data.tax_store import DEFAULT_TAX_YEAR
+
+
+class StackedSchedules:
+    """
+    Several BracketSchedules padded to a common width, one row per province.
+    Padding thresholds are +inf so they are never selected.
+    """
+
+    def __init__(self, schedules):
+
+        width = max(len(s.lowers) for s in schedules)
+
+        self.lowers = np.full((len(schedules), width), np.inf)
+        self.rates = np.zeros((len(schedules), width))
+        self.bases = np.zeros((len(schedules), width))
+
+        for row, schedule in enumerate(schedules):
+            n = len(schedule.lowers)
+            self.lowers[row, :n] = schedule.lower_array
+            self.rates[row, :n] = schedule.rate_array
+            self.bases[row, :n] = schedule.base_array
+
+    def evaluate(self, amounts: np.ndarray) -> np.ndarray:
+        """
+        (incomes,) -> (incomes, provinces)
+        """
+        index = (self.lowers[None, :, :] <= amounts[:, None, None]).sum(axis=2) - 1
+        index = np.maximum(index, 0)
+
+        rows = np.arange(self.lowers.shape[0])
+
+        tax = (
+            self.bases[rows, index]
+            + (amounts[:, None] - self.lowers[rows, index]) * self.rates[rows, index]
+        )
+
+        return np.where(amounts[:, None] > 0, tax, 0.0)
+
+
+class ProvinceTaxTensor:
+    """
+    Income tax, payroll and sales tax for every compiled Province at once.
+    Results are (incomes, provinces) arrays, or (provinces,) for a scalar income.
+    """
+
+    def __init__(self, provinces):
+
+        provinces = list(provinces)
+
+        self.provinces = tuple(province.key for province in provinces)
+
+        self.federal = StackedSchedules([province.federal for province in provinces])
+        self.provincial = StackedSchedules([province.provincial for province in provinces])
+
+        # all payroll systems of a province summed into one schedule
+        self.payroll = StackedSchedules([province.payroll.combined for province in provinces])
+
+        # net -> gross, every deduction combined
+        self.gross_income = StackedSchedules([
+            gross_income_schedule(
+                province.federal,
+                province.provincial,
+                *province.payroll.schedules.values()
+            )
+            for province in provinces
+        ])
+
+        self.expense_tax = ExpenseTaxMatrix.from_provinces(provinces)
+
+    def index(self, province: str) -> int:
+        return self.provinces.index(province.lower())
+
+    # =========================
+    # EVALUATION
+    # =========================
+    def evaluate(self, incomes, period: str = "monthly", expenses: dict | None = None) -> dict:
+
+        scalar = np.ndim(incomes) == 0
+        incomes = np.atleast_1d(np.asarray(incomes, dtype=float))
+
+        periods_per_year = 12 if period == "monthly" else 1
+        annual = incomes * periods_per_year
+
+        federal = self.federal.evaluate(annual) / periods_per_year
+        provincial = self.provincial.evaluate(annual) / periods_per_year
+        payroll = self.payroll.evaluate(annual) / periods_per_year
+
+        income_tax = federal + provincial
+        total_deductions = income_tax + payroll
+
+        gross = np.broadcast_to(incomes[:, None], total_deductions.shape)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            effective_rate = np.where(gross > 0, total_deductions / gross, 0.0)
+
+        result = {
+            "federal_tax": federal,
+            "provincial_tax": provincial,
+            "income_tax": income_tax,
+            "payroll": payroll,
+            "total_deductions": total_deductions,
+            "net_income": gross - total_deductions,
+            "effective_rate": effective_rate,
+        }
+
+        if scalar:
+            result = {key: value[0] for key, value in result.items()}
+
+        result["provinces"] = self.provinces
+        result["sales_tax"] = self.expense_tax.calculate_sales_tax(expenses)
+
+        return result
+
+
+    def required_gross_income(self, target_net, period: str = "monthly"):
+        """
+        Gross income needed in every province to reach `target_net`.
+        (targets, provinces) array, or (provinces,) for a scalar target.
+        """
+        scalar = np.ndim(target_net) == 0
+        target = np.atleast_1d(np.asarray(target_net, dtype=float))
+
+        periods_per_year = 12 if period == "monthly" else 1
+
+        gross = self.gross_income.evaluate(target * periods_per_year) / periods_per_year
+        gross = np.where(target[:, None] > 0, gross, target[:, None])
+
+        return gross[0] if scalar else gross
+
+
+def default_province_tensor(tax_year: int | None = None) -> ProvinceTaxTensor:
+    """
+    Tensor over the compiled provinces of a tax year, built on first use.
+    """
+    return _province_tensor(int(tax_year or DEFAULT_TAX_YEAR))
+
+
+@lru_cache(maxsize=None)
+def _province_tensor(tax_year: int) -> ProvinceTaxTensor:
+    return ProvinceTaxTensor(load_provinces(tax_year).values())
@@ -0,0 +1,43 @@
+# financial_simulator/core/tax/tax_cache.py
+
+import hashlib
+from functools import lru_cache
+
+from financial_simulator.core.cache import _MISSING, LRUCache
+
+
+class TaxResultCache(LRUCache):
+    """
+    LRU cache with optional TTL, shared by every tax engine.
+    Keys are built by the engines: (tax data fingerprint, income in cents, period).
+    """
+
+
+# =========================
+# SHARED INSTANCE
+# =========================
+TAX_CACHE = TaxResultCache()
+
+
+def configure_tax_cache(maxsize: int | None = None, ttl: float | None = _MISSING):
+    TAX_CACHE.configure(maxsize=maxsize, ttl=ttl)
+
+
+def tax_cache_stats() -> dict:
+    return TAX_CACHE.stats()
+
+
+# =========================
+# FINGERPRINT
+# =========================
+@lru_cache(maxsize=None)
+def tax_fingerprint(*schedules) -> str:
+    """
+    Content fingerprint of compiled schedules. Compiled schedules are
+    shared objects, so the result is memoized per schedule set.
+    """
+    content = repr([
+        (schedule.lowers, schedule.rates) for schedule in schedules
+    ])
+
+    return hashlib.sha256(content.encode()).hexdigest()[:16]
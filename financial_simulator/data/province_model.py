@@ -0,0 +1,349 @@
+# financial_simulator/data/province_model.py
+
+import hashlib
+import json
+import os
+import tempfile
+import zipfile
+from functools import lru_cache
+
+import numpy as np
+
+from financial_simulator.core.tax.brackets import BracketSchedule, compile_brackets, compile_payroll
+from financial_simulator.core.tax.expense_tax_engine import ExpenseCategoryIndex
+from financial_simulator.data.tax_store import (
+    DEFAULT_TAX_YEAR, available_tax_years, load_tax_year, snapshot_path, source_hash
+)
+
+# bump when the snapshot layout or validation changes
+SNAPSHOT_VERSION = 2
+
+
+# =========================
+# FROZEN BASE
+# =========================
+class _Frozen:
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def _set(self, **values):
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def _restore(cls, **values):
+        # rebuild from a snapshot without recompiling
+        instance = cls.__new__(cls)
+        instance._set(**values)
+        return instance
+
+
+# =========================
+# PAYROLL PROFILE
+# =========================
+class PayrollProfile(_Frozen):
+
+    __slots__ = ("key", "data", "schedules", "combined")
+
+    def __init__(self, key: str, data: dict):
+        schedules = compile_payroll(data)
+
+        self._set(
+            key=key,
+            data=data,
+            schedules=schedules,
+            combined=BracketSchedule.combine(*schedules.values()),
+        )
+
+    def __repr__(self):
+        return f"PayrollProfile({self.key!r})"
+
+
+# =========================
+# PROVINCE
+# =========================
+class Province(_Frozen):
+    """
+    Validated, compiled view of one PROVINCES_DATA entry.
+    `data` keeps the source dict for code that still reads it directly.
+    """
+
+    __slots__ = (
+        "key",
+        "tax_year",
+        "metadata",
+        "federal",
+        "provincial",
+        "payroll",
+        "combined_rate",
+        "category_rules",
+        "category_index",
+        "expense_rates",
+        "data",
+        "fingerprint",
+    )
+
+    def __init__(self, key: str, data: dict, payroll: PayrollProfile, category_index: ExpenseCategoryIndex):
+
+        self._set(
+            **self._source_fields(key, data),
+            federal=compile_brackets(data["income_tax"]["federal"]["brackets"]),
+            provincial=compile_brackets(data["income_tax"]["provincial"]["brackets"]),
+            payroll=payroll,
+            category_index=category_index,
+            expense_rates=_read_only(category_index.rates_for(data["expense_tax"])),
+            fingerprint=fingerprint(data, payroll.data),
+        )
+
+    @staticmethod
+    def _source_fields(key: str, data: dict) -> dict:
+        return {
+            "key": key,
+            "tax_year": data["metadata"]["tax_year"],
+            "metadata": dict(data["metadata"]),
+            "combined_rate": data["expense_tax"]["combined_rate"],
+            "category_rules": dict(data["expense_tax"]["category_rules"]),
+            "data": data,
+        }
+
+    def __repr__(self):
+        return f"Province({self.key!r}, tax_year={self.tax_year})"
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+def fingerprint(*sources) -> str:
+    """
+    Content hash of the source dicts, stable across processes.
+    """
+    content = json.dumps(sources, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(content.encode()).hexdigest()[:16]
+
+
+# =========================
+# VALIDATION
+# =========================
+def validate_province(key: str, data: dict, payroll_data: dict, tax_year: int | None = None):
+    """
+    `tax_year` is the year file the data was loaded from; when given,
+    the province's metadata must declare the same year.
+    """
+    for section in ["metadata", "income_tax", "expense_tax", "payroll_profile"]:
+        if section not in data:
+            raise ValueError(f"Province '{key}': missing '{section}'")
+
+    if tax_year is not None and data["metadata"].get("tax_year") != tax_year:
+        raise ValueError(
+            f"Province '{key}': metadata declares tax year {data['metadata'].get('tax_year')}, "
+            f"loaded as {tax_year}"
+        )
+
+    if data["payroll_profile"] not in payroll_data:
+        raise ValueError(f"Province '{key}': unknown payroll profile '{data['payroll_profile']}'")
+
+    for level in ["federal", "provincial"]:
+        brackets = data["income_tax"][level]["brackets"]
+        limits = [b["up_to"] for b in brackets if "up_to" in b]
+
+        if limits != sorted(limits):
+            raise ValueError(f"Province '{key}': {level} brackets are not sorted")
+
+        for bracket in brackets:
+            if not 0 <= bracket["rate"] < 1:
+                raise ValueError(f"Province '{key}': invalid {level} rate {bracket['rate']}")
+
+    expense = data["expense_tax"]
+    rates = [expense["combined_rate"], *expense["category_rules"].values()]
+
+    if any(not 0 <= rate < 1 for rate in rates):
+        raise ValueError(f"Province '{key}': invalid sales tax rate")
+
+
+# =========================
+# COMPILATION
+# =========================
+def compile_provinces(provinces_data: dict, payroll_data: dict, tax_year: int | None = None) -> dict:
+
+    for key, data in provinces_data.items():
+        validate_province(key, data, payroll_data, tax_year)
+
+    profiles = {key: PayrollProfile(key, data) for key, data in payroll_data.items()}
+    category_index = ExpenseCategoryIndex.for_provinces(provinces_data)
+
+    return {
+        key: Province(key, data, profiles[data["payroll_profile"]], category_index)
+        for key, data in provinces_data.items()
+    }
+
+
+# =========================
+# BINARY SNAPSHOT
+# =========================
+def write_snapshot(path, provinces: dict, source: str):
+    """
+    Store compiled provinces as flat arrays in one .npz file.
+    Every schedule is a slice [offsets[i]:offsets[i + 1]] of lowers/rates.
+    """
+    provinces = list(provinces.values())
+    profiles = {province.payroll.key: province.payroll for province in provinces}
+
+    names, schedules = [], []
+
+    for province in provinces:
+        names += [f"{province.key}/federal", f"{province.key}/provincial"]
+        schedules += [province.federal, province.provincial]
+
+    for key, profile in profiles.items():
+        for system, schedule in profile.schedules.items():
+            names.append(f"payroll/{key}/{system}")
+            schedules.append(schedule)
+
+        names.append(f"combined/{key}")
+        schedules.append(profile.combined)
+
+    offsets = np.cumsum([0] + [len(schedule.lowers) for schedule in schedules])
+
+    arrays = {
+        "version": np.array(SNAPSHOT_VERSION),
+        "source_hash": np.array(source),
+        "provinces": np.array([province.key for province in provinces]),
+        "payroll_profiles": np.array([province.payroll.key for province in provinces]),
+        "fingerprints": np.array([province.fingerprint for province in provinces]),
+        "categories": np.array(provinces[0].category_index.categories),
+        "expense_rates": np.vstack([province.expense_rates for province in provinces]),
+        "schedule_names": np.array(names),
+        "schedule_offsets": offsets,
+        "schedule_lowers": np.concatenate([s.lower_array for s in schedules]),
+        "schedule_rates": np.concatenate([s.rate_array for s in schedules]),
+    }
+
+    # write then rename, so readers never see a partial file;
+    # mkstemp creates it 0600, snapshots are read by every user
+    handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(handle, "wb") as file:
+            np.savez(file, **arrays)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def read_snapshot(path, source: str, provinces_data: dict, payroll_data: dict) -> dict | None:
+    """
+    Compiled provinces from a snapshot, or None when it is missing,
+    unreadable or built from another version of the data file.
+    """
+    try:
+        with np.load(path, allow_pickle=False) as snapshot:
+            if int(snapshot["version"]) != SNAPSHOT_VERSION or str(snapshot["source_hash"]) != source:
+                return None
+            arrays = {name: snapshot[name] for name in snapshot.files}
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        return None
+
+    offsets = arrays["schedule_offsets"]
+    lowers, rates = arrays["schedule_lowers"], arrays["schedule_rates"]
+
+    shared = {}
+    schedules = {}
+
+    for i, name in enumerate(arrays["schedule_names"].tolist()):
+        table = (tuple(lowers[offsets[i]:offsets[i + 1]]), tuple(rates[offsets[i]:offsets[i + 1]]))
+
+        # identical tables share one schedule, as compile_brackets does
+        if table not in shared:
+            shared[table] = BracketSchedule(*table)
+        schedules[name] = shared[table]
+
+    profiles = {}
+    for key in set(arrays["payroll_profiles"].tolist()):
+        prefix = f"payroll/{key}/"
+        profiles[key] = PayrollProfile._restore(
+            key=key,
+            data=payroll_data[key],
+            schedules={
+                name[len(prefix):]: schedule
+                for name, schedule in schedules.items() if name.startswith(prefix)
+            },
+            combined=schedules[f"combined/{key}"],
+        )
+
+    category_index = ExpenseCategoryIndex(arrays["categories"].tolist())
+
+    provinces = {}
+    for row, key in enumerate(arrays["provinces"].tolist()):
+        provinces[key] = Province._restore(
+            **Province._source_fields(key, provinces_data[key]),
+            federal=schedules[f"{key}/federal"],
+            provincial=schedules[f"{key}/provincial"],
+            payroll=profiles[arrays["payroll_profiles"][row]],
+            category_index=category_index,
+            expense_rates=_read_only(arrays["expense_rates"][row].copy()),
+            fingerprint=str(arrays["fingerprints"][row]),
+        )
+
+    return provinces
+
+
+# =========================
+# TAX YEARS
+# =========================
+def load_provinces(tax_year: int | None = None) -> dict:
+    """
+    Compiled provinces of one tax year, loaded on first use: from its
+    snapshot when one is current, compiled otherwise. Loading never
+    writes; snapshots come from build_snapshots.
+    """
+    return _load_provinces(int(tax_year or DEFAULT_TAX_YEAR))
+
+
+@lru_cache(maxsize=None)
+def _load_provinces(tax_year: int) -> dict:
+
+    provinces_data, payroll_data = load_tax_year(tax_year)
+
+    provinces = read_snapshot(snapshot_path(tax_year), source_hash(tax_year), provinces_data, payroll_data)
+
+    if provinces is None:
+        provinces = compile_provinces(provinces_data, payroll_data, tax_year)
+
+    return provinces
+
+
+def build_snapshots(tax_years=None) -> list:
+    """
+    Compile and write the snapshot of each tax year, every available
+    year by default. Returns the written paths.
+    """
+    paths = []
+
+    for tax_year in tax_years or available_tax_years():
+        provinces_data, payroll_data = load_tax_year(tax_year)
+        path = snapshot_path(tax_year)
+
+        write_snapshot(path, compile_provinces(provinces_data, payroll_data, tax_year), source_hash(tax_year))
+        paths.append(path)
+
+    return paths
+
+
+# default tax year, loaded at import
+PROVINCES = load_provinces(DEFAULT_TAX_YEAR)
+
+
+def get_province(key: str, tax_year: int | None = None) -> Province:
+
+    province = load_provinces(tax_year).get(key.lower())
+
+    if province is None:
+        raise ValueError(f"Invalid province: {key}")
+
+    return province
@@ -0,0 +1,66 @@
+# financial_simulator/data/tax_store.py
+
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+
+TAX_YEARS_DIR = Path(__file__).parent / "tax_years"
+
+DEFAULT_TAX_YEAR = 2026
+
+
+# =========================
+# DISCOVERY
+# =========================
+def available_tax_years() -> tuple:
+    """
+    Tax years with a data file, oldest first.
+    """
+    return tuple(sorted(int(path.stem) for path in TAX_YEARS_DIR.glob("*.json") if path.stem.isdigit()))
+
+
+def tax_year_path(tax_year: int) -> Path:
+
+    path = TAX_YEARS_DIR / f"{int(tax_year)}.json"
+
+    if not path.exists():
+        raise ValueError(f"No tax data for year {tax_year}")
+
+    return path
+
+
+def snapshot_path(tax_year: int) -> Path:
+    return TAX_YEARS_DIR / f"{int(tax_year)}.npz"
+
+
+# =========================
+# LOADING
+# =========================
+@lru_cache(maxsize=None)
+def _read_tax_year(tax_year: int) -> tuple:
+
+    raw = tax_year_path(tax_year).read_bytes()
+    document = json.loads(raw)
+
+    if document.get("tax_year") != tax_year:
+        raise ValueError(f"Tax data file for {tax_year} declares year {document.get('tax_year')}")
+
+    source_hash = hashlib.sha256(raw).hexdigest()[:16]
+
+    return document["provinces"], document["payroll"], source_hash
+
+
+def load_tax_year(tax_year: int | None = None) -> tuple:
+    """
+    (provinces_data, payroll_data) for one tax year, parsed once per process.
+    """
+    provinces_data, payroll_data, _ = _read_tax_year(int(tax_year or DEFAULT_TAX_YEAR))
+    return provinces_data, payroll_data
+
+
+def source_hash(tax_year: int) -> str:
+    """
+    Hash of the data file, used to detect stale snapshots.
+    """
+    return _read_tax_year(int(tax_year))[2]
@@ -58,6 +58,28 @@ class Simulation(Base):
         cascade="all, delete-orphan"
     )
 
+    @classmethod
+    def from_inputs(cls, user_id: int, inputs, results: dict | None = None) -> "Simulation":
+        """
+        Row for one simulation of `inputs`. inputs_hash is the canonical
+        inputs fingerprint, the key of the Monte Carlo result cache, so the
+        (user, inputs) constraint catches repeats whatever the expense order.
+        """
+        return cls(
+            user_id=user_id,
+            inputs_hash=inputs.fingerprint(),
+            province=inputs.context.province,
+            inputs=inputs.to_dict(),
+            results=results,
+            initial_savings=inputs.profile.initial_savings,
+            one_time_cost=inputs.config.one_time_cost,
+            monthly_income=inputs.profile.monthly_income,
+            monthly_expenses=inputs.get_total_expenses(),
+            months=inputs.config.months,
+            savings_goal=inputs.config.savings_goal,
+            months_without_income=inputs.config.months_without_income,
+        )
+
 
 class SimulationResult(Base):
 
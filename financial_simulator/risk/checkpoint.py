@@ -0,0 +1,58 @@
+# financial_simulator/risk/checkpoint.py
+
+import os
+import tempfile
+import zipfile
+
+import numpy as np
+
+CHECKPOINT_VERSION = 1
+
+
+def write_checkpoint(path, job: str, entropy: int, next_chunk: int, arrays: dict):
+    """
+    Store a Monte Carlo job's progress in one .npz file: the root seed
+    entropy, the next chunk to run and the running reductions.
+    """
+    arrays = {
+        **arrays,
+        "version": np.array(CHECKPOINT_VERSION),
+        "job": np.array(job),
+        # 128-bit entropy does not fit an integer array
+        "entropy": np.array(str(entropy)),
+        "next_chunk": np.array(next_chunk),
+    }
+
+    # write then rename, so a crash never leaves a partial checkpoint
+    handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(handle, "wb") as file:
+            np.savez(file, **arrays)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def read_checkpoint(path, job: str) -> tuple | None:
+    """
+    (entropy, next_chunk, arrays) from a checkpoint, or None when it is
+    missing, unreadable or was written by another job.
+    """
+    try:
+        with np.load(path, allow_pickle=False) as checkpoint:
+            if int(checkpoint["version"]) != CHECKPOINT_VERSION or str(checkpoint["job"]) != job:
+                return None
+            arrays = {name: checkpoint[name] for name in checkpoint.files}
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        return None
+
+    return int(str(arrays.pop("entropy"))), int(arrays.pop("next_chunk")), arrays
+
+
+def remove_checkpoint(path):
+
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,79 @@
+# financial_simulator/risk/expense_model.py
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from financial_simulator.risk.samplers import normal_quantile
+
+
+@dataclass(frozen=True)
+class ExpenseModel:
+    """
+    Correlated whole-horizon shocks per expense category.
+    Volatilities are standard deviations of a mean-one log-normal factor;
+    categories not listed use `volatility`, pairs not listed use `correlation`.
+    """
+
+    volatility: float = 0.05
+    correlation: float = 0.0
+
+    # {"rent": 0.03, ...} and {("rent", "groceries"): 0.4, ...}
+    volatilities: dict = field(default_factory=dict)
+    correlations: dict = field(default_factory=dict)
+
+    def __post_init__(self):
+
+        for name, value in [("volatility", self.volatility), *self.volatilities.items()]:
+            if value < 0:
+                raise ValueError(f"Invalid volatility for {name}")
+
+        for pair, value in [("correlation", self.correlation), *self.correlations.items()]:
+            if not -1 <= value <= 1:
+                raise ValueError(f"Invalid correlation for {pair}")
+
+    # =========================
+    # COVARIANCE
+    # =========================
+    def correlation_matrix(self, categories) -> np.ndarray:
+
+        categories = list(categories)
+        matrix = np.full((len(categories), len(categories)), float(self.correlation))
+
+        for (first, second), value in self.correlations.items():
+            if first in categories and second in categories:
+                i, j = categories.index(first), categories.index(second)
+                matrix[i, j] = matrix[j, i] = value
+
+        np.fill_diagonal(matrix, 1.0)
+
+        return matrix
+
+    def cholesky(self, categories) -> np.ndarray:
+        """
+        Lower-triangular factor of the (categories, categories) covariance
+        of the log shocks, computed once per simulator.
+        """
+        categories = list(categories)
+        volatilities = np.array([self.volatilities.get(c, self.volatility) for c in categories])
+
+        try:
+            factor = np.linalg.cholesky(self.correlation_matrix(categories))
+        except np.linalg.LinAlgError:
+            raise ValueError("Expense correlations are not positive definite") from None
+
+        # scaling the rows keeps zero volatilities valid
+        return volatilities[:, None] * factor
+
+    # =========================
+    # SHOCKS
+    # =========================
+    @staticmethod
+    def factors(cholesky: np.ndarray, draws: np.ndarray) -> np.ndarray:
+        """
+        (categories, runs) draws on [0, 1) -> (runs, categories) mean-one factors.
+        """
+        shocks = normal_quantile(draws).T @ cholesky.T
+        variances = np.square(cholesky).sum(axis=1)
+
+        return np.exp(shocks - variances / 2)
@@ -0,0 +1,133 @@
+# financial_simulator/risk/importance.py
+
+from dataclasses import dataclass
+
+import numpy as np
+
+# tilts are kept inside [-MAX_TILT, MAX_TILT]
+MAX_TILT = 30.0
+
+# defensive mixture: share of uniform density kept in each tilted row,
+# so every likelihood ratio is at most 1 / DEFENSIVE_SHARE ** rows
+DEFENSIVE_SHARE = 0.2
+
+# cross-entropy pilot: runs per round, rounds, and the elite fraction
+PILOT_RUNS = 2048
+PILOT_ROUNDS = 5
+ELITE_FRACTION = 0.1
+
+
+# =========================
+# TILTED UNIFORM
+# =========================
+# Density theta * exp(theta * u) / (exp(theta) - 1) on [0, 1]:
+# theta < 0 pushes draws toward 0, theta > 0 toward 1, theta = 0 is uniform.
+
+def tilted_density(u: np.ndarray, theta: float) -> np.ndarray:
+
+    if theta == 0:
+        return np.ones_like(u)
+
+    return theta * np.exp(theta * u) / np.expm1(theta)
+
+
+def tilted_mean(theta: float) -> float:
+
+    if abs(theta) < 1e-6:
+        return 0.5 + theta / 12
+
+    return -1 / np.expm1(-theta) - 1 / theta
+
+
+def tilt_for_mean(mean: float) -> float:
+    """
+    The tilt whose density has the given mean, by bisection.
+    """
+    low, high = -MAX_TILT, MAX_TILT
+
+    for _ in range(60):
+        middle = (low + high) / 2
+
+        if tilted_mean(middle) < mean:
+            low = middle
+        else:
+            high = middle
+
+    return (low + high) / 2
+
+
+@dataclass(frozen=True)
+class TailTilt:
+    """
+    Exponential tilt of each draw row, mixed with the uniform density so
+    the likelihood ratios stay bounded. `thetas[i]` tilts row i: income,
+    then the expense row or every expense category row. Rows past the
+    end of `thetas`, and zero tilts, are left untilted.
+    """
+
+    thetas: tuple = ()
+    share: float = DEFENSIVE_SHARE
+
+    def density(self, u: np.ndarray, theta: float) -> np.ndarray:
+        return self.share + (1 - self.share) * tilted_density(u, theta)
+
+    def transform(self, draws: np.ndarray) -> tuple:
+        """
+        Maps (dims, n) uniform draws to tilted draws by inverting the mixture
+        CDF, so stratified and common draws stay stratified and common.
+        Returns the tilted draws and their likelihood ratios.
+        """
+        tilted = np.array(draws, dtype=float)
+        weights = np.ones(tilted.shape[1])
+
+        for row, theta in enumerate(self.thetas):
+            if theta == 0:
+                continue
+
+            # mixture CDF is increasing on [0, 1]: bisection to double precision
+            target = tilted[row]
+            low, high = np.zeros_like(target), np.ones_like(target)
+
+            for _ in range(52):
+                middle = (low + high) / 2
+                cdf = self.share * middle + (1 - self.share) * np.expm1(theta * middle) / np.expm1(theta)
+                below = cdf < target
+                low = np.where(below, middle, low)
+                high = np.where(below, high, middle)
+
+            tilted[row] = (low + high) / 2
+            weights /= self.density(tilted[row], theta)
+
+        return tilted, weights
+
+
+def fit_tail_tilt(final_balances, goal: float, seed: np.random.SeedSequence,
+                  runs: int = PILOT_RUNS, rounds: int = PILOT_ROUNDS,
+                  elite_fraction: float = ELITE_FRACTION, dims: int = 2) -> TailTilt:
+    """
+    Cross-entropy fit of the tilt toward runs that miss `goal`.
+    `final_balances(draws, rng)` maps (dims, n) draws to n final balances,
+    using `rng` for anything beyond the draws. Each round moves the elite
+    level down toward the goal and refits the tilt to the
+    likelihood-weighted elite runs.
+    """
+    rng = np.random.default_rng(seed)
+    tilt = TailTilt()
+
+    for _ in range(rounds):
+        draws, weights = tilt.transform(rng.random((dims, runs)))
+        balances = final_balances(draws, rng)
+
+        level = max(np.quantile(balances, elite_fraction), goal)
+        elite = balances <= level
+
+        if not elite.any() or weights[elite].sum() == 0:
+            break
+
+        means = draws[:, elite] @ weights[elite] / weights[elite].sum()
+        tilt = TailTilt(tuple(tilt_for_mean(mean) for mean in means))
+
+        if level <= goal:
+            break
+
+    return tilt
@@ -1,11 +1,47 @@
 # financial_simulator/risk/monte_carlo.py
 
-import random
-from dataclasses import dataclass
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from copy import deepcopy
 
-from financial_simulator.core.projection import run_projection
+import numpy as np
+
+from financial_simulator.core.batch_engine import BatchProjectionEngine
+from financial_simulator.core.engine import first_month_below
+from financial_simulator.core.projection import build_cashflows
 from financial_simulator.core.inputs.simulation_inputs import SimulationInputs
+from financial_simulator.core.tax.expense_tax_engine import ExpenseTaxEngine
+from financial_simulator.core.tax.income_tax_engine import IncomeTaxEngine
+from financial_simulator.data.province_model import fingerprint, get_province
+from financial_simulator.risk.checkpoint import read_checkpoint, remove_checkpoint, write_checkpoint
+from financial_simulator.risk.expense_model import ExpenseModel
+from financial_simulator.risk.importance import fit_tail_tilt
+from financial_simulator.risk.path_model import PathModel
+from financial_simulator.risk.samplers import SOBOL_MAX_DIMS, get_sampler
+from financial_simulator.risk.sketches import QuantileSketch, RunningStats
+
+MODES = ("loop", "vectorized")
+EXECUTORS = ("process", "thread")
+DTYPES = ("float64", "float32")
+
+# runs per seeded chunk; fixed so results do not depend on the worker count
+CHUNK_SIZE = 4096
+
+# adaptive runs: first chunk size, then the total doubles every step
+ADAPTIVE_FIRST_CHUNK = 32
+
+# 95% normal quantile for the Wilson interval
+WILSON_Z = 1.959963984540054
+
+# balance bands reported per month
+FAN_LEVELS = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+# extra seed word for the tail-risk pilot, apart from the chunk streams
+PILOT_STREAM = 0x7A11
+
+# chunks between two checkpoint writes
+CHECKPOINT_EVERY = 16
 
 
 @dataclass
@@ -15,6 +51,14 @@ class MonteCarloResult:
     worst_balance: float
     average_final_balance: float
     simulations_run: int
+    success_std_error: float = 0.0
+    final_balance_std: float = 0.0
+    confidence_interval: tuple | None = None
+
+    # per-month balance quantiles keyed "p5" ... "p95", and the share of
+    # runs that never went below zero up to each month (vectorized mode only)
+    balance_bands: dict | None = field(default=None, compare=False, repr=False)
+    survival_curve: np.ndarray | None = field(default=None, compare=False, repr=False)
 
 
 class MonteCarloSimulator:
@@ -25,66 +69,743 @@ class MonteCarloSimulator:
         runs: int = 200,
         income_volatility: float = 0.15,
         expense_volatility: float = 0.10,
+        mode: str = "vectorized",
+        seed: int | None = None,
+        workers: int = 1,
+        executor: str = "process",
+        sampler: str = "uniform",
+        target_width: float | None = None,
+        time_budget: float | None = None,
+        path_model: PathModel | None = None,
+        tail_risk: bool = False,
+        expense_model: ExpenseModel | None = None,
+        checkpoint: str | None = None,
+        checkpoint_every: int = CHECKPOINT_EVERY,
+        dtype: str = "float64",
     ):
+        get_sampler(sampler)
+
+        if mode not in MODES:
+            raise ValueError(f"Unknown Monte Carlo mode: {mode}")
+
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor: {executor}")
+
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        if mode == "loop" and (target_width is not None or time_budget is not None):
+            raise ValueError("Adaptive stopping requires the vectorized mode")
+
+        if mode == "loop" and path_model is not None:
+            raise ValueError("Month-level paths require the vectorized mode")
+
+        if tail_risk and mode == "loop":
+            raise ValueError("Tail-risk runs require the vectorized mode")
+
+        if tail_risk and (target_width is not None or time_budget is not None):
+            raise ValueError("Adaptive stopping does not support tail-risk runs")
+
+        if expense_model is not None and not inputs.profile.expenses:
+            raise ValueError("Category shocks need an itemized expense budget")
+
+        # shocked budgets are expressed relative to the total, which must not be zero
+        if expense_model is not None and sum(inputs.profile.expenses.values()) <= 0:
+            raise ValueError("Category shocks need a positive expense budget")
+
+        # one draw row per category, and the Sobol table has a fixed number of rows
+        if sampler == "sobol" and expense_model is not None and 1 + len(inputs.profile.expenses) > SOBOL_MAX_DIMS:
+            raise ValueError(
+                f"Sobol sampler supports at most {SOBOL_MAX_DIMS - 1} expense categories; "
+                "use latin_hypercube for larger budgets"
+            )
+
+        if checkpoint is not None and (mode == "loop" or target_width is not None or time_budget is not None):
+            raise ValueError("Checkpoints require a fixed-size vectorized run")
+
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be at least 1")
+
+        if dtype not in DTYPES:
+            raise ValueError(f"Unknown dtype: {dtype}")
+
+        if dtype != "float64" and path_model is None:
+            raise ValueError("Reduced precision applies to month-level paths only")
+
         self.inputs = inputs
         self.runs = runs
         self.income_volatility = income_volatility
         self.expense_volatility = expense_volatility
 
-    def _randomize_inputs(self) -> SimulationInputs:
+        # "vectorized": all runs as arrays, "loop": one copy of the inputs per run
+        self.mode = mode
 
-        new_inputs = deepcopy(self.inputs)
+        # same seed, same draws: in both modes and for any worker count
+        self.seed = seed
 
-        income_variation = random.uniform(
-            -self.income_volatility,
-            self.income_volatility
-        )
+        # "uniform", "antithetic", "latin_hypercube" or "sobol"
+        self.sampler = sampler
+
+        # vectorized chunks are spread over `workers` processes or threads
+        self.workers = workers
+        self.executor = executor
+
+        # adaptive: stop before `runs` once the 95% interval on the success
+        # rate is narrower than `target_width`, or `time_budget` seconds passed
+        self.target_width = target_width
+        self.time_budget = time_budget
+
+        # month-level shocks, job loss and one-off expenses on top of the
+        # whole-horizon variations; None keeps constant monthly cashflows
+        self.path_model = path_model
+
+        # importance sampling: draws tilted toward low income and high
+        # expenses, reweighted so the failure rate stays unbiased
+        self.tail_risk = tail_risk
+
+        # correlated shocks per expense category, replacing the single
+        # expense variation (and `expense_volatility`) when set
+        self.expense_model = expense_model
+
+        # long jobs: running reductions saved to `checkpoint` every
+        # `checkpoint_every` chunks, resumed from it after a restart
+        self.checkpoint = checkpoint
+        self.checkpoint_every = checkpoint_every
+
+        # "float32" halves the memory of month-level paths, so a worker fits
+        # twice the runs; balances stay within dollars of the float64 ones
+        self.dtype = dtype
+
+    @property
+    def dims(self) -> int:
+        """
+        Rows of the draw matrix: income, then expenses or one per category
+        in sorted category order.
+        """
+        if self.expense_model is None:
+            return 2
+
+        return 1 + len(self.inputs.profile.expenses)
+
+    def fingerprint(self) -> str:
+        """
+        Inputs fingerprint plus every parameter that changes the result.
+        Workers, executor and checkpointing do not, so they are left out.
+        """
+        expense_model = self.expense_model
+
+        return fingerprint({
+            "inputs": self.inputs.fingerprint(),
+            "runs": int(self.runs),
+            "income_volatility": float(self.income_volatility),
+            "expense_volatility": float(self.expense_volatility),
+            "mode": self.mode,
+            "seed": None if self.seed is None else int(self.seed),
+            "sampler": self.sampler,
+            "target_width": self.target_width,
+            "time_budget": self.time_budget,
+            "tail_risk": self.tail_risk,
+            "path_model": asdict(self.path_model) if self.path_model else None,
+            "dtype": self.dtype,
+            "expense_model": {
+                "volatility": expense_model.volatility,
+                "correlation": expense_model.correlation,
+                "volatilities": expense_model.volatilities,
+                "correlations": sorted(
+                    [*sorted(pair), value] for pair, value in expense_model.correlations.items()
+                ),
+            } if expense_model else None,
+        })
+
+    def run(self, draws: np.ndarray | None = None) -> MonteCarloResult:
+        """
+        `draws` is an optional (dims, runs) matrix from draw_matrix, shared
+        between simulators to compare scenarios on common random numbers.
+        """
+        if draws is not None and np.shape(draws) != (self.dims, self.runs):
+            raise ValueError(f"Expected draws of shape ({self.dims}, {self.runs})")
+
+        if draws is not None and self.checkpoint is not None:
+            raise ValueError("Checkpointed runs draw their own numbers")
+
+        adaptive = self.target_width is not None or self.time_budget is not None
+
+        bands = survival = None
+
+        # a checkpointed job keeps its root entropy, so even an unseeded
+        # job resumes on the streams it started with
+        seed, resume = self.seed, None
+
+        if self.checkpoint is not None:
+            resume = read_checkpoint(self.checkpoint, self.fingerprint())
+            seed = resume[0] if resume else np.random.SeedSequence(self.seed).entropy
+
+        if self.mode == "loop":
+            summary = ChunkSummary(self._run_loop(draws), self.inputs.config.savings_goal)
+        else:
+            kernel = RunKernel.from_simulator(self)
 
-        expense_variation = random.uniform(
-            -self.expense_volatility,
-            self.expense_volatility
+            if self.tail_risk:
+                kernel.tilt = fit_tail_tilt(
+                    kernel.draw_final_balances,
+                    self.inputs.config.savings_goal,
+                    pilot_seed(seed),
+                    dims=self.dims
+                )
+
+            if self.checkpoint is not None:
+                summary = self._run_checkpointed(kernel, seed, resume)
+            else:
+                if adaptive and draws is None:
+                    chunks = self._run_adaptive(kernel)
+                else:
+                    chunks = self._run_vectorized(kernel, draws)
+
+                # chunks are folded in as they arrive: memory is fixed
+                # by the chunk size, not by the number of runs
+                summary = ChunkSummary.combine(chunks)
+
+            bands = dict(zip(
+                (f"p{round(level * 100)}" for level in FAN_LEVELS),
+                kernel.balance_bands(summary.sketch, FAN_LEVELS)
+            ))
+            survival = summary.survival_curve()
+
+        balances = summary.balances
+        runs = balances.count
+
+        if self.tail_risk:
+            # likelihood-weighted failures: unbiased, with a normal interval
+            failures = summary.failures
+
+            success_rate = 1 - failures.mean
+            std_error = float(np.sqrt(failures.variance(ddof=1) / runs)) if runs > 1 else 0.0
+            interval = (
+                float(max(success_rate - WILSON_Z * std_error, 0.0)),
+                float(min(success_rate + WILSON_Z * std_error, 1.0))
+            )
+        else:
+            success_rate = summary.successes / runs
+            std_error = summary.success_std_error(self.sampler)
+            interval = wilson_interval(summary.successes, runs)
+
+        failure_rate = 1 - success_rate
+
+        return MonteCarloResult(
+            success_rate=success_rate,
+            failure_rate=failure_rate,
+            worst_balance=balances.minimum,
+            average_final_balance=balances.mean,
+            simulations_run=runs,
+            success_std_error=std_error,
+            final_balance_std=balances.std(),
+            confidence_interval=interval,
+            balance_bands=bands,
+            survival_curve=survival
         )
 
+    # =========================
+    # VECTORIZED
+    # =========================
+    def _run_vectorized(self, kernel, draws=None, seed=None, start: int = 0):
+        """
+        Yields chunk summaries in chunk order, from chunk `start` on.
+        `seed` overrides the simulator's root seed.
+        """
+        seeds, sizes = chunk_seeds(self.runs, self.seed if seed is None else seed)
+        seeds, sizes = seeds[start:], sizes[start:]
+
+        if draws is None:
+            slices = [None] * len(sizes)
+        else:
+            starts = np.cumsum([0] + sizes[:-1])
+            slices = [draws[:, a:a + n] for a, n in zip(starts, sizes)]
+
+        if self.workers > 1 and len(sizes) > 1:
+            pool_class = ProcessPoolExecutor if self.executor == "process" else ThreadPoolExecutor
+
+            # map yields in submission order, so the merge does not
+            # depend on which worker finishes first
+            with pool_class(max_workers=self.workers) as pool:
+                yield from pool.map(kernel.simulate_chunk, seeds, sizes, slices)
+        else:
+            for chunk in zip(seeds, sizes, slices):
+                yield kernel.simulate_chunk(*chunk)
+
+    # =========================
+    # CHECKPOINTS
+    # =========================
+    def _run_checkpointed(self, kernel, seed: int, resume=None) -> "ChunkSummary":
+        """
+        Folds chunks like run() does, saving the running summary every
+        `checkpoint_every` chunks. Resumed summaries are restored bit for
+        bit, so the result equals an uninterrupted run.
+        """
+        job = self.fingerprint()
+        start, summary = 0, None
+
+        if resume is not None:
+            _, start, arrays = resume
+            summary = ChunkSummary.from_arrays(arrays)
+
+        for index, chunk in enumerate(self._run_vectorized(kernel, seed=seed, start=start), start + 1):
+            summary = chunk if summary is None else summary.merge(chunk)
+
+            if index % self.checkpoint_every == 0:
+                write_checkpoint(self.checkpoint, job, seed, index, summary.to_arrays())
+
+        # finished jobs leave nothing to resume
+        remove_checkpoint(self.checkpoint)
+
+        return summary
+
+    # =========================
+    # ADAPTIVE
+    # =========================
+    def _run_adaptive(self, kernel):
+        """
+        Yields chunk summaries until the interval or time target is met.
+        """
+        started = time.perf_counter()
+        seeds = np.random.SeedSequence(self.seed)
+
+        done = successes = 0
+
+        while done < self.runs:
+
+            # 32, 32, 64, 128, ... so the total doubles every step
+            size = min(max(ADAPTIVE_FIRST_CHUNK, done), CHUNK_SIZE, self.runs - done)
+
+            chunk = kernel.simulate_chunk(seeds.spawn(1)[0], size)
+
+            done += size
+            successes += chunk.successes
+
+            yield chunk
+
+            low, high = wilson_interval(successes, done)
+
+            if self.target_width is not None and high - low <= self.target_width:
+                break
+
+            if self.time_budget is not None and time.perf_counter() - started >= self.time_budget:
+                break
+
+    # =========================
+    # LOOP (REFERENCE)
+    # =========================
+    def _randomize_inputs(self, income_variation: float, expense_variation) -> SimulationInputs:
+        """
+        `expense_variation` is one variation for every category, or one
+        per category in sorted order when an expense model is set.
+        """
+        new_inputs = deepcopy(self.inputs)
+
         # ✅ FIX: accéder au profile
         new_inputs.profile.monthly_income *= (1 + income_variation)
 
-        if new_inputs.profile.monthly_expenses:
+        if new_inputs.profile.monthly_expenses and np.ndim(expense_variation) == 0:
             new_inputs.profile.monthly_expenses *= (1 + expense_variation)
 
         if new_inputs.profile.expenses:
-            for k in new_inputs.profile.expenses:
-                new_inputs.profile.expenses[k] *= (1 + expense_variation)
+            variations = np.broadcast_to(expense_variation, len(new_inputs.profile.expenses))
+            for k, variation in zip(sorted(new_inputs.profile.expenses), variations):
+                new_inputs.profile.expenses[k] *= (1 + variation)
 
         return new_inputs
 
-    def run(self) -> MonteCarloResult:
+    def _run_loop(self, draws=None) -> np.ndarray:
 
-        successes = 0
-        worst_balance = float("inf")
-        final_balances = []
+        if draws is None:
+            draws = draw_matrix(self.runs, self.seed, self.sampler, self.dims)
 
-        for _ in range(self.runs):
+        income_variations = self.income_volatility * (2 * draws[0] - 1)
 
-            randomized_inputs = self._randomize_inputs()
+        if self.expense_model is None:
+            expense_variations = self.expense_volatility * (2 * draws[1] - 1)
+        else:
+            cholesky = self.expense_model.cholesky(sorted(self.inputs.profile.expenses))
+            expense_variations = ExpenseModel.factors(cholesky, draws[1:]) - 1
 
-            result, _ = run_projection(randomized_inputs)
+        randomized = [
+            self._randomize_inputs(income_variation, expense_variation)
+            for income_variation, expense_variation in zip(income_variations, expense_variations)
+        ]
+        cashflows = [build_cashflows(inputs) for inputs in randomized]
 
-            final_balance = result.final_balance
-            final_balances.append(final_balance)
+        # all runs projected together, sales tax as a monthly adjustment
+        batch = BatchProjectionEngine(randomized).simulate(
+            monthly_income=[c["net_income"] for c in cashflows],
+            monthly_expenses=[c["expenses"] for c in cashflows],
+            monthly_adjustment=[-c["sales_tax"] for c in cashflows],
+            force=True
+        )
 
-            worst_balance = min(worst_balance, final_balance)
+        return batch.final_balance
 
-            if final_balance >= randomized_inputs.config.savings_goal:
-                successes += 1
 
-        success_rate = successes / self.runs
-        failure_rate = 1 - success_rate
-        average_final = sum(final_balances) / len(final_balances)
+class RunKernel:
+    """
+    Everything a chunk of vectorized runs needs, without the inputs.
+    Small and picklable so it can be shipped to worker processes.
+    """
 
-        return MonteCarloResult(
-            success_rate=success_rate,
-            failure_rate=failure_rate,
-            worst_balance=worst_balance,
-            average_final_balance=average_final,
-            simulations_run=self.runs
-        )
\ No newline at end of file
+    def __init__(self, income_engine, monthly_income, base_expenses, initial, months,
+                 income_volatility, expense_volatility, sampler="uniform",
+                 path_model=None, months_without_income=0, goal=0.0, tilt=None,
+                 expense_cholesky=None, taxed_budgets=None, dtype="float64"):
+        self.income_engine = income_engine
+        self.monthly_income = monthly_income
+        self.base_expenses = base_expenses
+        self.initial = initial
+        self.months = months
+        self.income_volatility = income_volatility
+        self.expense_volatility = expense_volatility
+        self.sampler = sampler
+        self.path_model = path_model
+        self.months_without_income = months_without_income
+        self.goal = goal
+
+        # TailTilt applied to every chunk's draws, set for tail-risk runs
+        self.tilt = tilt
+
+        # category shocks: Cholesky factor of the log-shock covariance and
+        # the budget of every category including its sales tax
+        self.expense_cholesky = expense_cholesky
+        self.taxed_budgets = taxed_budgets
+
+        # precision of the (runs, months) path arrays
+        self.dtype = np.dtype(dtype)
+
+    @property
+    def dims(self) -> int:
+
+        if self.expense_cholesky is None:
+            return 2
+
+        return 1 + len(self.expense_cholesky)
+
+    @classmethod
+    def from_simulator(cls, simulator: MonteCarloSimulator) -> "RunKernel":
+
+        inputs = simulator.inputs
+        province = get_province(inputs.context.province, inputs.context.tax_year)
+
+        # every expense category moves by the same factor,
+        # so expenses and the sales tax on them scale linearly
+        base = build_cashflows(inputs)
+
+        expense_cholesky = taxed_budgets = None
+
+        if simulator.expense_model is not None:
+            categories = sorted(inputs.profile.expenses)
+            budgets = np.array([inputs.profile.expenses[c] for c in categories], dtype=float)
+            rates = ExpenseTaxEngine.from_province(province).category_rates(categories)
+
+            # non-positive amounts are not taxed, as in ExpenseCategoryIndex.encode
+            taxed_budgets = budgets * (1 + np.where(budgets > 0, rates, 0.0))
+            expense_cholesky = simulator.expense_model.cholesky(categories)
+
+        return cls(
+            income_engine=IncomeTaxEngine.from_province(province),
+            monthly_income=inputs.profile.monthly_income,
+            base_expenses=base["expenses"] + base["sales_tax"],
+            initial=inputs.profile.initial_savings - inputs.config.one_time_cost,
+            months=inputs.config.months,
+            income_volatility=simulator.income_volatility,
+            expense_volatility=simulator.expense_volatility,
+            sampler=simulator.sampler,
+            path_model=simulator.path_model,
+            months_without_income=inputs.config.months_without_income,
+            goal=inputs.config.savings_goal,
+            expense_cholesky=expense_cholesky,
+            taxed_budgets=taxed_budgets,
+            dtype=simulator.dtype,
+        )
+
+    def simulate_chunk(self, seed: np.random.SeedSequence, size: int, draws=None) -> "ChunkSummary":
+        """
+        Runs one chunk. `draws` are the (dims, size) whole-horizon draws
+        on [0, 1), taken from the sampler when not given.
+        """
+        if draws is None:
+            draws = draw_uniforms(seed, self.sampler, size, self.dims)
+
+        weights = None
+
+        if self.tilt is not None:
+            draws, weights = self.tilt.transform(draws)
+
+        income_variation, expense_variation = self.variations(draws)
+
+        if self.path_model is None:
+            cashflow = self.monthly_cashflows(income_variation, expense_variation)
+
+            # balances are increasing in the cashflow every month,
+            # so its quantiles give the whole fan chart
+            sketch = QuantileSketch(1)
+            sketch.update(cashflow[:, None], weights)
+
+            ruin = first_month_below(self.initial, cashflow, 0.0, self.months)
+
+            return ChunkSummary(
+                self.initial + self.months * cashflow, self.goal, sketch, ruin, self.months, weights
+            )
+
+        # month-level shocks on a jumped copy of the chunk stream,
+        # independent of how many draws the sampler consumed
+        path_rng = np.random.Generator(np.random.PCG64(seed).jumped())
+
+        paths = self.balance_paths(income_variation, expense_variation, path_rng)
+
+        sketch = QuantileSketch(self.months)
+        sketch.update(paths, weights)
+
+        negative = paths < 0
+        ruin = np.where(negative.any(axis=1), negative.argmax(axis=1) + 1, 0)
+
+        return ChunkSummary(paths[:, -1], self.goal, sketch, ruin, self.months, weights)
+
+    def balance_bands(self, sketch: QuantileSketch, levels=FAN_LEVELS) -> np.ndarray:
+        """
+        (levels, months) balance quantiles from a merged chunk sketch.
+        """
+        quantiles = sketch.quantiles(levels)
+
+        if self.path_model is None:
+            return self.initial + np.arange(1, self.months + 1) * quantiles
+
+        return quantiles
+
+    def monthly_cashflows(self, income_variation: np.ndarray, expense_variation: np.ndarray) -> np.ndarray:
+        """
+        Constant monthly cashflow of every run, from its income and expense variations.
+        """
+        net_income = self.income_engine.calculate_net_income_array(
+            self.monthly_income * (1 + income_variation),
+            period="monthly"
+        )
+
+        return net_income - self.base_expenses * (1 + expense_variation)
+
+    def variations(self, draws: np.ndarray) -> tuple:
+        """
+        Income and expense variations from (dims, runs) draws on [0, 1).
+        """
+        income_variation = self.income_volatility * (2 * draws[0] - 1)
+
+        if self.expense_cholesky is None:
+            return income_variation, self.expense_volatility * (2 * draws[1] - 1)
+
+        # shocked category budgets through the compiled sales tax rates
+        factors = ExpenseModel.factors(self.expense_cholesky, draws[1:])
+
+        return income_variation, factors @ self.taxed_budgets / self.base_expenses - 1
+
+    def draw_final_balances(self, draws: np.ndarray, rng) -> np.ndarray:
+        """
+        Final balances for (dims, runs) draws, month-level shocks from `rng`.
+        """
+        if self.path_model is None:
+            return self.final_balances(*self.variations(draws))
+
+        return self.balance_paths(*self.variations(draws), rng)[:, -1]
+
+    def final_balances(self, income_variation: np.ndarray, expense_variation: np.ndarray) -> np.ndarray:
+        """
+        Final balance of every run, constant cashflow over the whole horizon.
+        """
+        return self.initial + self.months * self.monthly_cashflows(income_variation, expense_variation)
+
+    def balance_paths(self, income_variation: np.ndarray, expense_variation: np.ndarray, rng) -> np.ndarray:
+        """
+        (runs, months) end-of-month balances under the path model,
+        computed in the kernel's dtype.
+        """
+        model = self.path_model
+        dtype = self.dtype
+        shape = (len(income_variation), self.months)
+
+        gross = (
+            (self.monthly_income * (1 + income_variation)).astype(dtype)[:, None]
+            * model.income_factors(rng, shape, dtype)
+            * model.employment(rng, shape, self.months_without_income, dtype)
+        )
+
+        net_income = self.income_engine.calculate_net_income_array(gross, period="monthly")
+
+        monthly_expenses = (self.base_expenses * (1 + expense_variation)).astype(dtype)
+
+        expenses = (
+            monthly_expenses[:, None] * model.expense_factors(rng, shape, dtype)
+            + model.one_off_expenses(rng, shape, monthly_expenses, dtype)
+        )
+
+        # cumulating the cashflows alone keeps float32 rounding to the
+        # size of their sum rather than of the whole balance
+        return dtype.type(self.initial) + np.cumsum(net_income - expenses, axis=1)
+
+
+class ChunkSummary:
+    """
+    What a chunk of runs reports back: running statistics of the final
+    balances plus mergeable per-month statistics, so neither balances nor
+    paths are kept once the chunk is reduced.
+    """
+
+    __slots__ = ("balances", "successes", "failures", "pairs", "sketch", "ruin_counts")
+
+    def __init__(self, final_balances, goal: float, sketch: QuantileSketch | None = None,
+                 ruin_months=None, months: int = 0, weights=None):
+        success = np.asarray(final_balances) >= goal
+
+        # `weights` are likelihood ratios of tilted draws, None otherwise
+        self.balances = RunningStats.of(final_balances, weights)
+        self.successes = int(success.sum())
+        self.failures = RunningStats.of(~success if weights is None else weights * ~success)
+
+        # success averaged over adjacent runs, for antithetic pairs
+        self.pairs = RunningStats.of(success[:len(success) // 2 * 2].reshape(-1, 2).mean(axis=1))
+
+        self.sketch = sketch
+
+        # runs first below zero in each month, index 0 = never
+        self.ruin_counts = (
+            np.bincount(np.asarray(ruin_months, dtype=int), weights=weights, minlength=months + 1)
+            if ruin_months is not None else None
+        )
+
+    @classmethod
+    def combine(cls, chunks) -> "ChunkSummary":
+        """
+        Folds an iterable of chunk summaries into the first one.
+        """
+        chunks = iter(chunks)
+        combined = next(chunks)
+
+        for chunk in chunks:
+            combined.merge(chunk)
+
+        return combined
+
+    def merge(self, other: "ChunkSummary") -> "ChunkSummary":
+
+        self.balances.merge(other.balances)
+        self.successes += other.successes
+        self.failures.merge(other.failures)
+        self.pairs.merge(other.pairs)
+        self.sketch.merge(other.sketch)
+        self.ruin_counts = self.ruin_counts + other.ruin_counts
+
+        return self
+
+    # =========================
+    # STATE
+    # =========================
+    def to_arrays(self) -> dict:
+        return {
+            "balances": self.balances.to_array(),
+            "failures": self.failures.to_array(),
+            "pairs": self.pairs.to_array(),
+            "successes": np.array(self.successes),
+            "ruin_counts": self.ruin_counts,
+            **{f"sketch_{name}": array for name, array in self.sketch.to_arrays().items()},
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays: dict) -> "ChunkSummary":
+
+        summary = cls.__new__(cls)
+
+        summary.balances = RunningStats.from_array(arrays["balances"])
+        summary.failures = RunningStats.from_array(arrays["failures"])
+        summary.pairs = RunningStats.from_array(arrays["pairs"])
+        summary.successes = int(arrays["successes"])
+        summary.ruin_counts = np.array(arrays["ruin_counts"])
+        summary.sketch = QuantileSketch.from_arrays({
+            name[len("sketch_"):]: array for name, array in arrays.items() if name.startswith("sketch_")
+        })
+
+        return summary
+
+    def survival_curve(self) -> np.ndarray:
+        """
+        Share of runs that have not gone below zero by the end of each month.
+        """
+        return 1 - np.cumsum(self.ruin_counts[1:]) / self.ruin_counts.sum()
+
+    def success_std_error(self, sampler: str = "uniform") -> float:
+        """
+        Standard error of the success rate. Antithetic pairs are averaged
+        first; stratified samplers use the independent-runs formula, which
+        overstates their error.
+        """
+        if sampler == "antithetic" and self.pairs.count >= 2:
+            return float(np.sqrt(self.pairs.variance(ddof=1) / self.pairs.count))
+
+        rate = self.successes / self.balances.count
+        return float(np.sqrt(rate * (1 - rate) / self.balances.count))
+
+
+# =========================
+# RANDOM DRAWS
+# =========================
+def chunk_seeds(runs: int, seed: int | None = None) -> tuple:
+    """
+    One independent substream per chunk, spawned from the master seed.
+    """
+    sizes = [min(CHUNK_SIZE, runs - start) for start in range(0, runs, CHUNK_SIZE)]
+    return np.random.SeedSequence(seed).spawn(len(sizes)), sizes
+
+
+def pilot_seed(seed: int | None = None) -> np.random.SeedSequence:
+    """
+    Seed for the tail-risk pilot, independent of every chunk stream.
+    """
+    return np.random.SeedSequence(None if seed is None else [seed, PILOT_STREAM])
+
+
+def draw_uniforms(seed: np.random.SeedSequence, sampler: str, size: int, dims: int = 2) -> np.ndarray:
+    return get_sampler(sampler)(np.random.default_rng(seed), dims, size)
+
+
+def draw_matrix(runs: int, seed: int | None = None, sampler: str = "uniform", dims: int = 2) -> np.ndarray:
+    """
+    (dims, runs) draws on [0, 1), income row then expense rows, identical
+    to what a vectorized simulator with the same seed and sampler draws.
+    """
+    return np.concatenate(
+        [draw_uniforms(s, sampler, n, dims) for s, n in zip(*chunk_seeds(runs, seed))],
+        axis=1
+    )
+
+
+def wilson_interval(successes: int, runs: int, z: float = WILSON_Z) -> tuple:
+    """
+    Wilson score interval for a success rate; stays inside [0, 1]
+    and is meaningful even when every run succeeds or fails.
+    """
+    if runs == 0:
+        return (0.0, 1.0)
+
+    rate = successes / runs
+    denominator = 1 + z * z / runs
+
+    center = (rate + z * z / (2 * runs)) / denominator
+    half_width = z * np.sqrt(rate * (1 - rate) / runs + z * z / (4 * runs * runs)) / denominator
+
+    return (float(max(center - half_width, 0.0)), float(min(center + half_width, 1.0)))
+
+
+def compare_scenarios(inputs_list, runs: int = 200, seed: int | None = None, **options) -> list:
+    """
+    Monte Carlo for several scenarios on one shared draw matrix
+    (common random numbers): differences between the results come
+    from the scenarios, not from sampling noise.
+    """
+    simulators = [MonteCarloSimulator(inputs, runs=runs, seed=seed, **options) for inputs in inputs_list]
+
+    dims = max(simulator.dims for simulator in simulators)
+    draws = draw_matrix(runs, seed, options.get("sampler", "uniform"), dims)
+
+    return [simulator.run(draws=draws[:simulator.dims]) for simulator in simulators]
@@ -0,0 +1,89 @@
+# financial_simulator/risk/path_model.py
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class PathModel:
+    """
+    Month-by-month stochastic model for Monte Carlo paths.
+    Shocks are standard deviations of a mean-one monthly log-normal factor,
+    rates are monthly probabilities. Every method returns (runs, months) arrays,
+    of `dtype` for the random ones.
+    """
+
+    income_shock: float = 0.05
+    expense_shock: float = 0.05
+
+    # employed <-> unemployed Markov chain
+    job_loss_rate: float = 0.01
+    job_finding_rate: float = 0.20
+
+    # one-off expenses, mean size in months of regular expenses
+    one_off_rate: float = 0.03
+    one_off_scale: float = 1.0
+
+    def __post_init__(self):
+
+        for name in ["income_shock", "expense_shock", "one_off_scale"]:
+            if getattr(self, name) < 0:
+                raise ValueError(f"Invalid {name}")
+
+        for name in ["job_loss_rate", "job_finding_rate", "one_off_rate"]:
+            if not 0 <= getattr(self, name) <= 1:
+                raise ValueError(f"Invalid {name}")
+
+    # =========================
+    # SHOCKS
+    # =========================
+    @staticmethod
+    def _lognormal(rng, sigma: float, shape: tuple, dtype=np.float64) -> np.ndarray:
+
+        if sigma == 0:
+            return np.ones(shape, dtype=dtype)
+
+        return np.exp(sigma * rng.standard_normal(shape, dtype=dtype) - sigma * sigma / 2)
+
+    def income_factors(self, rng, shape: tuple, dtype=np.float64) -> np.ndarray:
+        return self._lognormal(rng, self.income_shock, shape, dtype)
+
+    def expense_factors(self, rng, shape: tuple, dtype=np.float64) -> np.ndarray:
+        return self._lognormal(rng, self.expense_shock, shape, dtype)
+
+    def one_off_expenses(self, rng, shape: tuple, monthly_expenses, dtype=np.float64) -> np.ndarray:
+        """
+        Exponentially sized one-off costs, each month with probability one_off_rate.
+        """
+        occurs = rng.random(shape, dtype=dtype) < self.one_off_rate
+        size = (
+            rng.standard_exponential(shape, dtype=dtype) * self.one_off_scale
+            * np.reshape(monthly_expenses, (-1, 1)).astype(dtype, copy=False)
+        )
+
+        return np.where(occurs, size, 0.0)
+
+    # =========================
+    # EMPLOYMENT
+    # =========================
+    def employment(self, rng, shape: tuple, months_without_income: int = 0, dtype=np.float64) -> np.ndarray:
+        """
+        True where the run has income. The first `months_without_income`
+        months have none, then the chain starts employed.
+        """
+        runs, months = shape
+
+        # float32 transitions halve the largest temporary
+        transitions = rng.random(shape, dtype=dtype)
+        employed = np.zeros(shape, dtype=bool)
+
+        state = np.ones(runs, dtype=bool)
+
+        for month in range(min(months_without_income, months), months):
+            if month > months_without_income:
+                u = transitions[:, month]
+                state = np.where(state, u >= self.job_loss_rate, u < self.job_finding_rate)
+            employed[:, month] = state
+
+        return employed
@@ -0,0 +1,230 @@
+# financial_simulator/risk/result_cache.py
+
+import json
+import sqlite3
+import time
+from contextlib import closing
+from dataclasses import fields, replace
+
+import numpy as np
+
+from financial_simulator.core.cache import LRUCache
+from financial_simulator.data.province_model import fingerprint
+from financial_simulator.risk.monte_carlo import MonteCarloResult, MonteCarloSimulator
+
+# bump when a change to the simulation makes cached results stale
+CACHE_VERSION = 1
+
+_MISSING = object()
+
+
+# =========================
+# KEYS
+# =========================
+def inputs_seed(inputs) -> int:
+    """
+    Deterministic seed for unseeded requests: the inputs fingerprint as an
+    integer, so identical inputs get identical draws and share a cache entry.
+    """
+    return int(inputs.fingerprint(), 16)
+
+
+def simulation_key(simulator: MonteCarloSimulator) -> str:
+    """
+    The simulator's fingerprint, tagged with the cache version.
+    """
+    return fingerprint({"version": CACHE_VERSION, "simulation": simulator.fingerprint()})
+
+
+# =========================
+# SERIALIZATION
+# =========================
+def result_to_dict(result: MonteCarloResult) -> dict:
+
+    data = {f.name: getattr(result, f.name) for f in fields(result)}
+
+    if result.balance_bands is not None:
+        data["balance_bands"] = {label: band.tolist() for label, band in result.balance_bands.items()}
+
+    if result.survival_curve is not None:
+        data["survival_curve"] = result.survival_curve.tolist()
+
+    return data
+
+
+def result_from_dict(data: dict) -> MonteCarloResult:
+
+    data = dict(data)
+
+    if data.get("confidence_interval") is not None:
+        data["confidence_interval"] = tuple(data["confidence_interval"])
+
+    if data.get("balance_bands") is not None:
+        data["balance_bands"] = {label: np.array(band) for label, band in data["balance_bands"].items()}
+
+    if data.get("survival_curve") is not None:
+        data["survival_curve"] = np.array(data["survival_curve"])
+
+    return MonteCarloResult(**data)
+
+
+def frozen_result(result: MonteCarloResult) -> MonteCarloResult:
+    """
+    Copy whose arrays are read-only, safe to store and share.
+    """
+    def frozen(array):
+        array = np.array(array)
+        array.setflags(write=False)
+        return array
+
+    return replace(
+        result,
+        balance_bands=None if result.balance_bands is None else {
+            label: frozen(band) for label, band in result.balance_bands.items()
+        },
+        survival_curve=None if result.survival_curve is None else frozen(result.survival_curve),
+    )
+
+
+def shared_result(result: MonteCarloResult) -> MonteCarloResult:
+    """
+    Per-caller copy of a stored result: its own fields and band dict,
+    over the stored read-only arrays.
+    """
+    bands = result.balance_bands
+    return replace(result, balance_bands=None if bands is None else dict(bands))
+
+
+# =========================
+# SQLITE TIER
+# =========================
+class SqliteResultStore:
+    """
+    Results persisted in one SQLite table, shared across processes.
+    A connection per call keeps it safe to use from any thread.
+    """
+
+    def __init__(self, path: str):
+        self.path = str(path)
+
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS monte_carlo_results "
+                "(key TEXT PRIMARY KEY, result TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+
+    def _connect(self):
+        return closing(sqlite3.connect(self.path, timeout=30))
+
+    def get(self, key: str) -> MonteCarloResult | None:
+
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT result FROM monte_carlo_results WHERE key = ?", (key,)
+            ).fetchone()
+
+        return result_from_dict(json.loads(row[0])) if row else None
+
+    def put(self, key: str, result: MonteCarloResult):
+
+        with self._connect() as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO monte_carlo_results VALUES (?, ?, ?)",
+                (key, json.dumps(result_to_dict(result)), time.time())
+            )
+
+    def clear(self):
+
+        with self._connect() as connection, connection:
+            connection.execute("DELETE FROM monte_carlo_results")
+
+    def __len__(self):
+
+        with self._connect() as connection:
+            return connection.execute("SELECT COUNT(*) FROM monte_carlo_results").fetchone()[0]
+
+
+# =========================
+# CACHE
+# =========================
+class MonteCarloCache:
+    """
+    In-process LRU in front of MonteCarloSimulator.run, with an optional
+    SQLite second tier. Only reproducible runs are cached: unseeded runs
+    and runs stopped by a time budget always run. Every caller gets its
+    own copy of a cached result, with read-only arrays.
+    """
+
+    def __init__(self, maxsize: int = 256, store: SqliteResultStore | None = None):
+        self.memory = LRUCache(maxsize=maxsize)
+        self.store = store
+
+        self.runs = 0
+
+    @staticmethod
+    def cacheable(simulator: MonteCarloSimulator) -> bool:
+        return simulator.seed is not None and simulator.time_budget is None
+
+    def run(self, simulator: MonteCarloSimulator, draws: np.ndarray | None = None) -> MonteCarloResult:
+
+        # caller-supplied draws are not part of the key
+        if draws is not None:
+            return simulator.run(draws=draws)
+
+        if not self.cacheable(simulator):
+            self.runs += 1
+            return simulator.run()
+
+        key = simulation_key(simulator)
+
+        result = self.memory.get(key, _MISSING)
+
+        if result is not _MISSING:
+            return shared_result(result)
+
+        result = self.store.get(key) if self.store is not None else None
+
+        if result is None:
+            result = simulator.run()
+            self.runs += 1
+
+            if self.store is not None:
+                self.store.put(key, result)
+
+        result = frozen_result(result)
+        self.memory.put(key, result)
+
+        return shared_result(result)
+
+    def configure(self, maxsize: int | None = None, sqlite_path=_MISSING):
+
+        if maxsize is not None:
+            self.memory.configure(maxsize=maxsize)
+
+        if sqlite_path is not _MISSING:
+            self.store = SqliteResultStore(sqlite_path) if sqlite_path is not None else None
+
+    def clear(self):
+
+        self.memory.clear()
+        self.runs = 0
+
+        if self.store is not None:
+            self.store.clear()
+
+    def stats(self) -> dict:
+        return {**self.memory.stats(), "runs": self.runs, "persistent": self.store is not None}
+
+
+# =========================
+# SHARED INSTANCE
+# =========================
+MONTE_CARLO_CACHE = MonteCarloCache()
+
+
+def configure_monte_carlo_cache(maxsize: int | None = None, sqlite_path=_MISSING):
+    MONTE_CARLO_CACHE.configure(maxsize=maxsize, sqlite_path=sqlite_path)
+
+
+def monte_carlo_cache_stats() -> dict:
+    return MONTE_CARLO_CACHE.stats()
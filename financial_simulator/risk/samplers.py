@@ -0,0 +1,204 @@
+# financial_simulator/risk/samplers.py
+
+import numpy as np
+
+# =========================
+# SOBOL DIRECTION NUMBERS
+# =========================
+# (s, a, m) for dimensions 2, 3, ... from Joe & Kuo (new-joe-kuo-6.21201).
+# Dimension 1 is the van der Corput sequence (every m = 1).
+SOBOL_DIRECTIONS = (
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+    (5, 11, (1, 1, 5, 1, 1)),
+    (5, 13, (1, 1, 1, 3, 11)),
+    (5, 14, (1, 3, 5, 5, 31)),
+    (6, 1, (1, 3, 3, 9, 7, 49)),
+    (6, 13, (1, 1, 1, 15, 21, 21)),
+    (6, 16, (1, 3, 1, 13, 27, 49)),
+    (6, 19, (1, 1, 1, 15, 7, 5)),
+    (6, 22, (1, 3, 1, 15, 13, 25)),
+    (6, 25, (1, 1, 5, 5, 19, 61)),
+    (7, 1, (1, 3, 7, 11, 23, 15, 103)),
+    (7, 4, (1, 3, 7, 13, 13, 15, 69)),
+    (7, 7, (1, 1, 3, 13, 7, 35, 63)),
+    (7, 8, (1, 3, 5, 9, 1, 25, 53)),
+    (7, 14, (1, 3, 1, 13, 9, 35, 107)),
+    (7, 19, (1, 3, 1, 5, 27, 61, 31)),
+    (7, 21, (1, 1, 5, 11, 19, 41, 61)),
+    (7, 28, (1, 3, 5, 3, 3, 13, 69)),
+    (7, 31, (1, 1, 7, 13, 1, 19, 1)),
+    (7, 32, (1, 3, 7, 5, 13, 19, 59)),
+    (7, 37, (1, 1, 3, 9, 25, 29, 41)),
+    (7, 41, (1, 3, 5, 13, 23, 1, 55)),
+    (7, 42, (1, 3, 7, 3, 13, 59, 17)),
+    (7, 50, (1, 3, 1, 3, 5, 53, 69)),
+    (7, 55, (1, 1, 5, 5, 23, 33, 13)),
+    (7, 56, (1, 1, 7, 7, 1, 61, 123)),
+    (7, 59, (1, 1, 7, 9, 13, 61, 49)),
+    (7, 62, (1, 3, 3, 5, 3, 55, 33)),
+)
+
+# van der Corput plus every primitive polynomial up to degree 7
+SOBOL_MAX_DIMS = len(SOBOL_DIRECTIONS) + 1
+
+SOBOL_BITS = 30
+
+
+def _sobol_directions(dims: int) -> np.ndarray:
+    """
+    (dims, SOBOL_BITS) direction numbers, scaled to SOBOL_BITS-bit integers.
+    """
+    if dims > SOBOL_MAX_DIMS:
+        raise ValueError(f"Sobol sampler supports at most {SOBOL_MAX_DIMS} dimensions")
+
+    shifts = SOBOL_BITS - 1 - np.arange(SOBOL_BITS)
+
+    directions = np.empty((dims, SOBOL_BITS), dtype=np.int64)
+    directions[0] = 1 << shifts
+
+    for d in range(1, dims):
+        s, a, m = SOBOL_DIRECTIONS[d - 1]
+        m = list(m)
+
+        for k in range(s, SOBOL_BITS):
+            value = m[k - s] ^ (m[k - s] << s)
+            for i in range(1, s):
+                value ^= (((a >> (s - 1 - i)) & 1) * m[k - i]) << i
+            m.append(value)
+
+        directions[d] = np.array(m, dtype=np.int64) << shifts
+
+    return directions
+
+
+def _scramble(directions: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """
+    Linear matrix scramble: every direction number goes through a random
+    lower-triangular binary matrix with a unit diagonal (digits MSB first).
+    """
+    shifts = SOBOL_BITS - 1 - np.arange(SOBOL_BITS)
+    scrambled = np.empty_like(directions)
+
+    for d in range(directions.shape[0]):
+        matrix = np.tril(rng.integers(0, 2, (SOBOL_BITS, SOBOL_BITS)), -1) + np.eye(SOBOL_BITS, dtype=np.int64)
+
+        digits = (directions[d][:, None] >> shifts) & 1
+        digits = (digits @ matrix.T) % 2
+
+        scrambled[d] = (digits << shifts).sum(axis=1)
+
+    return scrambled
+
+
+# =========================
+# SAMPLERS
+# =========================
+# Each sampler returns a (dims, size) array of points on [0, 1).
+
+def uniform(rng: np.random.Generator, dims: int, size: int) -> np.ndarray:
+    return rng.random((dims, size))
+
+
+def antithetic(rng: np.random.Generator, dims: int, size: int) -> np.ndarray:
+    """
+    Pairs (u, 1 - u) in adjacent columns; an odd last column is plain uniform.
+    """
+    half = size // 2
+    draws = np.empty((dims, size))
+
+    u = rng.random((dims, half))
+    draws[:, 0:2 * half:2] = u
+    draws[:, 1:2 * half:2] = 1 - u
+
+    if size % 2:
+        draws[:, -1] = rng.random(dims)
+
+    return draws
+
+
+def latin_hypercube(rng: np.random.Generator, dims: int, size: int) -> np.ndarray:
+    """
+    One point in each of `size` equal strata per dimension, strata shuffled
+    independently across dimensions.
+    """
+    strata = rng.permuted(np.tile(np.arange(size), (dims, 1)), axis=1)
+    return (strata + rng.random((dims, size))) / size
+
+
+def sobol(rng: np.random.Generator, dims: int, size: int) -> np.ndarray:
+    """
+    Scrambled Sobol points (linear matrix scramble + digital shift).
+    Balanced when `size` is a power of two.
+    """
+    directions = _scramble(_sobol_directions(dims), rng)
+    shift = rng.integers(0, 1 << SOBOL_BITS, (dims, 1))
+
+    index = np.arange(size)
+    gray = index ^ (index >> 1)
+
+    points = np.zeros((dims, size), dtype=np.int64)
+    for bit in range(max(int(size - 1).bit_length(), 1)):
+        points ^= np.where((gray >> bit) & 1, directions[:, bit:bit + 1], 0)
+
+    return (points ^ shift) / float(1 << SOBOL_BITS)
+
+
+# =========================
+# NORMAL QUANTILES
+# =========================
+# Acklam's rational approximation (relative error below 1.2e-9).
+_NORMAL_A = (-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02,
+             1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00)
+_NORMAL_B = (-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02,
+             6.680131188771972e+01, -1.328068155288572e+01)
+_NORMAL_C = (-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00,
+             -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00)
+_NORMAL_D = (7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00,
+             3.754408661907416e+00)
+
+_NORMAL_LOW = 0.02425
+
+
+def normal_quantile(u: np.ndarray) -> np.ndarray:
+    """
+    Standard normal quantiles of draws on [0, 1), so any sampler can
+    feed normal shocks. Draws are clipped away from 0 and 1.
+    """
+    u = np.clip(np.asarray(u, dtype=float), 1e-12, 1 - 1e-12)
+
+    # tails, mirrored for the upper one
+    q = np.sqrt(-2 * np.log(np.minimum(u, 1 - u)))
+    tail = (np.polyval(_NORMAL_C, q) / np.polyval(_NORMAL_D + (1.0,), q))
+    tail = np.where(u > 0.5, -tail, tail)
+
+    # central region
+    r = (u - 0.5) ** 2
+    central = (u - 0.5) * np.polyval(_NORMAL_A, r) / np.polyval(_NORMAL_B + (1.0,), r)
+
+    return np.where(np.minimum(u, 1 - u) < _NORMAL_LOW, tail, central)
+
+
+SAMPLERS = {
+    "uniform": uniform,
+    "antithetic": antithetic,
+    "latin_hypercube": latin_hypercube,
+    "sobol": sobol,
+}
+
+
+def get_sampler(name: str):
+
+    sampler = SAMPLERS.get(name)
+
+    if sampler is None:
+        raise ValueError(f"Unknown sampler: {name}")
+
+    return sampler
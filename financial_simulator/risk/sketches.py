@@ -0,0 +1,271 @@
+# financial_simulator/risk/sketches.py
+
+import numpy as np
+
+from financial_simulator.core.tax.brackets import float_array
+
+
+class RunningStats:
+    """
+    Streaming count, mean, variance, minimum and maximum, optionally
+    weighted. Chunks are reduced on their own, then folded in with Chan's
+    pairwise update, so memory does not grow with the number of values.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.weight = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = np.inf
+        self.maximum = -np.inf
+
+    @classmethod
+    def of(cls, values, weights=None) -> "RunningStats":
+
+        stats = cls()
+        stats.update(values, weights)
+
+        return stats
+
+    # =========================
+    # UPDATES
+    # =========================
+    def update(self, values, weights=None):
+        """
+        Add a chunk of values, with unit weights when `weights` is None.
+        """
+        values = np.asarray(values, dtype=float).ravel()
+
+        if not values.size:
+            return
+
+        if weights is None:
+            weights = np.ones_like(values)
+
+        weights = np.asarray(weights, dtype=float).ravel()
+
+        chunk = RunningStats()
+        chunk.count = values.size
+        chunk.weight = float(weights.sum())
+        chunk.mean = float(weights @ values / chunk.weight) if chunk.weight > 0 else 0.0
+        chunk.m2 = float(weights @ np.square(values - chunk.mean))
+        chunk.minimum = float(values.min())
+        chunk.maximum = float(values.max())
+
+        self.merge(chunk)
+
+    def merge(self, other: "RunningStats"):
+
+        if not other.count:
+            return
+
+        weight = self.weight + other.weight
+        delta = other.mean - self.mean
+
+        if weight > 0:
+            self.mean += delta * other.weight / weight
+            self.m2 += other.m2 + delta * delta * self.weight * other.weight / weight
+
+        self.weight = weight
+        self.count += other.count
+
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    # =========================
+    # QUERIES
+    # =========================
+    def variance(self, ddof: int = 0) -> float:
+        """
+        `ddof` counts in units of weight, so it only makes sense unweighted.
+        """
+        if self.count <= ddof or self.weight <= ddof:
+            return float("nan")
+
+        return self.m2 / (self.weight - ddof)
+
+    def std(self, ddof: int = 0) -> float:
+        return float(np.sqrt(self.variance(ddof)))
+
+    # =========================
+    # STATE
+    # =========================
+    def to_array(self) -> np.ndarray:
+        return np.array([self.count, self.weight, self.mean, self.m2, self.minimum, self.maximum])
+
+    @classmethod
+    def from_array(cls, array: np.ndarray) -> "RunningStats":
+
+        stats = cls()
+        count, stats.weight, stats.mean, stats.m2, stats.minimum, stats.maximum = np.asarray(array).tolist()
+        stats.count = int(count)
+
+        return stats
+
+
+class QuantileSketch:
+    """
+    Streaming per-column quantiles, t-digest style.
+
+    Each column keeps at most compression / 2 + 1 weighted centroids,
+    clustered on the arcsine scale so the tails stay fine-grained.
+    Updated with (rows, columns) chunks; memory does not grow with rows.
+    """
+
+    def __init__(self, columns: int, compression: int = 200):
+        self.columns = columns
+        self.compression = compression
+
+        # centroid slots, in value order; empty slots have zero weight
+        self.slots = compression // 2 + 1
+        self.means = np.zeros((columns, self.slots))
+        self.weights = np.zeros((columns, self.slots))
+
+        self.minimum = np.full(columns, np.inf)
+        self.maximum = np.full(columns, -np.inf)
+
+        # total weight: the number of rows unless rows were weighted
+        self.count = 0
+
+    # =========================
+    # UPDATES
+    # =========================
+    def update(self, values: np.ndarray, weights=None):
+        """
+        Add a (rows, columns) chunk; `weights` are optional per-row weights.
+        float32 chunks are sorted in float32 and clustered in float64.
+        """
+        values = float_array(values).reshape(-1, self.columns).T
+
+        if not values.shape[1]:
+            return
+
+        self.minimum = np.minimum(self.minimum, values.min(axis=1))
+        self.maximum = np.maximum(self.maximum, values.max(axis=1))
+
+        if weights is not None:
+            weights = np.broadcast_to(np.asarray(weights, dtype=float), values.shape)
+            self.count += float(weights[0].sum())
+
+            self.means, self.weights = self._clustered(
+                np.concatenate([self.means, values], axis=1),
+                np.concatenate([self.weights, weights], axis=1)
+            )
+            return
+
+        values = np.sort(values, axis=1)
+        self.count += values.shape[1]
+
+        # a sorted chunk of unit weights clusters the same way in every
+        # column, so it is reduced with one reduceat before the merge
+        n = values.shape[1]
+        cluster = self._cluster((np.arange(n) + 0.5) / n)
+
+        starts = np.flatnonzero(np.diff(cluster, prepend=-1))
+        counts = np.diff(np.append(starts, n)).astype(float)
+
+        means = np.add.reduceat(values, starts, axis=1, dtype=float) / counts
+        weights = np.broadcast_to(counts, means.shape)
+
+        self.means, self.weights = self._clustered(
+            np.concatenate([self.means, means], axis=1),
+            np.concatenate([self.weights, weights], axis=1)
+        )
+
+    def merge(self, other: "QuantileSketch"):
+
+        self.minimum = np.minimum(self.minimum, other.minimum)
+        self.maximum = np.maximum(self.maximum, other.maximum)
+        self.count += other.count
+
+        self.means, self.weights = self._clustered(
+            np.concatenate([self.means, other.means], axis=1),
+            np.concatenate([self.weights, other.weights], axis=1)
+        )
+
+    def _cluster(self, q: np.ndarray) -> np.ndarray:
+        # k(q) = compression / (2 pi) * asin(2q - 1), shifted to start at 0
+        k = self.compression * (np.arcsin(np.clip(2 * q - 1, -1, 1)) / np.pi + 0.5) / 2
+        return np.minimum(k.astype(int), self.slots - 1)
+
+    def _clustered(self, means: np.ndarray, weights: np.ndarray) -> tuple:
+        """
+        Collapse (columns, n) weighted points into (columns, slots) centroids.
+        """
+        order = np.argsort(means, axis=1, kind="stable")
+        means = np.take_along_axis(means, order, axis=1)
+        weights = np.take_along_axis(weights, order, axis=1)
+
+        total = weights.sum(axis=1, keepdims=True)
+        cumulative = np.cumsum(weights, axis=1)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            q = np.where(total > 0, (cumulative - weights / 2) / total, 0.0)
+
+        cluster = self._cluster(q)
+
+        keys = (cluster + self.slots * np.arange(self.columns)[:, None]).ravel()
+        size = self.columns * self.slots
+
+        weight_sums = np.bincount(keys, weights=weights.ravel(), minlength=size)
+        value_sums = np.bincount(keys, weights=(weights * means).ravel(), minlength=size)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            centroids = np.where(weight_sums > 0, value_sums / weight_sums, 0.0)
+
+        return centroids.reshape(self.columns, self.slots), weight_sums.reshape(self.columns, self.slots)
+
+    # =========================
+    # STATE
+    # =========================
+    def to_arrays(self) -> dict:
+        return {
+            "means": self.means,
+            "weights": self.weights,
+            "minimum": self.minimum,
+            "maximum": self.maximum,
+            "count": np.array(self.count),
+            "compression": np.array(self.compression),
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays: dict) -> "QuantileSketch":
+
+        sketch = cls(arrays["means"].shape[0], int(arrays["compression"]))
+        sketch.means = np.array(arrays["means"])
+        sketch.weights = np.array(arrays["weights"])
+        sketch.minimum = np.array(arrays["minimum"])
+        sketch.maximum = np.array(arrays["maximum"])
+        sketch.count = arrays["count"].item()
+
+        return sketch
+
+    # =========================
+    # QUERIES
+    # =========================
+    def quantiles(self, levels) -> np.ndarray:
+        """
+        (len(levels), columns) estimates, interpolated between centroids
+        and anchored on the exact minimum and maximum.
+        """
+        levels = np.asarray(levels, dtype=float)
+        result = np.full((len(levels), self.columns), np.nan)
+
+        if not self.count:
+            return result
+
+        for column in range(self.columns):
+            used = self.weights[column] > 0
+            weights = self.weights[column][used]
+            means = self.means[column][used]
+
+            positions = np.cumsum(weights) - weights / 2
+
+            result[:, column] = np.interp(
+                levels * self.count,
+                np.concatenate(([0.0], positions, [self.count])),
+                np.concatenate(([self.minimum[column]], means, [self.maximum[column]]))
+            )
+
+        return result
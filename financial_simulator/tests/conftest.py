@@ -0,0 +1,66 @@
+# financial_simulator/tests/conftest.py
+import pytest
+
+
+class SimulationRequest:
+    """
+    Stand-in for the API request, with the attributes build_inputs reads.
+    """
+
+    def __init__(self, **overrides):
+        self.initial_savings = 8000
+        self.monthly_income = 5200
+        self.expenses = {"rent": 1500, "groceries": 400, "restaurant": 120, "misc": 80}
+        self.monthly_expenses = None
+        self.months = 24
+        self.savings_goal = 30000
+        self.one_time_cost = 2000
+        self.months_without_income = 0
+        self.province = "quebec"
+
+        for name, value in overrides.items():
+            setattr(self, name, value)
+
+
+@pytest.fixture
+def simulation_request():
+    """
+    Factory: simulation_request(**overrides) -> a fresh request.
+    """
+    return SimulationRequest
+
+
+@pytest.fixture
+def make_inputs(simulation_request):
+    """
+    Factory: make_inputs(**overrides) -> SimulationInputs built from a request.
+    """
+    from financial_simulator.core.inputs import build_inputs
+
+    def make(**overrides):
+        return build_inputs(simulation_request(**overrides))
+
+    return make
+
+
+@pytest.fixture
+def default_inputs():
+    """
+    Factory: default_inputs(**overrides) -> FinancialInputs for engine tests.
+    """
+    from financial_simulator.core.inputs.financial_inputs import FinancialInputs
+
+    def make(**overrides):
+        base = dict(
+            initial_savings=5000,
+            one_time_cost=0,
+            monthly_income=3000,
+            monthly_expenses=1000,
+            months=12,
+            savings_goal=10000,
+            months_without_income=0,
+        )
+        base.update(overrides)
+        return FinancialInputs(**base)
+
+    return make
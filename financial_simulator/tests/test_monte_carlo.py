@@ -0,0 +1,1053 @@
+# financial_simulator/tests/test_monte_carlo.py
+from copy import deepcopy
+
+import numpy as np
+import pytest
+
+from financial_simulator.core.projection import run_projection
+from financial_simulator.risk.monte_carlo import MonteCarloSimulator, RunKernel, compare_scenarios, draw_matrix
+
+
+def vary(inputs, income_variation, expense_variation):
+    varied = deepcopy(inputs)
+    varied.profile.monthly_income *= 1 + income_variation
+    if varied.profile.monthly_expenses:
+        varied.profile.monthly_expenses *= 1 + expense_variation
+    if varied.profile.expenses:
+        for k in varied.profile.expenses:
+            varied.profile.expenses[k] *= 1 + expense_variation
+    return varied
+
+
+# =========================
+# Vectorized mode
+# =========================
+
+@pytest.mark.parametrize("overrides", [{}, {"expenses": None, "monthly_expenses": 2600, "province": "ontario"}])
+def test_vectorized_runs_match_full_projection(overrides, make_inputs):
+
+    inputs = make_inputs(**overrides)
+    kernel = RunKernel.from_simulator(MonteCarloSimulator(inputs))
+
+    income_variation = np.array([-0.15, -0.02, 0.0, 0.07, 0.15])
+    expense_variation = np.array([0.1, -0.1, 0.0, 0.03, -0.05])
+
+    balances = kernel.final_balances(income_variation, expense_variation)
+
+    for i in range(len(balances)):
+        projection, _ = run_projection(vary(inputs, income_variation[i], expense_variation[i]))
+        assert balances[i] == pytest.approx(projection.final_balance, abs=0.01)
+
+
+def test_vectorized_run_does_not_copy_inputs(monkeypatch, make_inputs):
+
+    import financial_simulator.risk.monte_carlo as monte_carlo
+
+    def forbidden(_):
+        raise AssertionError("inputs copied")
+
+    monkeypatch.setattr(monte_carlo, "deepcopy", forbidden)
+
+    result = MonteCarloSimulator(make_inputs(), runs=10_000).run()
+
+    assert result.simulations_run == 10_000
+    assert 0.0 <= result.success_rate <= 1.0
+    assert result.failure_rate == pytest.approx(1 - result.success_rate)
+
+
+def test_modes_agree_on_shared_draws(make_inputs):
+
+    inputs = make_inputs()
+    draws = draw_matrix(300, seed=7)
+
+    loop = MonteCarloSimulator(inputs, runs=300, mode="loop").run(draws=draws)
+    vectorized = MonteCarloSimulator(inputs, runs=300).run(draws=draws)
+
+    # the loop path taxes income rounded to the cent
+    assert vectorized.success_rate == loop.success_rate
+    assert vectorized.average_final_balance == pytest.approx(loop.average_final_balance, abs=0.1)
+    assert vectorized.worst_balance == pytest.approx(loop.worst_balance, abs=0.1)
+
+
+def test_unknown_mode_rejected(make_inputs):
+
+    with pytest.raises(ValueError):
+        MonteCarloSimulator(make_inputs(), mode="gpu")
+
+
+# =========================
+# Parallel execution
+# =========================
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_results_identical_for_any_worker_count(executor, make_inputs):
+
+    inputs = make_inputs()
+
+    serial = MonteCarloSimulator(inputs, runs=20_000, seed=42).run()
+    parallel = MonteCarloSimulator(inputs, runs=20_000, seed=42, workers=3, executor=executor).run()
+
+    assert parallel == serial
+    assert MonteCarloSimulator(inputs, runs=20_000, seed=43).run() != serial
+
+
+# =========================
+# Seeds and common random numbers
+# =========================
+
+@pytest.mark.parametrize("mode", ["loop", "vectorized"])
+def test_seed_makes_runs_reproducible(mode, make_inputs):
+
+    inputs = make_inputs()
+
+    first = MonteCarloSimulator(inputs, runs=200, seed=11, mode=mode).run()
+    second = MonteCarloSimulator(inputs, runs=200, seed=11, mode=mode).run()
+
+    assert first == second
+
+
+def test_seeded_run_uses_draw_matrix(make_inputs):
+
+    inputs = make_inputs()
+
+    seeded = MonteCarloSimulator(inputs, runs=10_000, seed=5).run()
+    shared = MonteCarloSimulator(inputs, runs=10_000).run(draws=draw_matrix(10_000, seed=5))
+
+    assert seeded == shared
+
+
+def test_common_random_numbers_isolate_scenario_difference(make_inputs):
+
+    low, high = make_inputs(monthly_income=5000), make_inputs(monthly_income=5100)
+
+    for seed in range(5):
+        results = compare_scenarios([low, high], runs=500, seed=seed)
+
+        # same draws: more income is better in every run, never worse by noise
+        assert results[1].average_final_balance > results[0].average_final_balance
+        assert results[1].success_rate >= results[0].success_rate
+        assert results[1].worst_balance > results[0].worst_balance
+
+
+# =========================
+# Samplers
+# =========================
+
+@pytest.mark.parametrize("name", ["uniform", "antithetic", "latin_hypercube", "sobol"])
+def test_samplers_fill_unit_cube(name):
+
+    from financial_simulator.risk.samplers import get_sampler
+
+    draws = get_sampler(name)(np.random.default_rng(0), 3, 1024)
+
+    assert draws.shape == (3, 1024)
+    assert draws.min() >= 0.0 and draws.max() < 1.0
+
+
+@pytest.mark.parametrize("name", ["latin_hypercube", "sobol"])
+def test_stratified_samplers_hit_every_stratum(name):
+
+    from financial_simulator.risk.samplers import get_sampler
+
+    draws = get_sampler(name)(np.random.default_rng(1), 2, 256)
+
+    for row in draws:
+        assert sorted(np.floor(row * 256).astype(int)) == list(range(256))
+
+
+def test_sobol_unscrambled_matches_reference_points():
+
+    from financial_simulator.risk.samplers import SOBOL_BITS, _sobol_directions
+
+    directions = _sobol_directions(2)
+
+    # first points of the 2-D Sobol sequence in Gray code order
+    expected = [(0.0, 0.0), (0.5, 0.5), (0.75, 0.25), (0.25, 0.75), (0.375, 0.375), (0.875, 0.875)]
+
+    for n, point in enumerate(expected):
+        gray = n ^ (n >> 1)
+        value = np.zeros(2, dtype=np.int64)
+        for bit in range(3):
+            if (gray >> bit) & 1:
+                value ^= directions[:, bit]
+        assert tuple(value / float(1 << SOBOL_BITS)) == point
+
+
+def test_antithetic_pairs_mirror():
+
+    from financial_simulator.risk.samplers import antithetic
+
+    draws = antithetic(np.random.default_rng(2), 2, 9)
+
+    assert np.allclose(draws[:, 0:8:2] + draws[:, 1:8:2], 1.0)
+
+
+def test_variance_reduction_and_std_error(make_inputs):
+
+    inputs = make_inputs()
+
+    def spread(sampler):
+        rates = [MonteCarloSimulator(inputs, runs=256, seed=seed, sampler=sampler).run().success_rate for seed in range(20)]
+        return np.std(rates)
+
+    assert spread("sobol") < spread("uniform") / 2
+    assert spread("antithetic") < spread("uniform")
+
+    result = MonteCarloSimulator(inputs, runs=400, seed=0).run()
+    rate = result.success_rate
+    assert result.success_std_error == pytest.approx(np.sqrt(rate * (1 - rate) / 400))
+
+    with pytest.raises(ValueError):
+        MonteCarloSimulator(inputs, sampler="halton")
+
+
+# =========================
+# Adaptive stopping
+# =========================
+
+def test_wilson_interval():
+
+    from financial_simulator.risk.monte_carlo import wilson_interval
+
+    low, high = wilson_interval(250, 500)
+    assert (low, high) == pytest.approx((0.4563, 0.5437), abs=1e-4)
+
+    low, high = wilson_interval(0, 40)
+    assert low == pytest.approx(0.0) and 0 < high < 0.1
+
+
+def test_adaptive_run_stops_early_on_easy_profile(make_inputs):
+
+    easy = make_inputs(savings_goal=1000)
+
+    result = MonteCarloSimulator(easy, runs=10_000, seed=1, target_width=0.1).run()
+
+    assert result.success_rate == 1.0
+    assert result.simulations_run <= 64
+    assert result.confidence_interval[1] - result.confidence_interval[0] <= 0.1
+
+
+def test_adaptive_run_samples_borderline_profile_until_target(make_inputs):
+
+    result = MonteCarloSimulator(make_inputs(), runs=10_000, seed=1, target_width=0.05).run()
+
+    low, high = result.confidence_interval
+
+    assert result.simulations_run > 1000
+    assert high - low <= 0.05
+    assert low <= result.success_rate <= high
+
+
+def test_adaptive_run_respects_time_budget(make_inputs):
+
+    result = MonteCarloSimulator(make_inputs(), runs=10_000_000, seed=1, time_budget=0.0).run()
+
+    assert result.simulations_run == 32
+
+    with pytest.raises(ValueError):
+        MonteCarloSimulator(make_inputs(), mode="loop", target_width=0.1)
+
+
+def test_predictor_confidence_follows_interval():
+
+    from financial_simulator.analysis.success_predictor import ImmigrationSuccessPredictor
+    from financial_simulator.risk.monte_carlo import MonteCarloResult
+
+    def confidence(interval):
+        result = MonteCarloResult(0.5, 0.5, 0.0, 0.0, 64, confidence_interval=interval)
+        return ImmigrationSuccessPredictor()._compute_confidence(result)
+
+    assert confidence((0.0, 0.05)) == "High"
+    assert confidence((0.4, 0.52)) == "Medium"
+    assert confidence((0.3, 0.7)) == "Low"
+
+
+# =========================
+# Month-level paths
+# =========================
+
+QUIET = dict(income_shock=0.0, expense_shock=0.0, job_loss_rate=0.0, job_finding_rate=1.0, one_off_rate=0.0)
+
+
+def test_quiet_path_model_matches_constant_cashflows(make_inputs):
+
+    from financial_simulator.risk.path_model import PathModel
+
+    inputs = make_inputs()
+
+    constant = MonteCarloSimulator(inputs, runs=500, seed=4).run()
+    paths = MonteCarloSimulator(inputs, runs=500, seed=4, path_model=PathModel(**QUIET)).run()
+
+    assert paths.average_final_balance == pytest.approx(constant.average_final_balance)
+    assert paths.worst_balance == pytest.approx(constant.worst_balance)
+
+
+def test_months_without_income_are_simulated(make_inputs):
+
+    from financial_simulator.core.projection import build_cashflows
+    from financial_simulator.risk.path_model import PathModel
+
+    inputs = make_inputs(months_without_income=3)
+    quiet = PathModel(**QUIET)
+
+    with_gap = MonteCarloSimulator(inputs, runs=64, seed=4, income_volatility=0, expense_volatility=0, path_model=quiet).run()
+    constant = MonteCarloSimulator(inputs, runs=64, seed=4, income_volatility=0, expense_volatility=0).run()
+
+    net_income = build_cashflows(inputs)["net_income"]
+
+    assert with_gap.average_final_balance == pytest.approx(constant.average_final_balance - 3 * net_income)
+
+
+def test_employment_chain():
+
+    from financial_simulator.risk.path_model import PathModel
+
+    rng = np.random.default_rng(0)
+
+    employed = PathModel(job_loss_rate=0.05, job_finding_rate=0.2).employment(rng, (20_000, 60), months_without_income=2)
+
+    assert not employed[:, :2].any()
+    assert employed[:, 2].all()
+
+    # long-run employment share of a two-state chain: finding / (loss + finding)
+    assert employed[:, -1].mean() == pytest.approx(0.2 / 0.25, abs=0.02)
+
+    never_rehired = PathModel(job_loss_rate=1.0, job_finding_rate=0.0).employment(rng, (10, 12))
+    assert never_rehired[:, 0].all() and not never_rehired[:, 1:].any()
+
+
+def test_path_model_shocks_and_one_offs():
+
+    from financial_simulator.risk.path_model import PathModel
+
+    rng = np.random.default_rng(1)
+    model = PathModel(income_shock=0.1, one_off_rate=0.5, one_off_scale=2.0)
+
+    assert model.income_factors(rng, (1000, 100)).mean() == pytest.approx(1.0, abs=0.01)
+    assert model.one_off_expenses(rng, (1000, 100), np.full(1000, 100.0)).mean() == pytest.approx(100.0, rel=0.05)
+
+    with pytest.raises(ValueError):
+        PathModel(job_loss_rate=1.5)
+
+
+def test_path_runs_reproducible_with_shared_draws(make_inputs):
+
+    from financial_simulator.risk.path_model import PathModel
+
+    inputs = make_inputs(months_without_income=2)
+    model = PathModel()
+
+    seeded = MonteCarloSimulator(inputs, runs=5000, seed=8, path_model=model, sampler="sobol").run()
+    shared = MonteCarloSimulator(inputs, runs=5000, seed=8, path_model=model).run(draws=draw_matrix(5000, 8, "sobol"))
+    parallel = MonteCarloSimulator(inputs, runs=5000, seed=8, path_model=model, sampler="sobol", workers=2, executor="thread").run()
+
+    assert seeded == shared == parallel
+
+
+# =========================
+# Fan chart and survival curve
+# =========================
+
+def test_quantile_sketch_tracks_exact_quantiles():
+
+    from financial_simulator.risk.sketches import QuantileSketch
+
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((30_000, 4)) * [1, 10, 100, 1000] + [0, 5, -50, 500]
+
+    sketch, left, right = QuantileSketch(4), QuantileSketch(4), QuantileSketch(4)
+    for start in range(0, len(data), 1000):
+        sketch.update(data[start:start + 1000])
+        (left if start < 15_000 else right).update(data[start:start + 1000])
+    left.merge(right)
+
+    levels = [0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99]
+
+    for estimate in [sketch.quantiles(levels), left.quantiles(levels)]:
+        ranks = (data[None, :, :] <= estimate[:, None, :]).mean(axis=1)
+        assert np.abs(ranks - np.array(levels)[:, None]).max() < 0.005
+
+    assert sketch.quantiles([0.0, 1.0]) == pytest.approx(np.stack([data.min(axis=0), data.max(axis=0)]))
+
+
+def reference_paths(simulator):
+
+    from financial_simulator.risk.monte_carlo import chunk_seeds, draw_uniforms
+
+    kernel = RunKernel.from_simulator(simulator)
+    paths = []
+
+    for seed, size in zip(*chunk_seeds(simulator.runs, simulator.seed)):
+        draws = draw_uniforms(seed, simulator.sampler, size)
+        income_variation = kernel.income_volatility * (2 * draws[0] - 1)
+        expense_variation = kernel.expense_volatility * (2 * draws[1] - 1)
+
+        if kernel.path_model is None:
+            cashflow = kernel.monthly_cashflows(income_variation, expense_variation)
+            paths.append(kernel.initial + np.arange(1, kernel.months + 1) * cashflow[:, None])
+        else:
+            rng = np.random.Generator(np.random.PCG64(seed).jumped())
+            paths.append(kernel.balance_paths(income_variation, expense_variation, rng))
+
+    return np.concatenate(paths)
+
+
+@pytest.mark.parametrize("with_paths", [False, True])
+def test_bands_and_survival_match_stored_paths(with_paths, make_inputs):
+
+    from financial_simulator.risk.monte_carlo import FAN_LEVELS
+    from financial_simulator.risk.path_model import PathModel
+
+    inputs = make_inputs(initial_savings=2500, months_without_income=1 if with_paths else 0)
+    simulator = MonteCarloSimulator(
+        inputs, runs=9000, seed=2, expense_volatility=0.3,
+        path_model=PathModel() if with_paths else None
+    )
+
+    result = simulator.run()
+    paths = reference_paths(simulator)
+
+    assert list(result.balance_bands) == ["p5", "p25", "p50", "p75", "p95"]
+
+    for level, band in zip(FAN_LEVELS, result.balance_bands.values()):
+        ranks = (paths <= band).mean(axis=0)
+        assert np.abs(ranks - level).max() < 0.01
+
+    survival = (np.minimum.accumulate(paths, axis=1) >= 0).mean(axis=0)
+
+    assert result.survival_curve == pytest.approx(survival)
+    assert survival.min() < 1.0
+
+
+def test_response_includes_fan_chart(make_inputs):
+
+    from financial_simulator.core.models.response import SimulationResponse
+    from financial_simulator.core.simulation_pipeline import SimulationPipeline
+
+    inputs = make_inputs()
+
+    result = SimulationPipeline(inputs, seed=0).run()
+    response = SimulationResponse(
+        projection=result["projection"], score=result["score"], risk=result["risk"],
+        success=result["success"], readiness=result["readiness"], insights=[],
+        recommendations=result["recommendations"], strategy=result["strategy"],
+        scenarios={}, optimization=[], monte_carlo=result["monte_carlo"]
+    ).to_dict()["monte_carlo"]
+
+    assert len(response["balance_bands"]["p50"]) == inputs.config.months
+    assert len(response["survival_curve"]) == inputs.config.months
+
+
+def test_pipeline_path_model_is_opt_in(monkeypatch, make_inputs):
+
+    from financial_simulator.core.simulation_pipeline import SimulationPipeline
+    from financial_simulator.risk.path_model import PathModel
+    from financial_simulator.risk.result_cache import MONTE_CARLO_CACHE
+
+    simulators = []
+    run = MONTE_CARLO_CACHE.run
+
+    def recorded(simulator, *args, **kwargs):
+        simulators.append(simulator)
+        return run(simulator, *args, **kwargs)
+
+    monkeypatch.setattr(MONTE_CARLO_CACHE, "run", recorded)
+
+    model = PathModel(job_loss_rate=0.05)
+
+    SimulationPipeline(make_inputs(), seed=0).run()
+    SimulationPipeline(make_inputs(), seed=0, path_model=model).run()
+
+    assert simulators[0].path_model is None
+    assert simulators[1].path_model is model
+
+
+def test_unseeded_pipeline_repeats_hit_the_cache(make_inputs):
+
+    from financial_simulator.core.simulation_pipeline import SimulationPipeline
+    from financial_simulator.risk.result_cache import MONTE_CARLO_CACHE
+
+    MONTE_CARLO_CACHE.clear()
+
+    results = [SimulationPipeline(make_inputs()).run()["monte_carlo"] for _ in range(4)]
+    stats = MONTE_CARLO_CACHE.stats()
+
+    assert stats["runs"] == 1 and stats["hits"] == 3
+    assert all(result == results[0] for result in results)
+
+    MONTE_CARLO_CACHE.clear()
+    SimulationPipeline(make_inputs(savings_goal=30001)).run()
+    assert MONTE_CARLO_CACHE.stats()["runs"] == 1 and MONTE_CARLO_CACHE.stats()["hits"] == 0
+
+
+def test_seeded_pipeline_is_reproducible(make_inputs):
+
+    from financial_simulator.core.simulation_pipeline import SimulationPipeline
+    from financial_simulator.risk.result_cache import MONTE_CARLO_CACHE
+
+    inputs = make_inputs(months=360, savings_goal=200_000)
+
+    results = []
+    for _ in range(3):
+        MONTE_CARLO_CACHE.clear()
+        results.append(SimulationPipeline(inputs, seed=7).run()["monte_carlo"])
+
+    assert results[0] == results[1] == results[2]
+    assert np.array_equal(results[0].survival_curve, results[2].survival_curve)
+
+
+# =========================
+# Bounded-memory reductions
+# =========================
+
+def test_running_stats_merge_matches_numpy():
+
+    from financial_simulator.risk.sketches import RunningStats
+
+    values = np.random.default_rng(3).normal(1e6, 250.0, 10_001)
+
+    stats = RunningStats()
+    for chunk in np.array_split(values, 7):
+        stats.update(chunk)
+
+    other = RunningStats.of(values[:10])
+    other.merge(RunningStats.of(values[10:]))
+
+    for reduced in [stats, other]:
+        assert reduced.count == len(values)
+        assert reduced.mean == pytest.approx(values.mean(), rel=1e-14)
+        assert reduced.variance(ddof=1) == pytest.approx(values.var(ddof=1), rel=1e-9)
+        assert (reduced.minimum, reduced.maximum) == (values.min(), values.max())
+
+    assert np.isnan(RunningStats().variance())
+
+
+def test_streamed_result_matches_stored_balances(make_inputs):
+
+    inputs = make_inputs()
+    simulator = MonteCarloSimulator(inputs, runs=10_000, seed=8, sampler="antithetic")
+
+    result = simulator.run()
+
+    draws = draw_matrix(10_000, seed=8, sampler="antithetic")
+    balances = RunKernel.from_simulator(simulator).final_balances(
+        simulator.income_volatility * (2 * draws[0] - 1),
+        simulator.expense_volatility * (2 * draws[1] - 1)
+    )
+    pairs = (balances >= inputs.config.savings_goal).reshape(-1, 2).mean(axis=1)
+
+    assert result.simulations_run == 10_000
+    assert result.average_final_balance == pytest.approx(balances.mean(), rel=1e-12)
+    assert result.final_balance_std == pytest.approx(balances.std(), rel=1e-9)
+    assert result.worst_balance == pytest.approx(balances.min())
+    assert result.success_rate == (balances >= inputs.config.savings_goal).mean()
+    assert result.success_std_error == pytest.approx(pairs.std(ddof=1) / np.sqrt(len(pairs)))
+
+
+def test_float32_paths_match_float64_with_less_memory(make_inputs):
+
+    import tracemalloc
+
+    from financial_simulator.risk.path_model import PathModel
+
+    inputs = make_inputs(savings_goal=15000, months=120)
+    options = dict(runs=20_000, path_model=PathModel())
+
+    results, peaks = {}, {}
+    for dtype in ["float64", "float32"]:
+        MonteCarloSimulator(inputs, runs=16, seed=0, path_model=PathModel(), dtype=dtype).run()
+
+        tracemalloc.start()
+        results[dtype] = MonteCarloSimulator(inputs, seed=3, dtype=dtype, **options).run()
+        peaks[dtype] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    exact, reduced = results["float64"], results["float32"]
+    combined = np.hypot(exact.success_std_error, reduced.success_std_error)
+
+    assert reduced.success_rate == pytest.approx(exact.success_rate, abs=4 * combined)
+    assert reduced.average_final_balance == pytest.approx(exact.average_final_balance, rel=0.01)
+    assert np.allclose(reduced.balance_bands["p50"], exact.balance_bands["p50"], rtol=0.02, atol=500)
+    assert peaks["float32"] < 0.7 * peaks["float64"]
+
+
+def test_float32_kernel_paths_track_float64(make_inputs):
+
+    from financial_simulator.risk.path_model import PathModel
+
+    # quiet model: paths differ only by rounding, not by draws
+    quiet = PathModel(income_shock=0, expense_shock=0, job_loss_rate=0, one_off_rate=0)
+    inputs = make_inputs(months=120, initial_savings=500_000)
+
+    draws = draw_matrix(1000, seed=4)
+
+    paths = {}
+    for dtype in ["float64", "float32"]:
+        kernel = RunKernel.from_simulator(MonteCarloSimulator(inputs, path_model=quiet, dtype=dtype))
+        paths[dtype] = kernel.balance_paths(*kernel.variations(draws), np.random.default_rng(0))
+
+    assert paths["float32"].dtype == np.float32
+    assert np.abs(paths["float32"] - paths["float64"]).max() < 1.0
+
+
+def test_reduced_precision_needs_month_level_paths(make_inputs):
+
+    inputs = make_inputs()
+
+    with pytest.raises(ValueError):
+        MonteCarloSimulator(inputs, dtype="float16")
+
+    with pytest.raises(ValueError):
+        MonteCarloSimulator(inputs, dtype="float32")
+
+
+def test_peak_memory_does_not_grow_with_runs(make_inputs):
+
+    import tracemalloc
+
+    inputs = make_inputs()
+    MonteCarloSimulator(inputs, runs=16, seed=0).run()
+
+    peaks = []
+    for runs in [8192, 40 * 8192]:
+        tracemalloc.start()
+        MonteCarloSimulator(inputs, runs=runs, seed=0).run()
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    assert peaks[1] < 1.5 * peaks[0]
+
+
+# =========================
+# Tail-risk importance sampling
+# =========================
+
+def test_tail_tilt_weights_are_likelihood_ratios():
+
+    from financial_simulator.risk.importance import DEFENSIVE_SHARE, TailTilt, tilt_for_mean, tilted_mean
+
+    assert tilted_mean(tilt_for_mean(0.2)) == pytest.approx(0.2)
+
+    draws = np.random.default_rng(0).random((2, 200_000))
+    tilted, weights = TailTilt((-8.0, 5.0)).transform(draws)
+
+    assert tilted[0].mean() < 0.4 < 0.6 < tilted[1].mean()
+    assert weights.mean() == pytest.approx(1.0, abs=0.01)
+    assert (weights * tilted[0]).mean() == pytest.approx(0.5, abs=0.01)
+    assert weights.max() <= 1 / DEFENSIVE_SHARE ** 2
+
+    # order preserving, so stratified draws stay stratified
+    assert np.all(np.diff(tilted[0][np.argsort(draws[0])]) >= 0)
+
+    unchanged, unit = TailTilt().transform(draws)
+    assert np.array_equal(unchanged, draws) and np.all(unit == 1)
+
+
+def test_tail_risk_estimates_rare_failures(make_inputs):
+
+    inputs = make_inputs(savings_goal=14000)
+
+    brute = MonteCarloSimulator(inputs, runs=1_000_000, seed=1).run()
+    plain = MonteCarloSimulator(inputs, runs=300, seed=2).run()
+    tail = MonteCarloSimulator(inputs, runs=4096, seed=2, tail_risk=True).run()
+
+    assert 0 < brute.failure_rate < 0.001
+    assert plain.failure_rate == 0.0
+
+    combined = np.hypot(tail.success_std_error, brute.success_std_error)
+
+    assert tail.failure_rate == pytest.approx(brute.failure_rate, abs=4 * combined)
+    assert tail.success_std_error < 0.1 * np.sqrt(brute.failure_rate / 4096)
+    assert tail.confidence_interval[0] < 1 - tail.failure_rate < tail.confidence_interval[1]
+    assert tail.average_final_balance == pytest.approx(brute.average_final_balance, rel=0.01)
+
+
+def test_tail_risk_with_month_level_paths_is_unbiased(make_inputs):
+
+    from financial_simulator.risk.path_model import PathModel
+
+    inputs = make_inputs(savings_goal=15000)
+    options = dict(path_model=PathModel(), expense_volatility=0.2)
+
+    brute = MonteCarloSimulator(inputs, runs=60_000, seed=1, **options).run()
+    tail = MonteCarloSimulator(inputs, runs=8192, seed=2, tail_risk=True, **options).run()
+
+    combined = np.hypot(tail.success_std_error, brute.success_std_error)
+
+    assert tail.failure_rate == pytest.approx(brute.failure_rate, abs=4 * combined)
+
+
+def test_tail_risk_rejects_loop_and_adaptive_runs(make_inputs):
+
+    inputs = make_inputs()
+
+    with pytest.raises(ValueError):
+        MonteCarloSimulator(inputs, mode="loop", tail_risk=True)
+
+    with pytest.raises(ValueError):
+        MonteCarloSimulator(inputs, tail_risk=True, target_width=0.05)
+
+
+# =========================
+# Correlated expense categories
+# =========================
+
+CATEGORY_MODEL = dict(
+    volatility=0.05,
+    volatilities={"rent": 0.1, "groceries": 0.08},
+    correlations={("rent", "groceries"): 0.6},
+)
+
+
+def test_expense_model_factors_follow_the_covariance():
+
+    from financial_simulator.risk.expense_model import ExpenseModel
+
+    model = ExpenseModel(**CATEGORY_MODEL)
+    categories = ["rent", "groceries", "misc"]
+
+    cholesky = model.cholesky(categories)
+    volatilities = np.array([0.1, 0.08, 0.05])
+
+    assert cholesky @ cholesky.T == pytest.approx(
+        volatilities[:, None] * model.correlation_matrix(categories) * volatilities
+    )
+
+    factors = model.factors(cholesky, np.random.default_rng(0).random((3, 200_000)))
+
+    assert factors.shape == (200_000, 3)
+    assert factors.mean(axis=0) == pytest.approx(1.0, abs=0.002)
+    assert np.log(factors).std(axis=0) == pytest.approx(volatilities, rel=0.01)
+    assert np.corrcoef(np.log(factors).T)[0, 1] == pytest.approx(0.6, abs=0.01)
+
+    with pytest.raises(ValueError):
+        ExpenseModel(correlations={("a", "b"): 0.9, ("b", "c"): 0.9, ("a", "c"): -0.9}).cholesky("abc")
+
+    with pytest.raises(ValueError):
+        ExpenseModel(volatilities={"rent": -0.1})
+
+
+def test_category_shocks_match_the_loop_reference(make_inputs):
+
+    from financial_simulator.risk.expense_model import ExpenseModel
+
+    inputs = make_inputs()
+    model = ExpenseModel(**CATEGORY_MODEL)
+
+    draws = draw_matrix(300, seed=3, dims=5)
+
+    vectorized = MonteCarloSimulator(inputs, runs=300, expense_model=model).run(draws=draws)
+    loop = MonteCarloSimulator(inputs, runs=300, expense_model=model, mode="loop").run(draws=draws)
+
+    assert vectorized.average_final_balance == pytest.approx(loop.average_final_balance, abs=0.1)
+    assert vectorized.worst_balance == pytest.approx(loop.worst_balance, abs=0.1)
+    assert vectorized.success_rate == loop.success_rate
+
+    with pytest.raises(ValueError):
+        MonteCarloSimulator(inputs, runs=300, expense_model=model).run(draws=draws[:2])
+
+
+def test_category_shocks_need_an_itemized_budget(make_inputs):
+
+    from financial_simulator.risk.expense_model import ExpenseModel
+
+    inputs = make_inputs(expenses=None, monthly_expenses=2100)
+
+    with pytest.raises(ValueError):
+        MonteCarloSimulator(inputs, expense_model=ExpenseModel())
+
+    unbudgeted = make_inputs(expenses={"rent": 0, "misc": 0})
+
+    with pytest.raises(ValueError):
+        MonteCarloSimulator(unbudgeted, expense_model=ExpenseModel())
+
+
+def test_sobol_category_shocks_cover_every_shipped_category(make_inputs):
+
+    from financial_simulator.core.tax.expense_tax_engine import ExpenseCategoryIndex
+    from financial_simulator.data.provinces import PROVINCES_DATA
+    from financial_simulator.risk.expense_model import ExpenseModel
+    from financial_simulator.risk.samplers import SOBOL_MAX_DIMS
+
+    categories = ExpenseCategoryIndex.for_provinces(PROVINCES_DATA).categories
+    inputs = make_inputs(expenses={category: 100 for category in categories})
+    model = ExpenseModel(volatility=0.05)
+
+    simulator = MonteCarloSimulator(inputs, runs=1024, seed=4, sampler="sobol", expense_model=model)
+    result = simulator.run()
+
+    assert simulator.dims == 1 + len(categories) <= SOBOL_MAX_DIMS
+    assert 0.0 <= result.success_rate <= 1.0
+
+    draws = draw_matrix(1024, seed=4, sampler="sobol", dims=simulator.dims)
+
+    for row in draws:
+        assert sorted(np.floor(row * 1024).astype(int)) == list(range(1024))
+
+    oversized = make_inputs(expenses={f"category_{i}": 100 for i in range(SOBOL_MAX_DIMS)})
+
+    with pytest.raises(ValueError, match="latin_hypercube"):
+        MonteCarloSimulator(oversized, sampler="sobol", expense_model=model)
+
+    MonteCarloSimulator(oversized, sampler="latin_hypercube", expense_model=model)
+
+
+def test_tail_risk_tilts_every_expense_category(make_inputs):
+
+    from financial_simulator.risk.expense_model import ExpenseModel
+
+    inputs = make_inputs(savings_goal=12000)
+    options = dict(expense_model=ExpenseModel(volatility=0.15, volatilities={"rent": 0.2}, correlation=0.3))
+
+    brute = MonteCarloSimulator(inputs, runs=400_000, seed=1, **options).run()
+    plain = MonteCarloSimulator(inputs, runs=4096, seed=2, **options).run()
+    tail = MonteCarloSimulator(inputs, runs=4096, seed=2, tail_risk=True, **options).run()
+
+    combined = np.hypot(tail.success_std_error, brute.success_std_error)
+
+    assert tail.failure_rate == pytest.approx(brute.failure_rate, abs=4 * combined)
+    assert tail.success_std_error < 0.5 * plain.success_std_error
+
+
+def test_compare_scenarios_with_category_shocks(make_inputs):
+
+    from financial_simulator.risk.expense_model import ExpenseModel
+
+    low, high = make_inputs(monthly_income=5000), make_inputs(monthly_income=5600)
+    model = ExpenseModel(**CATEGORY_MODEL)
+
+    results = compare_scenarios([low, high], runs=512, seed=4, expense_model=model)
+
+    assert results[1] == MonteCarloSimulator(high, runs=512, seed=4, expense_model=model).run()
+    assert results[0].average_final_balance < results[1].average_final_balance
+
+
+# =========================
+# Result cache
+# =========================
+
+def test_inputs_fingerprint_is_canonical(make_inputs):
+
+    base = make_inputs().fingerprint()
+
+    reordered = make_inputs(
+        expenses={"misc": 80, "restaurant": 120.0, "groceries": 400, "rent": 1500},
+        monthly_income=5200.0
+    )
+
+    assert reordered.fingerprint() == base
+    assert make_inputs(savings_goal=30001).fingerprint() != base
+    assert make_inputs(province="ontario").fingerprint() != base
+
+
+def test_simulation_key_covers_monte_carlo_parameters(make_inputs):
+
+    from financial_simulator.risk.expense_model import ExpenseModel
+    from financial_simulator.risk.result_cache import simulation_key
+
+    inputs = make_inputs()
+    key = simulation_key(MonteCarloSimulator(inputs, runs=64, seed=1))
+
+    assert simulation_key(MonteCarloSimulator(inputs, runs=64, seed=1, workers=4)) == key
+    assert simulation_key(MonteCarloSimulator(inputs, runs=64, seed=2)) != key
+    assert simulation_key(MonteCarloSimulator(inputs, runs=64, seed=1, sampler="sobol")) != key
+
+    def model_key(pair):
+        model = ExpenseModel(correlations={pair: 0.5})
+        return simulation_key(MonteCarloSimulator(inputs, runs=64, seed=1, expense_model=model))
+
+    assert model_key(("rent", "misc")) == model_key(("misc", "rent")) != key
+
+
+def test_simulation_rows_are_keyed_by_the_inputs_fingerprint(make_inputs):
+
+    pytest.importorskip("sqlalchemy")
+
+    from financial_simulator.database.models import Simulation
+
+    inputs = make_inputs()
+    row = Simulation.from_inputs(user_id=1, inputs=inputs)
+
+    reordered = make_inputs(expenses={"misc": 80, "restaurant": 120, "groceries": 400, "rent": 1500})
+
+    assert row.inputs_hash == inputs.fingerprint()
+    assert Simulation.from_inputs(user_id=1, inputs=reordered).inputs_hash == row.inputs_hash
+
+
+def test_cache_skips_repeat_runs(monkeypatch, make_inputs):
+
+    from financial_simulator.risk.result_cache import MonteCarloCache
+
+    cache = MonteCarloCache()
+    first = cache.run(MonteCarloSimulator(make_inputs(), runs=256, seed=3))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Monte Carlo ran again")
+
+    monkeypatch.setattr(MonteCarloSimulator, "run", fail)
+
+    assert cache.run(MonteCarloSimulator(make_inputs(), runs=256, seed=3)) == first
+    assert cache.stats()["runs"] == 1 and cache.stats()["hits"] == 1
+
+
+def test_cache_runs_unseeded_and_time_budgeted_jobs(monkeypatch, make_inputs):
+
+    from financial_simulator.risk.result_cache import MonteCarloCache
+
+    cache = MonteCarloCache()
+    calls = []
+    run = MonteCarloSimulator.run
+
+    def counted(self, *args, **kwargs):
+        calls.append(self)
+        return run(self, *args, **kwargs)
+
+    monkeypatch.setattr(MonteCarloSimulator, "run", counted)
+
+    for _ in range(2):
+        cache.run(MonteCarloSimulator(make_inputs(), runs=256))
+        cache.run(MonteCarloSimulator(make_inputs(), runs=256, seed=3, time_budget=1.0))
+
+    assert len(calls) == 4
+    assert len(cache.memory) == 0
+
+
+def test_cached_results_are_not_shared_mutable_state(make_inputs):
+
+    from financial_simulator.risk.path_model import PathModel
+    from financial_simulator.risk.result_cache import MonteCarloCache
+
+    cache = MonteCarloCache()
+    simulator = MonteCarloSimulator(make_inputs(), runs=256, seed=3, path_model=PathModel())
+
+    first = cache.run(simulator)
+    expected = np.array(first.survival_curve)
+
+    first.success_rate = -1.0
+    first.balance_bands.pop("p95")
+
+    with pytest.raises(ValueError):
+        first.survival_curve[0] = 0.0
+
+    second = cache.run(simulator)
+
+    assert second.success_rate >= 0
+    assert "p95" in second.balance_bands
+    assert np.array_equal(second.survival_curve, expected)
+
+
+def test_sqlite_tier_survives_a_new_process_cache(tmp_path, make_inputs):
+
+    from financial_simulator.risk.path_model import PathModel
+    from financial_simulator.risk.result_cache import MonteCarloCache, SqliteResultStore
+
+    path = tmp_path / "monte_carlo.sqlite"
+    simulator = MonteCarloSimulator(make_inputs(), runs=256, seed=3, path_model=PathModel())
+
+    result = MonteCarloCache(store=SqliteResultStore(path)).run(simulator)
+
+    restarted = MonteCarloCache(store=SqliteResultStore(path))
+    cached = restarted.run(simulator)
+
+    assert restarted.stats()["runs"] == 0
+    assert cached == result
+    assert cached.confidence_interval == result.confidence_interval
+    assert np.array_equal(cached.survival_curve, result.survival_curve)
+    assert np.array_equal(cached.balance_bands["p95"], result.balance_bands["p95"])
+
+
+# =========================
+# Checkpoints
+# =========================
+
+def crash_after(monkeypatch, chunks):
+
+    calls = []
+    simulate_chunk = RunKernel.simulate_chunk
+
+    def crashing(self, *args, **kwargs):
+        if len(calls) == chunks:
+            raise KeyboardInterrupt("worker restart")
+        calls.append(1)
+        return simulate_chunk(self, *args, **kwargs)
+
+    monkeypatch.setattr(RunKernel, "simulate_chunk", crashing)
+
+
+@pytest.mark.parametrize("with_paths", [False, True])
+def test_resumed_run_equals_uninterrupted_run(tmp_path, monkeypatch, with_paths, make_inputs):
+
+    from financial_simulator.risk.path_model import PathModel
+
+    inputs = make_inputs()
+    options = dict(runs=9 * 1024, seed=6, path_model=PathModel() if with_paths else None, tail_risk=True)
+
+    monkeypatch.setattr("financial_simulator.risk.monte_carlo.CHUNK_SIZE", 1024)
+
+    expected = MonteCarloSimulator(inputs, **options).run()
+
+    path = tmp_path / "job.npz"
+
+    with monkeypatch.context() as patch:
+        crash_after(patch, 5)
+        with pytest.raises(KeyboardInterrupt):
+            MonteCarloSimulator(inputs, checkpoint=path, checkpoint_every=2, **options).run()
+
+    assert path.exists()
+
+    # the last checkpoint holds 4 of the 9 chunks
+    calls = []
+    simulate_chunk = RunKernel.simulate_chunk
+    monkeypatch.setattr(RunKernel, "simulate_chunk", lambda *a, **k: calls.append(1) or simulate_chunk(*a, **k))
+
+    resumed = MonteCarloSimulator(inputs, checkpoint=path, checkpoint_every=2, **options).run()
+
+    assert len(calls) == 5
+    assert resumed == expected
+    assert resumed.final_balance_std == expected.final_balance_std
+    assert np.array_equal(resumed.survival_curve, expected.survival_curve)
+    assert all(np.array_equal(resumed.balance_bands[k], expected.balance_bands[k]) for k in expected.balance_bands)
+    assert not path.exists()
+
+
+def test_unseeded_job_resumes_on_its_own_streams(tmp_path, monkeypatch, make_inputs):
+
+    import shutil
+
+    inputs = make_inputs()
+    monkeypatch.setattr("financial_simulator.risk.monte_carlo.CHUNK_SIZE", 512)
+
+    path = tmp_path / "job.npz"
+
+    with monkeypatch.context() as patch:
+        crash_after(patch, 3)
+        with pytest.raises(KeyboardInterrupt):
+            MonteCarloSimulator(inputs, runs=4096, checkpoint=path, checkpoint_every=1).run()
+
+    shutil.copy(path, tmp_path / "copy.npz")
+
+    first = MonteCarloSimulator(inputs, runs=4096, checkpoint=path).run()
+    second = MonteCarloSimulator(inputs, runs=4096, checkpoint=tmp_path / "copy.npz").run()
+
+    assert first == second
+    assert first.simulations_run == 4096
+
+
+def test_checkpoint_of_another_job_is_ignored(tmp_path, monkeypatch, make_inputs):
+
+    inputs = make_inputs()
+    monkeypatch.setattr("financial_simulator.risk.monte_carlo.CHUNK_SIZE", 512)
+
+    path = tmp_path / "job.npz"
+
+    with monkeypatch.context() as patch:
+        crash_after(patch, 3)
+        with pytest.raises(KeyboardInterrupt):
+            MonteCarloSimulator(inputs, runs=4096, seed=1, checkpoint=path, checkpoint_every=1).run()
+
+    other = MonteCarloSimulator(inputs, runs=4096, seed=2, checkpoint=path).run()
+
+    assert other == MonteCarloSimulator(inputs, runs=4096, seed=2).run()
+
+    with pytest.raises(ValueError):
+        MonteCarloSimulator(inputs, checkpoint=path, target_width=0.05)
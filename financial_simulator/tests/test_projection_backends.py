@@ -0,0 +1,285 @@
+# financial_simulator/tests/test_projection_backends.py
+import json
+import random
+
+import numpy as np
+import pytest
+
+from financial_simulator.core.engine import ProjectionEngine, constant_hook
+from financial_simulator.core.batch_engine import BatchProjectionEngine
+
+
+def assert_same_result(expected, actual):
+
+    assert actual.final_balance == pytest.approx(expected.final_balance)
+    assert actual.max_negative_balance == pytest.approx(expected.max_negative_balance)
+    assert actual.goal_reached_month == expected.goal_reached_month
+    assert actual.went_negative_during_simulation == expected.went_negative_during_simulation
+    assert actual.insolvent_before_income == expected.insolvent_before_income
+    assert actual.avg_net_income == pytest.approx(expected.avg_net_income)
+    assert actual.avg_monthly_expenses == pytest.approx(expected.avg_monthly_expenses)
+    assert list(actual.monthly_balances) == pytest.approx(list(expected.monthly_balances))
+
+
+profiles = [
+    pytest.param({}, id="growth"),
+    pytest.param(dict(initial_savings=1000, monthly_income=1000, monthly_expenses=1500), id="decline"),
+    pytest.param(dict(initial_savings=0, one_time_cost=0, monthly_income=0, monthly_expenses=800), id="no_income"),
+    pytest.param(dict(savings_goal=0, months=1), id="single_month"),
+]
+
+
+# =========================
+# Vectorized backend
+# =========================
+
+@pytest.mark.parametrize("force", [True, False])
+@pytest.mark.parametrize("profile", profiles)
+def test_vectorized_matches_loop(profile, force, default_inputs):
+
+    inputs = default_inputs(**profile)
+    engine = ProjectionEngine(inputs)
+
+    expected = engine.simulate(force=force)
+    actual = engine.simulate(force=force, backend="vectorized")
+
+    assert_same_result(expected, actual)
+
+
+def test_vectorized_applies_monthly_hook(default_inputs):
+
+    inputs = default_inputs(initial_savings=500, monthly_income=1200, months=24)
+    engine = ProjectionEngine(inputs)
+
+    def hook(month, cashflow):
+        return cashflow - (150 if month % 3 == 0 else 25)
+
+    expected = engine.simulate(monthly_hook=hook, force=True)
+    actual = engine.simulate(monthly_hook=hook, force=True, backend="vectorized")
+
+    assert_same_result(expected, actual)
+
+
+# =========================
+# Analytic backend
+# =========================
+
+@pytest.mark.parametrize("force", [True, False])
+@pytest.mark.parametrize("profile", profiles + [
+    pytest.param(dict(initial_savings=3333.33, monthly_income=1234.56, monthly_expenses=1987.65, months=60), id="fractional_decline"),
+    pytest.param(dict(initial_savings=5000, monthly_income=2000, monthly_expenses=1000, savings_goal=10000), id="goal_on_boundary"),
+])
+def test_analytic_matches_loop(profile, force, default_inputs):
+
+    inputs = default_inputs(**profile)
+    engine = ProjectionEngine(inputs)
+
+    @constant_hook
+    def hook(month, cashflow):
+        return cashflow - 42.5
+
+    expected = engine.simulate(monthly_hook=hook, force=force)
+    actual = engine.simulate(monthly_hook=hook, force=force, backend="analytic")
+
+    assert_same_result(expected, actual)
+
+
+@pytest.mark.parametrize("backend", ["vectorized", "auto"])
+def test_constant_hook_need_not_be_additive(backend, default_inputs):
+
+    engine = ProjectionEngine(default_inputs(initial_savings=0, months=4))
+
+    @constant_hook
+    def hook(month, cashflow):
+        return cashflow * 0.9
+
+    result = engine.simulate(
+        monthly_income=np.array([1000.0, 2000.0, 3000.0, 4000.0]),
+        monthly_hook=hook,
+        force=True,
+        backend=backend
+    )
+
+    assert np.allclose(result.monthly_balances, [0, 900, 2700, 5400])
+
+    loop = engine.simulate(monthly_hook=hook, force=True)
+    fast = engine.simulate(monthly_hook=hook, force=True, backend=backend)
+
+    assert_same_result(loop, fast)
+
+
+@pytest.mark.parametrize("backend", ["analytic", "vectorized", "auto"])
+@pytest.mark.parametrize("initial_savings", [6000, 12000])
+def test_zero_cashflow(backend, initial_savings, default_inputs):
+
+    inputs = default_inputs(initial_savings=initial_savings, monthly_income=0, monthly_expenses=0)
+    engine = ProjectionEngine(inputs)
+
+    expected = engine.simulate()
+    actual = engine.simulate(backend=backend)
+
+    assert actual.final_balance == initial_savings
+    assert_same_result(expected, actual)
+
+
+def test_analytic_skips_series_unless_requested(default_inputs):
+
+    engine = ProjectionEngine(default_inputs(months=360))
+
+    result = engine.simulate(force=True, backend="analytic", include_balances=False)
+
+    assert result.monthly_balances.size == 0
+    assert result.monthly_projections == []
+    assert result.final_balance == 5000 + 360 * 2000
+
+
+def test_auto_falls_back_for_month_dependent_hook(default_inputs):
+
+    inputs = default_inputs(months=6)
+    engine = ProjectionEngine(inputs)
+
+    def hook(month, cashflow):
+        return cashflow - month * 100
+
+    expected = engine.simulate(monthly_hook=hook, force=True)
+    actual = engine.simulate(monthly_hook=hook, force=True, backend="auto")
+
+    assert_same_result(expected, actual)
+
+    with pytest.raises(ValueError):
+        engine.simulate(monthly_hook=hook, backend="analytic")
+
+
+# =========================
+# Batch engine
+# =========================
+
+def random_inputs(default_inputs, rng, months=None):
+    return default_inputs(
+        initial_savings=rng.randint(0, 20000),
+        one_time_cost=rng.randint(0, 5000),
+        monthly_income=rng.randint(0, 5000),
+        monthly_expenses=rng.randint(500, 4000),
+        months=months or rng.randint(1, 48),
+        savings_goal=rng.randint(0, 30000),
+    )
+
+
+@pytest.mark.parametrize("force", [True, False])
+@pytest.mark.parametrize("include_balances", [True, False])
+def test_batch_matches_single_scenarios(force, include_balances, default_inputs):
+
+    rng = random.Random(7)
+    inputs_list = [random_inputs(default_inputs, rng) for _ in range(200)]
+
+    batch = BatchProjectionEngine(inputs_list).simulate(
+        force=force,
+        include_balances=include_balances
+    )
+
+    assert len(batch) == 200
+
+    for index, inputs in enumerate(inputs_list):
+        expected = ProjectionEngine(inputs).simulate(force=force)
+        actual = batch.to_projection(index)
+
+        if not include_balances:
+            actual.monthly_balances = expected.monthly_balances
+
+        assert_same_result(expected, actual)
+
+
+def test_batch_per_month_cashflows(default_inputs):
+
+    rng = random.Random(11)
+    inputs_list = [random_inputs(default_inputs, rng, months=18) for _ in range(20)]
+    adjustments = np.array([
+        [-(month % 4) * 50.0 for month in range(1, 19)]
+        for _ in inputs_list
+    ])
+
+    batch = BatchProjectionEngine(inputs_list).simulate(
+        monthly_adjustment=adjustments,
+        force=True,
+        include_balances=True
+    )
+
+    for index, inputs in enumerate(inputs_list):
+
+        def hook(month, cashflow):
+            return cashflow + adjustments[index, month - 1]
+
+        expected = ProjectionEngine(inputs).simulate(monthly_hook=hook, force=True)
+
+        assert_same_result(expected, batch.to_projection(index))
+        assert batch.monthly_balances(index).base is not None
+
+
+def test_batch_float32_stays_within_a_dollar_of_float64(default_inputs):
+
+    rng = np.random.default_rng(5)
+    inputs_list = [
+        default_inputs(initial_savings=250_000, monthly_income=20_000, months=120, savings_goal=1_500_000)
+        for _ in range(50)
+    ]
+    adjustments = rng.normal(0, 500, (50, 120))
+
+    engine = BatchProjectionEngine(inputs_list)
+    options = dict(monthly_adjustment=adjustments, force=True, include_balances=True)
+
+    expected = engine.simulate(**options)
+    reduced = engine.simulate(dtype=np.float32, **options)
+
+    assert reduced.balances.dtype == np.float32
+    assert np.abs(reduced.balances - expected.balances).max() < 1.0
+    assert np.abs(reduced.final_balance - expected.final_balance).max() < 1.0
+    assert np.array_equal(reduced.goal_reached_month, expected.goal_reached_month)
+
+    with pytest.raises(ValueError):
+        engine.simulate(dtype=np.int32)
+
+
+# =========================
+# Column storage
+# =========================
+
+@pytest.mark.parametrize("backend", ["loop", "vectorized", "analytic"])
+def test_columns_back_monthly_projections(backend, default_inputs):
+
+    inputs = default_inputs(months=360)
+    result = ProjectionEngine(inputs).simulate(force=True, backend=backend)
+
+    assert result.columns.data.shape == (len(result.columns.FIELDS), 360)
+    assert result.columns.data.dtype == np.float64
+
+    month = result.monthly_projections[11]
+
+    assert month.month == 12
+    assert month.balance == pytest.approx(5000 + 12 * 2000)
+    assert month.net_income == month.income == 3000
+    assert month.expenses == 1000
+    assert not hasattr(month, "__dict__")
+
+
+def test_projection_to_dict_serializes_columns(default_inputs):
+
+    inputs = default_inputs(months=3)
+    result = ProjectionEngine(inputs).simulate(force=True)
+
+    data = result.to_dict()
+    json.dumps(data)
+
+    assert data["monthly_balances"] == [7000, 9000, 11000]
+    assert data["monthly_columns"]["month"] == [1, 2, 3]
+    assert data["monthly_columns"]["expenses"] == [1000, 1000, 1000]
+
+    # the series is serialized once, as columns
+    assert data["monthly_projections"] == []
+
+
+def test_unknown_backend_rejected(default_inputs):
+
+    engine = ProjectionEngine(default_inputs())
+
+    with pytest.raises(ValueError):
+        engine.simulate(backend="gpu")
@@ -0,0 +1,506 @@
+# financial_simulator/tests/test_tax_engines.py
+import json
+import random
+
+import numpy as np
+import pytest
+
+from financial_simulator.core.tax.brackets import BracketSchedule, compile_brackets
+from financial_simulator.core.tax.income_tax_engine import IncomeTaxEngine
+from financial_simulator.core.tax.expense_tax_engine import ExpenseTaxEngine, ExpenseTaxMatrix
+from financial_simulator.data.provinces import PROVINCES_DATA, PAYROLL_DATA, get_payroll_config
+
+
+# =========================
+# Reference implementations (bracket walk)
+# =========================
+
+def walk_brackets(income, brackets):
+
+    if income <= 0:
+        return 0.0
+
+    tax = 0.0
+    previous_limit = 0.0
+
+    for bracket in brackets:
+        if "up_to" in bracket:
+            taxable = min(income, bracket["up_to"]) - previous_limit
+            if taxable > 0:
+                tax += taxable * bracket["rate"]
+            previous_limit = bracket["up_to"]
+        elif "above" in bracket and income > bracket["above"]:
+            tax += (income - bracket["above"]) * bracket["rate"]
+
+    return tax
+
+
+def walk_payroll(income, payroll_data):
+
+    details = {}
+
+    for system in ["cpp", "qpp"]:
+        config = payroll_data.get(system, {})
+        if config.get("enabled"):
+            base_income = max(0, income - config.get("basic_exemption", 0))
+            details[system] = sum(min(base_income, r["up_to"]) * r["rate"] for r in config["rates"])
+
+    for system in ["ei", "qpip"]:
+        config = payroll_data.get(system, {})
+        if config.get("enabled"):
+            details[system] = min(income, config.get("max_insurable_earnings", income)) * config["rate"]
+
+    return details
+
+
+def walk_sales_tax(expenses, expense_config):
+
+    total = 0.0
+    for category, amount in expenses.items():
+        if amount > 0:
+            rate = expense_config["category_rules"].get(category, expense_config["combined_rate"])
+            total += amount * rate
+
+    return total
+
+
+BUDGETS = [
+    {"rent": 1500, "groceries": 400, "restaurant": 120, "misc": 80},
+    {"rent": 900, "transport": 100, "fuel": -20, "phone": 60, "gym": 45},
+    {"insurance": 200, "utilities": 150, "unknown_category": 300},
+]
+
+
+def sample_incomes():
+    rng = random.Random(3)
+    return [0, 1, 3500, 58523, 68500 + 3500, 250000, 1_000_000] + [
+        rng.uniform(0, 400000) for _ in range(200)
+    ]
+
+
+# =========================
+# Compiled bracket tables
+# =========================
+
+@pytest.mark.parametrize("province", sorted(PROVINCES_DATA))
+def test_compiled_brackets_match_walk(province):
+
+    for level in ["federal", "provincial"]:
+        brackets = PROVINCES_DATA[province]["income_tax"][level]["brackets"]
+        schedule = compile_brackets(brackets)
+
+        for income in sample_incomes():
+            assert schedule(income) == pytest.approx(walk_brackets(income, brackets), abs=1e-6)
+
+
+def test_compiled_brackets_are_shared():
+
+    federal = [PROVINCES_DATA[p]["income_tax"]["federal"]["brackets"] for p in PROVINCES_DATA]
+
+    assert len({id(compile_brackets(b)) for b in federal}) == 1
+
+
+def test_schedule_handles_gaps_and_stacked_rates():
+
+    schedule = BracketSchedule.from_segments([
+        (0, 100, 0.1),
+        (200, float("inf"), 0.2),
+        (150, float("inf"), 0.05),
+    ])
+
+    assert schedule(100) == pytest.approx(10)
+    assert schedule(180) == pytest.approx(10 + 30 * 0.05)
+    assert schedule(300) == pytest.approx(10 + 150 * 0.05 + 100 * 0.2)
+
+
+@pytest.mark.parametrize("payroll_key", sorted(PAYROLL_DATA))
+def test_compiled_payroll_matches_walk(payroll_key):
+
+    engine = IncomeTaxEngine(PROVINCES_DATA["ontario"], PAYROLL_DATA[payroll_key])
+
+    for income in sample_incomes()[1:]:
+        expected = walk_payroll(income, PAYROLL_DATA[payroll_key])
+        actual = engine.calculate_payroll(income, period="annual")
+
+        assert list(actual) == list(expected) + ["total"]
+        for system, value in expected.items():
+            assert actual[system] == pytest.approx(value, abs=1e-6)
+
+
+def test_net_income_monthly_matches_walk():
+
+    for province in PROVINCES_DATA:
+        data = PROVINCES_DATA[province]
+        payroll = get_payroll_config(province)
+        engine = IncomeTaxEngine(data, payroll)
+
+        monthly = 6250.0
+        annual = monthly * 12
+
+        deductions = (
+            walk_brackets(annual, data["income_tax"]["federal"]["brackets"])
+            + walk_brackets(annual, data["income_tax"]["provincial"]["brackets"])
+            + sum(walk_payroll(annual, payroll).values())
+        ) / 12
+
+        result = engine.calculate_net_income(monthly, period="monthly")
+
+        assert result["net_income"] == pytest.approx(monthly - deductions)
+
+
+# =========================
+# Batch net income
+# =========================
+
+@pytest.mark.parametrize("period", ["monthly", "annual"])
+@pytest.mark.parametrize("province", ["quebec", "ontario", "nunavut"])
+def test_net_income_batch_matches_scalar(province, period):
+
+    engine = IncomeTaxEngine(PROVINCES_DATA[province], get_payroll_config(province))
+    incomes = [-50.0] + sample_incomes()
+
+    batch = engine.calculate_net_income_batch(incomes, period=period)
+
+    for i, income in enumerate(incomes):
+        expected = engine.calculate_net_income(income, period=period)
+
+        assert batch["net_income"][i] == pytest.approx(expected["net_income"], abs=1e-6)
+        assert batch["effective_rate"][i] == pytest.approx(expected["effective_rate"], abs=1e-9)
+
+        if income > 0:
+            assert batch["federal_tax"][i] == pytest.approx(expected["income_tax"]["federal_tax"], abs=1e-6)
+            assert batch["provincial_tax"][i] == pytest.approx(expected["income_tax"]["provincial_tax"], abs=1e-6)
+            for system, value in expected["payroll"].items():
+                assert batch["payroll"][system][i] == pytest.approx(value, abs=1e-6)
+
+
+def test_net_income_array_matches_batch():
+
+    engine = IncomeTaxEngine(PROVINCES_DATA["quebec"], get_payroll_config("quebec"))
+    incomes = np.array([-50.0] + sample_incomes()).reshape(-1, 1) * [1.0, 0.5]
+
+    expected = engine.calculate_net_income_batch(incomes, period="monthly")["net_income"]
+
+    assert np.allclose(engine.calculate_net_income_array(incomes, period="monthly"), expected, atol=1e-6)
+
+
+def test_net_income_array_keeps_float32():
+
+    engine = IncomeTaxEngine(PROVINCES_DATA["quebec"], get_payroll_config("quebec"))
+    incomes = np.array([-50.0] + sample_incomes()).reshape(-1, 1) * [1.0, 0.5]
+
+    expected = engine.calculate_net_income_array(incomes, period="monthly")
+    reduced = engine.calculate_net_income_array(incomes.astype(np.float32), period="monthly")
+
+    assert reduced.dtype == np.float32
+    assert np.allclose(reduced, expected, rtol=1e-6, atol=0.01)
+
+
+# =========================
+# Shared tax cache
+# =========================
+
+def test_tax_cache_is_shared_across_engines():
+
+    from financial_simulator.core.tax.tax_cache import TAX_CACHE
+
+    TAX_CACHE.clear()
+
+    first = IncomeTaxEngine(PROVINCES_DATA["ontario"], PAYROLL_DATA["canada"])
+    second = IncomeTaxEngine(PROVINCES_DATA["ontario"], PAYROLL_DATA["canada"])
+
+    a = first.calculate_income_tax(5000.004, "monthly")
+    b = second.calculate_income_tax(5000.001, "monthly")
+
+    assert a == b
+    assert a is not b
+    assert TAX_CACHE.stats()["hits"] == 1
+    assert TAX_CACHE.stats()["misses"] == 1
+
+
+def test_cached_income_tax_is_computed_on_the_exact_income():
+
+    from financial_simulator.core.tax.tax_cache import TAX_CACHE
+
+    TAX_CACHE.clear()
+
+    engine = IncomeTaxEngine(PROVINCES_DATA["ontario"], PAYROLL_DATA["canada"])
+
+    scalar = engine.calculate_net_income(12345.678, "monthly")["net_income"]
+    array = engine.calculate_net_income_array(np.array([12345.678]), period="monthly")[0]
+
+    assert scalar == pytest.approx(array, abs=1e-9)
+
+
+def test_tax_cache_lru_and_ttl_eviction():
+
+    from financial_simulator.core.tax.tax_cache import TaxResultCache
+
+    now = [0.0]
+    cache = TaxResultCache(maxsize=2, ttl=10, clock=lambda: now[0])
+
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    now[0] = 11
+    assert cache.get("a") is None
+
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 2
+    assert stats["misses"] == 2
+
+
+# =========================
+# Compiled expense tax
+# =========================
+
+@pytest.mark.parametrize("province", sorted(PROVINCES_DATA))
+def test_sales_tax_dot_product_matches_walk(province):
+
+    config = PROVINCES_DATA[province]["expense_tax"]
+    engine = ExpenseTaxEngine(PROVINCES_DATA[province])
+
+    for budget in BUDGETS:
+        assert engine.calculate_sales_tax(budget) == pytest.approx(walk_sales_tax(budget, config))
+
+    assert engine.calculate_sales_tax(None) == 0.0
+
+
+def test_sales_tax_matrix_covers_all_provinces():
+
+    matrix = ExpenseTaxMatrix(PROVINCES_DATA)
+    taxes = matrix.calculate_sales_tax_batch(BUDGETS)
+
+    assert taxes.shape == (len(BUDGETS), len(PROVINCES_DATA))
+
+    for i, budget in enumerate(BUDGETS):
+        for j, province in enumerate(matrix.provinces):
+            expected = walk_sales_tax(budget, PROVINCES_DATA[province]["expense_tax"])
+            assert taxes[i, j] == pytest.approx(expected)
+
+
+# =========================
+# All-provinces tensor
+# =========================
+
+def test_province_tensor_matches_per_province_engines():
+
+    from financial_simulator.core.tax.province_tensor import default_province_tensor
+
+    tensor = default_province_tensor()
+    incomes = [0.0, 1800.0, 4321.09, 9000.0, 60000.0]
+
+    evaluation = tensor.evaluate(incomes, period="monthly", expenses=BUDGETS[0])
+
+    assert evaluation["net_income"].shape == (len(incomes), len(PROVINCES_DATA))
+
+    for column, province in enumerate(tensor.provinces):
+        engine = IncomeTaxEngine(PROVINCES_DATA[province], get_payroll_config(province))
+        expense_engine = ExpenseTaxEngine(PROVINCES_DATA[province])
+
+        for row, income in enumerate(incomes):
+            expected = engine.calculate_net_income(income, period="monthly")
+            assert evaluation["net_income"][row, column] == pytest.approx(expected["net_income"], abs=1e-6)
+
+        assert evaluation["sales_tax"][column] == pytest.approx(expense_engine.calculate_sales_tax(BUDGETS[0]))
+
+
+def test_province_optimizer_after_tax_ranking(simulation_request):
+
+    from financial_simulator.analysis.province_optimizer import ProvinceOptimizer
+    from financial_simulator.core.inputs import build_inputs
+    from financial_simulator.core.projection import run_projection
+
+    inputs = build_inputs(simulation_request(expenses=BUDGETS[0], savings_goal=20000, province="ontario"))
+    ranking = ProvinceOptimizer(inputs, PROVINCES_DATA, after_tax=True).find_best_provinces()["ranking"]
+
+    ontario = next(r for r in ranking if r["province"] == "ontario")
+    projection, _ = run_projection(inputs)
+
+    assert len(ranking) == len(PROVINCES_DATA)
+    assert ontario["final_balance"] == pytest.approx(projection.final_balance)
+
+
+def test_province_optimizer_monte_carlo_is_reproducible(simulation_request):
+
+    from financial_simulator.analysis.province_optimizer import ProvinceOptimizer
+    from financial_simulator.core.inputs import build_inputs
+
+    inputs = build_inputs(simulation_request(expenses=BUDGETS[0], province="ontario"))
+
+    def success_rates():
+        ranking = ProvinceOptimizer(inputs, PROVINCES_DATA, monte_carlo_runs=300, seed=3).find_best_provinces()["ranking"]
+        return {r["province"]: r["success_rate"] for r in ranking}
+
+    assert success_rates() == success_rates()
+
+
+# =========================
+# Inverse solver
+# =========================
+
+@pytest.mark.parametrize("province", sorted(PROVINCES_DATA))
+def test_required_gross_income_inverts_net_income(province):
+
+    engine = IncomeTaxEngine(PROVINCES_DATA[province], get_payroll_config(province))
+    targets = [-10.0, 0.0, 250.0, 2500.0, 4000.0, 7777.77, 25000.0, 80000.0]
+
+    gross = engine.required_gross_income(targets, period="monthly")
+
+    for target, income in zip(targets, gross):
+        net = engine.calculate_net_income(float(income), period="monthly")["net_income"]
+        assert net == pytest.approx(target, abs=0.01)
+
+    assert isinstance(engine.required_gross_income(3000.0), float)
+
+
+def test_required_gross_income_all_provinces():
+
+    from financial_simulator.core.tax.province_tensor import default_province_tensor
+
+    tensor = default_province_tensor()
+    gross = tensor.required_gross_income([3000.0, 6000.0], period="monthly")
+
+    assert gross.shape == (2, len(PROVINCES_DATA))
+
+    for column, province in enumerate(tensor.provinces):
+        engine = IncomeTaxEngine(PROVINCES_DATA[province], get_payroll_config(province))
+        assert gross[1, column] == pytest.approx(engine.required_gross_income(6000.0))
+
+
+# =========================
+# Compiled province model
+# =========================
+
+def test_province_model_is_immutable():
+
+    from financial_simulator.data.province_model import get_province
+
+    province = get_province("Ontario")
+
+    with pytest.raises(AttributeError):
+        province.combined_rate = 0.0
+
+    with pytest.raises(ValueError):
+        province.expense_rates[0] = 1.0
+
+    with pytest.raises(ValueError):
+        get_province("atlantis")
+
+
+def test_province_fingerprint_is_stable():
+
+    from financial_simulator.data.province_model import compile_provinces, PROVINCES
+
+    recompiled = compile_provinces(PROVINCES_DATA, PAYROLL_DATA)
+
+    assert {k: p.fingerprint for k, p in recompiled.items()} == {k: p.fingerprint for k, p in PROVINCES.items()}
+    assert len({p.fingerprint for p in PROVINCES.values()}) == len(PROVINCES)
+
+
+@pytest.mark.parametrize("province", ["quebec", "ontario", "alberta"])
+def test_engines_from_province_match_raw_data(province):
+
+    from financial_simulator.data.province_model import get_province
+
+    compiled = get_province(province)
+
+    engine = IncomeTaxEngine.from_province(compiled)
+    reference = IncomeTaxEngine(PROVINCES_DATA[province], get_payroll_config(province))
+
+    for income in [0.0, 2500.0, 7300.55]:
+        assert engine.calculate_net_income(income) == reference.calculate_net_income(income)
+
+    expense_engine = ExpenseTaxEngine.from_province(compiled)
+    for budget in BUDGETS:
+        assert expense_engine.calculate_sales_tax(budget) == pytest.approx(
+            ExpenseTaxEngine(PROVINCES_DATA[province]).calculate_sales_tax(budget)
+        )
+
+
+# =========================
+# Tax year store
+# =========================
+
+def test_second_tax_year_loads_side_by_side(tmp_path, monkeypatch, simulation_request):
+
+    from financial_simulator.core.inputs import build_inputs
+    from financial_simulator.core.projection import build_cashflows
+    from financial_simulator.data import tax_store
+    from financial_simulator.data.province_model import build_snapshots, get_province, read_snapshot
+
+    document = json.loads((tax_store.TAX_YEARS_DIR / "2026.json").read_text())
+    (tmp_path / "2026.json").write_text(json.dumps(document))
+
+    document["tax_year"] = 2027
+    for data in document["provinces"].values():
+        data["metadata"]["tax_year"] = 2027
+    document["provinces"]["ontario"]["income_tax"]["provincial"]["brackets"][0]["rate"] = 0.0
+    (tmp_path / "2027.json").write_text(json.dumps(document))
+
+    monkeypatch.setattr(tax_store, "TAX_YEARS_DIR", tmp_path)
+
+    assert tax_store.available_tax_years() == (2026, 2027)
+
+    ontario_2027 = get_province("ontario", 2027)
+
+    assert ontario_2027.tax_year == 2027
+    assert get_province("ontario").tax_year == 2026
+    assert ontario_2027.fingerprint != get_province("ontario").fingerprint
+
+    # loading never writes; the build step does, readable by everyone
+    assert not tax_store.snapshot_path(2027).exists()
+    assert build_snapshots([2027]) == [tax_store.snapshot_path(2027)]
+    assert tax_store.snapshot_path(2027).stat().st_mode & 0o777 == 0o644
+
+    # the snapshot restores the same compiled tables
+    provinces_data, payroll_data = tax_store.load_tax_year(2027)
+    restored = read_snapshot(tax_store.snapshot_path(2027), tax_store.source_hash(2027), provinces_data, payroll_data)
+
+    assert restored["ontario"].provincial.bases == ontario_2027.provincial.bases
+    assert restored["ontario"].fingerprint == ontario_2027.fingerprint
+    assert list(restored["quebec"].payroll.schedules) == ["qpp", "ei", "qpip"]
+    assert read_snapshot(tax_store.snapshot_path(2027), "stale", provinces_data, payroll_data) is None
+
+    profile = dict(
+        expenses=None, monthly_expenses=3000, months=12, savings_goal=20000, one_time_cost=0, province="ontario"
+    )
+
+    current = build_inputs(simulation_request(**profile))
+    future = build_inputs(simulation_request(**profile, tax_year=2027))
+
+    assert future.context.tax_year == 2027
+    assert build_cashflows(future)["net_income"] > build_cashflows(current)["net_income"]
+
+    with pytest.raises(ValueError):
+        get_province("ontario", 1999)
+
+
+def test_province_metadata_must_match_the_loaded_year(tmp_path, monkeypatch):
+
+    from financial_simulator.data import tax_store
+    from financial_simulator.data.province_model import get_province, validate_province
+
+    document = json.loads((tax_store.TAX_YEARS_DIR / "2026.json").read_text())
+    document["tax_year"] = 2028
+    for data in document["provinces"].values():
+        data["metadata"]["tax_year"] = 2028
+    document["provinces"]["quebec"]["metadata"]["tax_year"] = 2026
+    (tmp_path / "2028.json").write_text(json.dumps(document))
+
+    monkeypatch.setattr(tax_store, "TAX_YEARS_DIR", tmp_path)
+
+    with pytest.raises(ValueError, match="quebec"):
+        get_province("ontario", 2028)
+
+    ontario = document["provinces"]["ontario"]
+    validate_province("ontario", ontario, document["payroll"], 2028)
+
+    with pytest.raises(ValueError):
+        validate_province("ontario", ontario, document["payroll"], 2026)